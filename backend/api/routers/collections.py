@@ -1,27 +1,58 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter
+from pydantic_core import to_json
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy import func
+from sqlalchemy import cast, String, tuple_
+from sqlalchemy.exc import IntegrityError
 from typing import List, Optional
 from datetime import datetime
 
 from core.database import get_session
 from core.models import Collection, Video, VideoCategory
+from core.constants import SEARCH_DEFAULT_LIMIT, SEARCH_MAX_LIMIT, SEARCH_MAX_QUERY_LENGTH
+from core.pagination import encode_cursor, decode_cursor
+from core.http_cache import (
+    make_etag,
+    is_not_modified,
+    not_modified_response,
+    json_response,
+    conditional_json_response
+)
+from core.response_cache import response_cache, collection_namespace, LIST_NAMESPACE
 from services.collection_service import collection_service
+from services.search_service import search_service
+from services.search_index import search_index
+from services.export_service import export_service, EXPORT_MEDIA_TYPES
+from services.ingest_service import ingest_service
 from services.video_service import video_service
 from schemas.collection_schemas import (
     CollectionCreate,
     CollectionUpdate,
     CollectionResponse,
-    VideoImportRequest
+    VideoImportRequest,
+    ReclassifyResponse,
+    BulkIngestResponse
 )
 from schemas.video_schemas import VideoCreate, VideoResponse
+from schemas.search_schemas import SearchResponse
+from schemas.pagination_schemas import (
+    PaginatedVideosResponse,
+    parse_video_fields,
+    get_paginated_videos_model
+)
+from schemas.job_schemas import ImportJobResponse
+from services.job_service import import_job_runner
+from api.routers.jobs import to_job_response
 
 router = APIRouter(
     prefix="/collections",
     tags=["collections"]
 )
 
+collection_list_adapter = TypeAdapter(List[CollectionResponse])
+
 @router.post("/", response_model=CollectionResponse, status_code=status.HTTP_201_CREATED)
 async def create_collection(
     collection: CollectionCreate,
@@ -41,39 +72,101 @@ async def create_collection(
     return await collection_service.create_collection(session, collection_data)
 
 @router.get("/", response_model=List[CollectionResponse])
-async def list_collections(session: AsyncSession = Depends(get_session)):
+async def list_collections(
+    request: Request,
+    session: AsyncSession = Depends(get_session)
+):
     """
     List all collections with video counts
     
+    Video counts come from the denormalized counters on each collection,
+    so this reads only the collections table. Served from the response cache
+    when possible; answers If-None-Match with 304 before loading any collection.
+    
     Args:
+        request: Incoming request (for If-None-Match)
         session: Database session
         
     Returns:
         List of collections with video counts
     """
-    # Get collections with video counts
-    result = await session.execute(
-        select(
-            Collection,
-            func.count(Video.id).label('video_count')
-        )
-        .outerjoin(Video, Collection.id == Video.collection_id)
-        .group_by(Collection.id)
+    lookup = await response_cache.get(LIST_NAMESPACE, "list")
+    if lookup.entry:
+        return conditional_json_response(request, lookup.entry.body, lookup.entry.etag)
+    
+    etag = make_etag("collections", *await collection_service.get_collections_version(session))
+    if is_not_modified(request, etag):
+        return not_modified_response(etag)
+    collections = await collection_service.list_collections(session)
+    body = collection_list_adapter.dump_json(
+        collection_list_adapter.validate_python(collections, from_attributes=True)
     )
+    await response_cache.set(lookup, etag, body)
+    return json_response(body, etag)
+
+def _export_response(
+    export_format: str,
+    fields: Optional[str],
+    filename: str,
+    collection_id: Optional[int] = None
+) -> StreamingResponse:
+    """
+    Build a streaming export response
+    
+    Raises:
+        HTTPException: If fields are invalid
+    """
+    try:
+        selected_fields = parse_video_fields(fields)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return StreamingResponse(
+        export_service.stream_videos(selected_fields, export_format, collection_id),
+        media_type=EXPORT_MEDIA_TYPES[export_format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}.{export_format}"'}
+    )
+
+@router.get("/export")
+async def export_all_collections(
+    export_format: str = Query("ndjson", alias="format", pattern="^(ndjson|csv|json)$"),
+    fields: Optional[str] = Query(None, description="Comma-separated video fields and/or presets")
+):
+    """
+    Stream every video of every collection (backup dump)
     
-    collections = []
-    for row in result:
-        collection_dict = {
-            **row[0].__dict__,
-            'video_count': row[1]
-        }
-        collections.append(collection_dict)
+    Args:
+        export_format: ndjson, csv or json
+        fields: Video fields to export (all fields if omitted)
+        
+    Returns:
+        Streaming download ordered by collection and video ID
+        
+    Raises:
+        HTTPException: If fields are invalid
+    """
+    return _export_response(export_format, fields, "cura-videos")
+
+@router.post("/reclassify", response_model=ReclassifyResponse)
+async def reclassify_all_collections(
+    dry_run: bool = Query(False, description="Only report the changes"),
+    session: AsyncSession = Depends(get_session)
+):
+    """
+    Re-run category classification for videos in every collection
     
-    return collections
+    Args:
+        dry_run: Only report the changes without writing them
+        session: Database session
+        
+    Returns:
+        Scanned/changed counts and the changes per collection and category
+    """
+    return await collection_service.reclassify_videos(session, dry_run=dry_run)
 
 @router.get("/{collection_id}", response_model=CollectionResponse)
 async def get_collection(
     collection_id: int, 
+    request: Request,
     session: AsyncSession = Depends(get_session)
 ):
     """
@@ -81,6 +174,7 @@ async def get_collection(
     
     Args:
         collection_id: Collection ID
+        request: Incoming request (for If-None-Match)
         session: Database session
         
     Returns:
@@ -89,80 +183,213 @@ async def get_collection(
     Raises:
         HTTPException: If collection not found
     """
-    # Get collection with video count
-    result = await session.execute(
-        select(
-            Collection,
-            func.count(Video.id).label('video_count')
-        )
-        .outerjoin(Video, Collection.id == Video.collection_id)
-        .where(Collection.id == collection_id)
-        .group_by(Collection.id)
-    )
+    lookup = await response_cache.get(collection_namespace(collection_id), "detail")
+    if lookup.entry:
+        return conditional_json_response(request, lookup.entry.body, lookup.entry.etag)
     
-    row = result.first()
-    if not row:
+    revision = await collection_service.get_revision(session, collection_id)
+    if revision is None:
         raise HTTPException(status_code=404, detail="Collection not found")
+    etag = make_etag("collection", collection_id, revision)
+    if is_not_modified(request, etag):
+        return not_modified_response(etag)
     
-    collection_dict = {
-        **row[0].__dict__,
-        'video_count': row[1]
-    }
-    
-    return collection_dict
+    collection = await collection_service.get_collection(session, collection_id)
+    if not collection:
+        raise HTTPException(status_code=404, detail="Collection not found")
+    body = CollectionResponse.model_validate(collection).model_dump_json().encode()
+    await response_cache.set(lookup, etag, body)
+    return json_response(body, etag)
 
-@router.get("/{collection_id}/videos")
+@router.get("/{collection_id}/videos", response_model=PaginatedVideosResponse)
 async def get_collection_videos(
     collection_id: int,
+    request: Request,
     skip: int = 0,
     limit: int = 20,
     category: Optional[str] = None,
+    cursor: Optional[str] = None,
+    include_total: bool = True,
+    fields: Optional[str] = Query(
+        None,
+        description="Comma-separated video fields and/or presets ('card' for grid views)"
+    ),
     session: AsyncSession = Depends(get_session)
 ):
     """
     Get videos in a collection with pagination and optional category filter
     
+    Pass `cursor` (the `next_cursor` of the previous page) for keyset pagination:
+    every page then costs the same index range scan regardless of depth.
+    `skip` is still supported for page-number navigation. Pages are served from
+    the response cache until the collection changes. `fields` narrows the SQL
+    SELECT list, so unrequested columns (e.g. description) are never read.
+    
     Args:
         collection_id: Collection ID
-        skip: Number of videos to skip
+        request: Incoming request (for If-None-Match)
+        skip: Number of videos to skip (ignored when cursor is given)
         limit: Maximum number of videos to return
         category: Optional category filter (e.g., 'MV', 'FANCAM', 'ALL')
+        cursor: Opaque cursor from a previous page's next_cursor
+        include_total: Whether to include the total count (read from collection counters)
+        fields: Video fields to return (all fields if omitted; id and published_at always)
         session: Database session
         
     Returns:
-        Paginated video list with total count
+        Paginated video list with total count and next cursor
+        (304 if the client's ETag matches the collection revision)
+        
+    Raises:
+        HTTPException: If the cursor or fields are invalid
     """
-    # Build base query
-    base_query = select(Video).where(Video.collection_id == collection_id)
-    count_query = select(func.count(Video.id)).where(Video.collection_id == collection_id)
+    try:
+        selected_fields = parse_video_fields(fields)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    fields_key = ",".join(selected_fields)
+    
+    lookup = await response_cache.get(
+        collection_namespace(collection_id),
+        f"videos:{skip}:{limit}:{category}:{cursor}:{include_total}:{fields_key}"
+    )
+    if lookup.entry:
+        return conditional_json_response(request, lookup.entry.body, lookup.entry.etag)
+    
+    # Build base query (plain column tuples, no ORM objects)
+    base_query = (
+        select(*(getattr(Video, field) for field in selected_fields))
+        .where(Video.collection_id == collection_id)
+    )
     
     # Apply category filter if provided and not 'ALL'
     if category and category != 'ALL':
         # Use cast to compare enum field with string value
-        from sqlalchemy import cast, String
         base_query = base_query.where(cast(Video.category, String) == category)
-        count_query = count_query.where(cast(Video.category, String) == category)
     
-    # Get total count with filter
-    total_result = await session.execute(count_query)
-    total = total_result.scalar() or 0
+    # Revision and counters in one lookup; answer 304 before loading any video
+    counters = (await session.execute(
+        select(Collection.revision, Collection.video_count, Collection.category_counts)
+        .where(Collection.id == collection_id)
+    )).first()
+    revision = counters[0] if counters else None
+    etag = make_etag("videos", collection_id, revision, skip, limit, category, cursor, include_total, fields_key)
+    if is_not_modified(request, etag):
+        return not_modified_response(etag)
     
-    # Get paginated videos with filter
+    # Get total count with filter from the collection's counters
+    total = None
+    if include_total:
+        if counters:
+            _, video_count, category_counts = counters
+            if category and category != 'ALL':
+                total = (category_counts or {}).get(category, 0)
+            else:
+                total = video_count
+        else:
+            total = 0
+    
+    # Keyset position from cursor, otherwise offset
+    if cursor:
+        try:
+            cursor_published_at, cursor_id = decode_cursor(cursor)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+        base_query = base_query.where(
+            tuple_(Video.published_at, Video.id) < tuple_(cursor_published_at, cursor_id)
+        )
+        skip = 0
+    
+    # Get paginated videos with filter (one extra row tells us if there is a next page)
     result = await session.execute(
         base_query
-        .order_by(Video.published_at.desc())
+        .order_by(Video.published_at.desc(), Video.id.desc())
         .offset(skip)
-        .limit(limit)
+        .limit(limit + 1)
     )
-    videos = result.scalars().all()
+    rows = result.all()
+    has_more = len(rows) > limit
+    rows = rows[:limit]
     
-    return {
-        "videos": videos,
+    next_cursor = None
+    if has_more and rows:
+        last = rows[-1]._mapping
+        next_cursor = encode_cursor(last["published_at"], last["id"])
+    
+    # Validate into the typed response and serialize straight to JSON bytes (pydantic-core)
+    page = get_paginated_videos_model(selected_fields).model_validate({
+        "videos": [dict(zip(selected_fields, row)) for row in rows],
         "total": total,
         "skip": skip,
         "limit": limit,
-        "has_more": (skip + len(videos)) < total
-    }
+        "has_more": has_more,
+        "next_cursor": next_cursor
+    })
+    body = to_json(page)
+    await response_cache.set(lookup, etag, body)
+    return json_response(body, etag)
+
+@router.get("/{collection_id}/export")
+async def export_collection(
+    collection_id: int,
+    export_format: str = Query("ndjson", alias="format", pattern="^(ndjson|csv|json)$"),
+    fields: Optional[str] = Query(None, description="Comma-separated video fields and/or presets"),
+    session: AsyncSession = Depends(get_session)
+):
+    """
+    Stream every video of a collection
+    
+    Rows are read through a server-side cursor and written as they arrive,
+    so memory use does not grow with the collection size.
+    
+    Args:
+        collection_id: Collection ID
+        export_format: ndjson, csv or json
+        fields: Video fields to export (all fields if omitted)
+        session: Database session
+        
+    Returns:
+        Streaming download ordered by video ID
+        
+    Raises:
+        HTTPException: If collection not found or fields are invalid
+    """
+    if await collection_service.get_revision(session, collection_id) is None:
+        raise HTTPException(status_code=404, detail="Collection not found")
+    return _export_response(export_format, fields, f"collection-{collection_id}-videos", collection_id)
+
+@router.get("/{collection_id}/search", response_model=SearchResponse)
+async def search_collection_videos(
+    collection_id: int,
+    q: str = Query(..., min_length=1, max_length=SEARCH_MAX_QUERY_LENGTH, description="Search query"),
+    limit: int = Query(SEARCH_DEFAULT_LIMIT, ge=1, le=SEARCH_MAX_LIMIT),
+    category: Optional[str] = None,
+    cursor: Optional[str] = None,
+    session: AsyncSession = Depends(get_session)
+):
+    """
+    Search videos in a collection
+    
+    Args:
+        collection_id: Collection ID
+        q: Search query (matches title, description and comment)
+        limit: Maximum number of results to return
+        category: Optional category filter (e.g., 'MV', 'FANCAM', 'ALL')
+        cursor: Opaque cursor from a previous page's next_cursor
+        session: Database session
+        
+    Returns:
+        Videos ordered by relevance with the next cursor
+        
+    Raises:
+        HTTPException: If the cursor is invalid
+    """
+    try:
+        return await search_service.search(
+            session, q, limit, collection_id=collection_id, category=category, cursor=cursor
+        )
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
 
 @router.delete("/{collection_id}/videos", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_all_collection_videos(
@@ -202,7 +429,7 @@ async def add_video_to_collection(
         Created video
         
     Raises:
-        HTTPException: If collection not found
+        HTTPException: If collection not found or the video is already in it
     """
     # Verify collection exists
     collection = await collection_service.get_collection(session, collection_id)
@@ -222,15 +449,56 @@ async def add_video_to_collection(
     # Ensure category is set
     if not video_data.get('category'):
         video_data['category'] = VideoCategory.ETC
+    video_data['category_manual'] = 'category' in video.model_fields_set
     
     # Create video
     video_data['collection_id'] = collection_id
     db_video = Video(**video_data)
     session.add(db_video)
-    await session.commit()
+    try:
+        await collection_service.adjust_video_counts(session, collection_id, {db_video.category: 1})
+        await session.commit()
+    except IntegrityError:
+        # uq_videos_collection_youtube_video (bulk ingest reports these rows as skipped)
+        await session.rollback()
+        raise HTTPException(status_code=409, detail="Video is already in this collection")
     await session.refresh(db_video)
+    search_index.add(db_video)
+    await response_cache.invalidate_collection(collection_id)
     return db_video
 
+@router.post("/{collection_id}/videos/bulk", response_model=BulkIngestResponse)
+async def bulk_ingest_videos(
+    collection_id: int,
+    request: Request,
+    ingest_format: Optional[str] = Query(None, alias="format", pattern="^(ndjson|csv)$"),
+    session: AsyncSession = Depends(get_session)
+):
+    """
+    Bulk-load videos from an NDJSON or CSV request body (no YouTube API calls)
+    
+    Each row has the VideoCreate fields. The body is parsed as it streams in and
+    written in batches, so arbitrarily large files use constant memory. Rows already
+    in the collection are skipped; invalid rows are reported and do not stop the load.
+    
+    Args:
+        collection_id: Collection ID
+        request: Incoming request (body is streamed)
+        ingest_format: ndjson or csv (defaults from the Content-Type header)
+        session: Database session
+        
+    Returns:
+        Ingest report with counts, throughput and per-row errors
+        
+    Raises:
+        HTTPException: If collection not found
+    """
+    if await collection_service.get_revision(session, collection_id) is None:
+        raise HTTPException(status_code=404, detail="Collection not found")
+    if ingest_format is None:
+        ingest_format = "csv" if "csv" in request.headers.get("content-type", "") else "ndjson"
+    return await ingest_service.ingest(session, collection_id, request.stream(), ingest_format)
+
 @router.put("/{collection_id}", response_model=CollectionResponse)
 async def update_collection(
     collection_id: int,
@@ -331,39 +599,69 @@ async def get_collection_channel_info(
     
     return info
 
-@router.post("/{collection_id}/import", status_code=status.HTTP_201_CREATED)
+@router.post("/{collection_id}/import", response_model=ImportJobResponse, status_code=status.HTTP_202_ACCEPTED)
 async def import_videos_from_channel(
     collection_id: int,
     payload: VideoImportRequest = VideoImportRequest(),
     session: AsyncSession = Depends(get_session)
 ):
     """
-    Import videos from a YouTube channel
+    Start a background import of videos from a YouTube channel
+    
+    Poll GET /jobs/{job_id} for progress.
     
     Args:
         collection_id: Collection ID
-        payload: Import configuration (limit)
+        payload: Import configuration (limit, incremental mode)
         session: Database session
         
     Returns:
-        Import results
+        Queued import job
         
     Raises:
-        HTTPException: If errors occur during import
+        HTTPException: If collection not found or no channel URL is available
     """
-    try:
-        result = await collection_service.import_videos_from_channel(
-            session,
-            collection_id,
-            limit=payload.limit,
-            custom_channel_url=payload.custom_channel_url,
-            default_category=payload.default_category
+    collection = await collection_service.get_collection(session, collection_id)
+    if not collection:
+        raise HTTPException(status_code=404, detail="Collection not found")
+    if not (payload.custom_channel_url or collection.official_link):
+        raise HTTPException(
+            status_code=400,
+            detail="No channel URL provided and no official link set for this collection"
         )
-        return result
-    except ValueError as e:
-        # Convert ValueError to appropriate HTTP error
-        if "not found" in str(e).lower():
-            status_code = 404
-        else:
-            status_code = 400
-        raise HTTPException(status_code=status_code, detail=str(e))
+    
+    job = import_job_runner.submit(
+        collection_id,
+        limit=payload.limit,
+        custom_channel_url=payload.custom_channel_url,
+        default_category=payload.default_category,
+        incremental=payload.incremental
+    )
+    return to_job_response(job)
+
+@router.post("/{collection_id}/reclassify", response_model=ReclassifyResponse)
+async def reclassify_collection(
+    collection_id: int,
+    dry_run: bool = Query(False, description="Only report the changes"),
+    session: AsyncSession = Depends(get_session)
+):
+    """
+    Re-run category classification for a collection's videos
+    
+    Videos whose category was set by hand are skipped.
+    
+    Args:
+        collection_id: Collection ID
+        dry_run: Only report the changes without writing them
+        session: Database session
+        
+    Returns:
+        Scanned/changed counts and the changes per category
+        
+    Raises:
+        HTTPException: If collection not found
+    """
+    collection = await collection_service.get_collection(session, collection_id)
+    if not collection:
+        raise HTTPException(status_code=404, detail="Collection not found")
+    return await collection_service.reclassify_videos(session, collection_id, dry_run=dry_run)
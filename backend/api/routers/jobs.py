@@ -0,0 +1,89 @@
+from datetime import datetime
+from fastapi import APIRouter, HTTPException
+from typing import List
+
+from services.job_service import import_job_runner, ImportJob, JobStatus, FINISHED_STATUSES
+from schemas.job_schemas import ImportJobResponse
+
+router = APIRouter(
+    prefix="/jobs",
+    tags=["jobs"]
+)
+
+
+def to_job_response(job: ImportJob) -> ImportJobResponse:
+    """
+    Build a job response with throughput and ETA
+    
+    Args:
+        job: Import job state
+        
+    Returns:
+        ImportJobResponse
+    """
+    response = ImportJobResponse.model_validate(job)
+    if job.started_at:
+        elapsed = ((job.finished_at or datetime.utcnow()) - job.started_at).total_seconds()
+        if elapsed > 0 and job.fetched_count:
+            response.throughput_per_sec = round(job.fetched_count / elapsed, 2)
+    if (
+        job.status == JobStatus.RUNNING
+        and response.throughput_per_sec
+        and job.expected_count is not None
+    ):
+        remaining = max(job.expected_count - job.fetched_count, 0)
+        response.eta_seconds = round(remaining / response.throughput_per_sec, 1)
+    elif job.status in FINISHED_STATUSES:
+        response.eta_seconds = 0
+    return response
+
+
+@router.get("/", response_model=List[ImportJobResponse])
+async def list_jobs():
+    """
+    List background import jobs (newest first)
+    
+    Returns:
+        List of import jobs
+    """
+    return [to_job_response(job) for job in import_job_runner.list()]
+
+
+@router.get("/{job_id}", response_model=ImportJobResponse)
+async def get_job(job_id: str):
+    """
+    Get the progress of a background import job
+    
+    Args:
+        job_id: Job ID
+        
+    Returns:
+        Job status with fetched/inserted/skipped counts, throughput and ETA
+        
+    Raises:
+        HTTPException: If job not found
+    """
+    job = import_job_runner.get(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return to_job_response(job)
+
+
+@router.post("/{job_id}/cancel", response_model=ImportJobResponse)
+async def cancel_job(job_id: str):
+    """
+    Cancel a queued or running import job (already committed videos are kept)
+    
+    Args:
+        job_id: Job ID
+        
+    Returns:
+        Job status
+        
+    Raises:
+        HTTPException: If job not found
+    """
+    job = import_job_runner.cancel(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return to_job_response(job)
@@ -0,0 +1,54 @@
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Optional
+
+from core.database import get_session
+from core.constants import SEARCH_DEFAULT_LIMIT, SEARCH_MAX_LIMIT, SEARCH_MAX_QUERY_LENGTH
+from services.search_service import search_service
+from services.search_index import search_index
+from schemas.search_schemas import SearchResponse
+
+router = APIRouter(
+    prefix="/search",
+    tags=["search"]
+)
+
+@router.get("/index/stats")
+async def get_search_index_stats():
+    """
+    Get in-memory search index statistics
+    
+    Returns:
+        Document/token counts, estimated memory size and build time
+        (enabled is false unless SEARCH_BACKEND is "memory")
+    """
+    return search_index.get_stats()
+
+@router.get("/", response_model=SearchResponse)
+async def search_videos(
+    q: str = Query(..., min_length=1, max_length=SEARCH_MAX_QUERY_LENGTH, description="Search query"),
+    limit: int = Query(SEARCH_DEFAULT_LIMIT, ge=1, le=SEARCH_MAX_LIMIT),
+    category: Optional[str] = None,
+    cursor: Optional[str] = None,
+    session: AsyncSession = Depends(get_session)
+):
+    """
+    Search videos across all collections
+    
+    Args:
+        q: Search query (matches title, description and comment)
+        limit: Maximum number of results to return
+        category: Optional category filter (e.g., 'MV', 'FANCAM', 'ALL')
+        cursor: Opaque cursor from a previous page's next_cursor
+        session: Database session
+        
+    Returns:
+        Videos ordered by relevance with the next cursor
+        
+    Raises:
+        HTTPException: If the cursor is invalid
+    """
+    try:
+        return await search_service.search(session, q, limit, category=category, cursor=cursor)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
@@ -0,0 +1,53 @@
+from fastapi import APIRouter, HTTPException, Path
+from fastapi.responses import FileResponse
+
+from core.constants import THUMB_PROXY_SIZES, THUMB_CACHE_CONTROL_SECONDS
+from services.thumbnail_service import thumbnail_service
+
+router = APIRouter(
+    prefix="/thumbs",
+    tags=["Thumbnails"]
+)
+
+@router.get("/stats")
+async def get_thumbnail_cache_stats():
+    """
+    Get thumbnail cache statistics
+
+    Returns:
+        File count, size on disk and hit/miss/eviction counters
+    """
+    return thumbnail_service.get_stats()
+
+@router.get("/{youtube_video_id}/{size}")
+async def get_thumbnail(
+    youtube_video_id: str = Path(..., pattern=r"^[A-Za-z0-9_-]{11}$"),
+    size: str = Path(..., description=f"One of: {', '.join(THUMB_PROXY_SIZES)}")
+):
+    """
+    Get a YouTube video's thumbnail, cropped to 16:9 and downscaled for cards
+
+    Fetched from YouTube once per video and size, then served from the on-disk
+    cache with long-lived immutable cache headers.
+
+    Args:
+        youtube_video_id: YouTube video ID
+        size: Thumbnail size name (see THUMB_PROXY_SIZES)
+
+    Returns:
+        The image file
+
+    Raises:
+        HTTPException: If the size is unknown or YouTube has no thumbnail for the video
+    """
+    if size not in THUMB_PROXY_SIZES:
+        raise HTTPException(status_code=404, detail=f"Unknown thumbnail size '{size}'")
+
+    path = await thumbnail_service.get_thumbnail(youtube_video_id, size)
+    if path is None:
+        raise HTTPException(status_code=404, detail="Thumbnail not found")
+    return FileResponse(
+        path,
+        media_type=thumbnail_service.media_type,
+        headers={"Cache-Control": f"public, max-age={THUMB_CACHE_CONTROL_SECONDS}, immutable"}
+    )
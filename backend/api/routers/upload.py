@@ -1,67 +1,216 @@
-from fastapi import APIRouter, UploadFile, File, HTTPException, Depends
-from supabase import Client
-import uuid
-import os
+from fastapi import APIRouter, HTTPException, Depends, Header, Request, Response, status
+from fastapi.responses import JSONResponse
+import httpx
+from starlette.requests import ClientDisconnect
+from supabase import AsyncClient
 
+from core.config import settings
 from core.dependencies import get_supabase_client
-from core.constants import SUPABASE_BUCKET_NAME
-from schemas.upload_schemas import UploadResponse
+from services.image_service import image_service
+from services.upload_service import upload_service, UploadReceiver, UploadRejected
+from schemas.upload_schemas import UploadResponse, UploadSessionResponse
 
 router = APIRouter(
     prefix="/upload",
     tags=["Upload"]
 )
 
-@router.post("/", response_model=UploadResponse)
+TUS_VERSION = "1.0.0"
+MULTIPART_OVERHEAD_BYTES = 64 * 1024  # Boundaries and part headers around the file
+
+# The body is parsed by hand (streamed), so describe it for the OpenAPI docs
+MULTIPART_FILE_BODY = {
+    "requestBody": {
+        "required": True,
+        "content": {
+            "multipart/form-data": {
+                "schema": {
+                    "type": "object",
+                    "properties": {"file": {"type": "string", "format": "binary"}},
+                    "required": ["file"]
+                }
+            }
+        }
+    }
+}
+
+
+async def _store_received_image(supabase: AsyncClient, receiver: UploadReceiver) -> UploadResponse:
+    """Resize and store a fully received upload, then delete its temp file"""
+    try:
+        result = await image_service.store_image(supabase, receiver.path, receiver.digest)
+        print(f"Upload successful. URL: {result['url']} (deduplicated: {result['deduplicated']})")
+        return UploadResponse(**result)
+    except ValueError as e:
+        print(f"Error: {e}")
+        raise HTTPException(status_code=400, detail=str(e))
+    except httpx.TimeoutException as e:
+        print(f"Upload timed out: {e}")
+        raise HTTPException(status_code=504, detail="Storage upload timed out")
+    except Exception as e:
+        print(f"Upload error: {e}")
+        raise HTTPException(
+            status_code=500,
+            detail=f"Could not upload file: {str(e)}"
+        )
+    finally:
+        receiver.discard()
+
+@router.post("/", response_model=UploadResponse, openapi_extra=MULTIPART_FILE_BODY)
 async def upload_image(
-    file: UploadFile = File(...),
-    supabase: Client = Depends(get_supabase_client)
+    request: Request,
+    supabase: AsyncClient = Depends(get_supabase_client)
 ):
     """
-    Upload an image to Supabase Storage
-    
+    Upload an image to Supabase Storage as resized variants
+
+    The multipart body is streamed to a temp file chunk by chunk; the type is
+    checked from the file's magic bytes on the first chunk and UPLOAD_MAX_BYTES
+    is enforced while streaming. The image is then stored as thumb/card/cover
+    variants named by content hash; re-uploading the same image reuses them.
+
     Args:
-        file: Image file to upload
+        request: Incoming request with a multipart "file" field (streamed)
         supabase: Supabase client (injected)
-        
+
     Returns:
-        UploadResponse with public URL
-        
+        UploadResponse with the largest variant's URL, every variant and a srcset
+
     Raises:
-        HTTPException: If file is not an image or upload fails
+        HTTPException: If the file is too large, not an allowed image, or upload fails
     """
-    print(f"Received upload request: {file.filename}")
-    
-    # Validate file type
-    if not file.content_type.startswith("image/"):
-        print("Error: File is not an image")
-        raise HTTPException(status_code=400, detail="File must be an image")
-    
-    # Generate unique filename
-    file_extension = os.path.splitext(file.filename)[1]
-    unique_filename = f"{uuid.uuid4()}{file_extension}"
-    print(f"Generated filename: {unique_filename}")
-    
+    content_length = request.headers.get("content-length")
+    if content_length and content_length.isdigit() and int(content_length) > settings.UPLOAD_MAX_BYTES + MULTIPART_OVERHEAD_BYTES:
+        raise HTTPException(status_code=413, detail=f"File is larger than {settings.UPLOAD_MAX_BYTES // (1024 * 1024)} MB")
+
     try:
-        # Read file content
-        file_content = await file.read()
-        
-        # Upload to Supabase Storage
-        response = supabase.storage.from_(SUPABASE_BUCKET_NAME).upload(
-            path=unique_filename,
-            file=file_content,
-            file_options={"content-type": file.content_type}
+        receiver = await upload_service.receive_multipart_file(
+            request.headers.get("content-type", ""), request.stream()
         )
-        
-        # Get Public URL
-        public_url = supabase.storage.from_(SUPABASE_BUCKET_NAME).get_public_url(unique_filename)
+    except UploadRejected as e:
+        print(f"Upload rejected: {e.detail}")
+        raise HTTPException(status_code=e.status_code, detail=e.detail)
 
-        print(f"Upload successful. URL: {public_url}")
-        return UploadResponse(url=public_url)
+    print(f"Received upload: {receiver.size} bytes ({receiver.content_type})")
+    return await _store_received_image(supabase, receiver)
 
-    except Exception as e:
-        print(f"Upload error: {e}")
-        raise HTTPException(
-            status_code=500, 
-            detail=f"Could not upload file: {str(e)}"
-        )
+@router.post("/sessions", response_model=UploadSessionResponse, status_code=status.HTTP_201_CREATED)
+async def create_upload_session(
+    request: Request,
+    response: Response,
+    upload_length: int = Header(..., alias="Upload-Length")
+):
+    """
+    Start a resumable (TUS-style) upload for large files
+
+    Send the file with PATCH requests to the returned Location, each carrying
+    the current Upload-Offset; after an interruption, HEAD the Location to get
+    the offset to resume from.
+
+    Args:
+        request: Incoming request
+        response: Response (Location and TUS headers are set)
+        upload_length: Total file size in bytes
+
+    Returns:
+        Session ID, offset and length
+
+    Raises:
+        HTTPException: If the length is invalid or over the size cap
+    """
+    try:
+        session = upload_service.create_session(upload_length)
+    except UploadRejected as e:
+        raise HTTPException(status_code=e.status_code, detail=e.detail)
+
+    response.headers["Location"] = str(request.url_for("append_upload_session", session_id=session.id))
+    response.headers["Tus-Resumable"] = TUS_VERSION
+    response.headers["Upload-Offset"] = "0"
+    return UploadSessionResponse(id=session.id, upload_offset=0, upload_length=session.length)
+
+@router.head("/sessions/{session_id}")
+async def get_upload_session_offset(session_id: str):
+    """
+    Report how many bytes of a resumable upload were received
+
+    Args:
+        session_id: Upload session ID
+
+    Returns:
+        Empty response with Upload-Offset and Upload-Length headers
+
+    Raises:
+        HTTPException: If the session does not exist or expired
+    """
+    session = upload_service.get_session(session_id)
+    if not session:
+        raise HTTPException(status_code=404, detail="Upload session not found")
+    return Response(headers={
+        "Upload-Offset": str(session.offset),
+        "Upload-Length": str(session.length),
+        "Tus-Resumable": TUS_VERSION,
+        "Cache-Control": "no-store"
+    })
+
+@router.patch("/sessions/{session_id}", response_model=UploadResponse)
+async def append_upload_session(
+    session_id: str,
+    request: Request,
+    upload_offset: int = Header(..., alias="Upload-Offset"),
+    supabase: AsyncClient = Depends(get_supabase_client)
+):
+    """
+    Append a chunk to a resumable upload (body: application/offset+octet-stream)
+
+    Args:
+        session_id: Upload session ID
+        request: Incoming request (body is streamed)
+        upload_offset: Offset of this chunk; must equal the bytes received so far
+        supabase: Supabase client (injected)
+
+    Returns:
+        204 with the new Upload-Offset, or the UploadResponse once the last byte arrives
+
+    Raises:
+        HTTPException: If the session is unknown, the offset does not match,
+            or the file is too large or not an allowed image
+    """
+    if request.headers.get("content-type") != "application/offset+octet-stream":
+        raise HTTPException(status_code=415, detail="Content-Type must be application/offset+octet-stream")
+    session = upload_service.get_session(session_id)
+    if not session:
+        raise HTTPException(status_code=404, detail="Upload session not found")
+
+    try:
+        complete = await upload_service.append_chunk(session, upload_offset, request.stream())
+    except UploadRejected as e:
+        raise HTTPException(status_code=e.status_code, detail=e.detail)
+    except ClientDisconnect:
+        # Received bytes are kept; the client resumes from the offset reported by HEAD
+        return Response(status_code=status.HTTP_204_NO_CONTENT)
+
+    headers = {"Upload-Offset": str(session.offset), "Tus-Resumable": TUS_VERSION}
+    if not complete:
+        return Response(status_code=status.HTTP_204_NO_CONTENT, headers=headers)
+
+    print(f"Resumable upload complete: {session.offset} bytes ({session.receiver.content_type})")
+    try:
+        result = await _store_received_image(supabase, session.receiver)
+    finally:
+        upload_service.delete_session(session_id)
+    return JSONResponse(content=result.model_dump(), headers=headers)
+
+@router.delete("/sessions/{session_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_upload_session(session_id: str):
+    """
+    Abandon a resumable upload and delete the received bytes
+
+    Args:
+        session_id: Upload session ID
+
+    Raises:
+        HTTPException: If the session does not exist or expired
+    """
+    if not upload_service.get_session(session_id):
+        raise HTTPException(status_code=404, detail="Upload session not found")
+    upload_service.delete_session(session_id)
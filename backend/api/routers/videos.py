@@ -5,7 +5,16 @@ from sqlalchemy.future import select
 from core.database import get_session
 from core.models import Video
 from services.video_service import video_service
-from schemas.video_schemas import VideoUpdate, VideoResponse, VideoParseRequest
+from services.collection_service import collection_service
+from services.search_index import search_index
+from core.response_cache import response_cache
+from schemas.video_schemas import (
+    VideoUpdate,
+    VideoResponse,
+    VideoParseRequest,
+    VideoParseBatchRequest,
+    VideoParseBatchResponse
+)
 
 router = APIRouter(
     prefix="/videos",
@@ -25,6 +34,28 @@ async def parse_video(url: str = Query(..., description="YouTube video URL")):
     """
     return await video_service.parse_video_url(url)
 
+@router.post("/parse-batch", response_model=VideoParseBatchResponse)
+async def parse_videos(request: VideoParseBatchRequest):
+    """
+    Parse many YouTube video URLs and extract their metadata
+    
+    Duplicate and cached videos cost no API calls; the rest are fetched
+    50 IDs per YouTube request.
+    
+    Args:
+        request: URLs to parse
+        
+    Returns:
+        One result per URL in input order, with metadata or a per-item error
+    """
+    results = await video_service.parse_video_urls(request.urls)
+    error_count = sum(1 for result in results if result["error"])
+    return {
+        "results": results,
+        "video_count": len(results) - error_count,
+        "error_count": error_count
+    }
+
 @router.delete("/{video_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_video(
     video_id: int,
@@ -48,7 +79,14 @@ async def delete_video(
         raise HTTPException(status_code=404, detail="Video not found")
     
     await session.delete(video)
+    if video.collection_id is not None:
+        await collection_service.adjust_video_counts(
+            session, video.collection_id, {video.category: -1}
+        )
     await session.commit()
+    search_index.remove(video_id)
+    if video.collection_id is not None:
+        await response_cache.invalidate_collection(video.collection_id)
 
 @router.put("/{video_id}", response_model=VideoResponse)
 async def update_video(
@@ -79,10 +117,27 @@ async def update_video(
     
     # Update only provided fields (exclude_unset=True ignores None values)
     update_data = video_update.model_dump(exclude_unset=True)
+    previous_category = db_video.category
     for key, value in update_data.items():
         setattr(db_video, key, value)
+    if "category" in update_data:
+        db_video.category_manual = True
+    
+    # Move the video between category counters (this also bumps the collection revision)
+    if db_video.collection_id is not None:
+        if db_video.category != previous_category:
+            await collection_service.adjust_video_counts(
+                session,
+                db_video.collection_id,
+                {previous_category: -1, db_video.category: 1}
+            )
+        else:
+            await collection_service.bump_revision(session, db_video.collection_id)
     
     session.add(db_video)
     await session.commit()
     await session.refresh(db_video)
+    search_index.add(db_video)
+    if db_video.collection_id is not None:
+        await response_cache.invalidate_collection(db_video.collection_id)
     return db_video
@@ -0,0 +1,98 @@
+"""
+Micro-benchmark: compiled CategoryClassifier vs. the per-category keyword scans.
+
+Usage (from backend/):
+    python -m benchmarks.classifier_benchmark [--count 100000]
+"""
+import argparse
+import random
+import time
+
+from core.constants import CATEGORY_KEYWORDS, SHORTS_MAX_DURATION_SECONDS
+from core.models import VideoCategory
+from services.category_classifier import category_classifier
+
+# Keyword-dense titles: most contain several category keywords
+DENSE_WORDS = [
+    "Gongwon", "공원", "Official", "Live", "at", "Seoul", "FANCAM", "직캠", "MV", "Behind",
+    "the", "scenes", "브이로그", "Interview", "Stage", "Concert", "Making", "Film", "Teaser",
+    "Episode", "2024", "Tour", "Q&A", "Talk", "Record", "Jacket", "Focus", "Music", "Video",
+    "Performance", "Sketch", "Lyric", "Special", "Clip", "Season", "Day", "#kpop", "|", "-",
+]
+
+# Typical channel upload titles: an optional bracket tag, then artist/song/show text
+TAGS = ["[MV]", "[직캠]", "[Special Clip]", "[Teaser]", "[Episode]", "[Behind]", "[LIVE]", "", "", "", ""]
+PLAIN_WORDS = [
+    "Gongwon", "공원", "Seoul", "Night", "Summer", "Dream", "Blue", "Moon", "Song", "Cover",
+    "Music", "Bank", "Inkigayo", "Show", "Champion", "Radio", "Season", "Day", "Ep.", "#shorts",
+    "Highlight", "Medley", "Remix", "Acoustic", "ver.", "Teaser", "Spoiler", "Preview", "2024", "|", "-",
+]
+
+
+def legacy_classify(title: str, duration_seconds: int) -> VideoCategory:
+    """The original priority-ordered any(kw in title_upper) scans"""
+    title_upper = title.upper()
+    if duration_seconds <= SHORTS_MAX_DURATION_SECONDS:
+        return VideoCategory.SHORTS
+    if any(kw in title_upper for kw in CATEGORY_KEYWORDS["FANCAM"]):
+        return VideoCategory.FANCAM
+    if any(kw in title_upper for kw in CATEGORY_KEYWORDS["MV"]):
+        return VideoCategory.MV
+    if any(kw in title_upper for kw in CATEGORY_KEYWORDS["LIVE"]):
+        return VideoCategory.LIVE
+    if any(kw in title_upper for kw in CATEGORY_KEYWORDS["BEHIND"]):
+        return VideoCategory.BEHIND
+    if any(kw in title_upper for kw in CATEGORY_KEYWORDS["VLOG"]):
+        return VideoCategory.VLOG
+    if any(kw in title_upper for kw in CATEGORY_KEYWORDS["INTERVIEW"]):
+        return VideoCategory.INTERVIEW
+    return VideoCategory.ETC
+
+
+def make_titles(count: int, workload: str, seed: int = 42):
+    rng = random.Random(seed)
+    if workload == "dense":
+        titles = [" ".join(rng.choice(DENSE_WORDS) for _ in range(rng.randint(4, 14))) for _ in range(count)]
+    else:
+        titles = [
+            " ".join([rng.choice(TAGS)] + [rng.choice(PLAIN_WORDS) for _ in range(rng.randint(3, 10))])
+            for _ in range(count)
+        ]
+    durations = [rng.choice([45, 180, 240, 600, 3600]) for _ in range(count)]
+    return titles, durations
+
+
+def timed(fn, repeat: int = 5) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def run(count: int, workload: str) -> None:
+    titles, durations = make_titles(count, workload)
+
+    legacy = [legacy_classify(t, d) for t, d in zip(titles, durations)]
+    compiled = [category_classifier.classify(t, d) for t, d in zip(titles, durations)]
+    batch = category_classifier.classify_many(titles, durations)
+    assert legacy == compiled == batch, "classifier results differ from the legacy scans"
+
+    legacy_time = timed(lambda: [legacy_classify(t, d) for t, d in zip(titles, durations)])
+    single_time = timed(lambda: [category_classifier.classify(t, d) for t, d in zip(titles, durations)])
+    batch_time = timed(lambda: category_classifier.classify_many(titles, durations))
+
+    print(f"{count} {workload} titles (best of 5)")
+    print(f"  legacy any() scans:     {legacy_time * 1000:8.1f} ms")
+    print(f"  classify() per title:   {single_time * 1000:8.1f} ms  ({legacy_time / single_time:.2f}x)")
+    print(f"  classify_many() batch:  {batch_time * 1000:8.1f} ms  ({legacy_time / batch_time:.2f}x)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Category classifier micro-benchmark")
+    parser.add_argument("--count", type=int, default=100_000)
+    parser.add_argument("--workload", choices=["realistic", "dense", "all"], default="all")
+    args = parser.parse_args()
+    for workload in (["realistic", "dense"] if args.workload == "all" else [args.workload]):
+        run(args.count, workload)
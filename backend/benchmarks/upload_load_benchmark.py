@@ -0,0 +1,163 @@
+"""
+Load test: read-endpoint latency while images are being uploaded.
+
+Storage is faked with httpx transports that hold every storage request for
+--storage-latency seconds, as a network round trip would. "before" is the old
+upload path: the sync Supabase storage client called inside the async handler,
+storing the raw bytes. "after" is ImageService.store_image with the async storage
+client (variants encoded on the image thread pool). The handlers upload a JPEG
+held in memory, so multipart parsing is left out.
+
+A reader sends a GET to a small read endpoint every 10 ms, first with no uploads
+running, then while --uploaders clients upload in a loop through each path.
+
+Usage (from backend/):
+    python -m benchmarks.upload_load_benchmark [--uploaders 4] [--reads 100] [--storage-latency 0.1]
+"""
+import argparse
+import asyncio
+import io
+import statistics
+import time
+import uuid
+from types import SimpleNamespace
+from typing import List, Optional, Tuple
+
+import httpx
+from fastapi import FastAPI
+from PIL import Image
+from storage3 import AsyncStorageClient, SyncStorageClient
+
+from core.constants import SUPABASE_BUCKET_NAME
+from services.image_service import image_service
+
+STORAGE_URL = "http://storage.bench/storage/v1/"
+READ_INTERVAL = 0.01
+
+
+def storage_response(request: httpx.Request) -> httpx.Response:
+    if "/object/list/" in request.url.path:
+        return httpx.Response(200, json=[])  # Nothing stored yet: every upload does the full work
+    return httpx.Response(200, json={"Key": f"{SUPABASE_BUCKET_NAME}/{uuid.uuid4()}"})
+
+
+def make_image() -> bytes:
+    image = Image.effect_noise((2400, 1600), 48).convert("RGB")
+    buffer = io.BytesIO()
+    image.save(buffer, format="JPEG", quality=90)
+    return buffer.getvalue()
+
+
+def build_app(storage_latency: float, image_data: bytes) -> FastAPI:
+    def blocking_storage(request: httpx.Request) -> httpx.Response:
+        time.sleep(storage_latency)
+        return storage_response(request)
+
+    async def async_storage(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(storage_latency)
+        return storage_response(request)
+
+    sync_storage = SyncStorageClient(
+        STORAGE_URL, {}, http_client=httpx.Client(transport=httpx.MockTransport(blocking_storage))
+    )
+    async_supabase = SimpleNamespace(storage=AsyncStorageClient(
+        STORAGE_URL, {}, http_client=httpx.AsyncClient(transport=httpx.MockTransport(async_storage))
+    ))
+
+    app = FastAPI()
+
+    @app.get("/read")
+    async def read():
+        return {"id": 1, "title": "Collection", "video_count": 5000}
+
+    @app.post("/before")
+    async def before():
+        filename = f"{uuid.uuid4()}.jpg"
+        bucket = sync_storage.from_(SUPABASE_BUCKET_NAME)
+        bucket.upload(path=filename, file=image_data, file_options={"content-type": "image/jpeg"})
+        return {"url": bucket.get_public_url(filename)}
+
+    @app.post("/after")
+    async def after():
+        return await image_service.store_image(async_supabase, image_data)
+
+    return app
+
+
+async def upload_loop(client: httpx.AsyncClient, path: str, stop: asyncio.Event, done: List[int]) -> None:
+    while not stop.is_set():
+        (await client.post(path)).raise_for_status()
+        done[0] += 1
+        # In-process ASGI calls may finish without suspending; yield like a remote client would
+        await asyncio.sleep(0)
+
+
+async def run_phase(
+    client: httpx.AsyncClient,
+    upload_path: Optional[str],
+    uploaders: int,
+    reads: int
+) -> Tuple[List[float], float]:
+    stop = asyncio.Event()
+    done = [0]
+    tasks = [
+        asyncio.create_task(upload_loop(client, upload_path, stop, done))
+        for _ in range(uploaders if upload_path else 0)
+    ]
+    await asyncio.sleep(0.1)  # Let the uploads get going
+
+    # Reads are due every READ_INTERVAL seconds; latency counts from the due time, so
+    # time spent waiting for a blocked event loop is included
+    latencies = []
+    started = time.perf_counter()
+    for i in range(reads):
+        due = started + i * READ_INTERVAL
+        delay = due - time.perf_counter()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        (await client.get("/read")).raise_for_status()
+        latencies.append((time.perf_counter() - due) * 1000)
+    elapsed = time.perf_counter() - started
+
+    stop.set()
+    await asyncio.gather(*tasks)
+    return latencies, done[0] / elapsed
+
+
+def percentile(values: List[float], fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+async def main(uploaders: int, reads: int, storage_latency: float) -> None:
+    image_data = make_image()
+    app = build_app(storage_latency, image_data)
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=None) as client:
+        (await client.post("/after")).raise_for_status()  # Warm up the image pool
+        phases = [
+            ("no uploads", None),
+            ("before (sync client in handler)", "/before"),
+            ("after  (async client + image pool)", "/after"),
+        ]
+        print(
+            f"GET /read latency, {reads} reads; {uploaders} concurrent uploaders of a "
+            f"{len(image_data) // 1024} KB JPEG; storage latency {storage_latency * 1000:.0f} ms"
+        )
+        print(f"  {'':36} {'p50 ms':>8} {'p99 ms':>8} {'max ms':>8} {'uploads/s':>10}")
+        for label, path in phases:
+            latencies, upload_rate = await run_phase(client, path, uploaders, reads)
+            print(
+                f"  {label:36} {statistics.median(latencies):8.2f} {percentile(latencies, 0.99):8.2f} "
+                f"{max(latencies):8.2f} {upload_rate:10.1f}"
+            )
+    image_service.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Read latency under concurrent uploads")
+    parser.add_argument("--uploaders", type=int, default=4)
+    parser.add_argument("--reads", type=int, default=100)
+    parser.add_argument("--storage-latency", type=float, default=0.1, help="Seconds per storage request")
+    args = parser.parse_args()
+    asyncio.run(main(args.uploaders, args.reads, args.storage_latency))
@@ -0,0 +1,97 @@
+"""
+Benchmark: GET /collections/{id}/videos response path for a 100-row page.
+
+"before" hydrates ORM Video objects and returns a dict that FastAPI runs through
+jsonable_encoder; "after" selects column tuples, validates them through
+PaginatedVideosResponse and serializes to bytes with pydantic-core. Rows come from
+memory, so the numbers isolate hydration + validation + serialization + ASGI overhead.
+
+Usage (from backend/):
+    python -m benchmarks.video_page_benchmark [--requests 2000] [--rows 100]
+"""
+import argparse
+import asyncio
+import time
+from datetime import datetime, timedelta
+
+import httpx
+from fastapi import FastAPI, Response
+from pydantic_core import to_json
+
+from core.models import Video, VideoCategory
+from schemas.pagination_schemas import PaginatedVideosResponse, VIDEO_LIST_FIELDS
+
+
+def make_rows(count: int):
+    published = datetime(2024, 1, 1)
+    return [
+        (
+            i, 1, f"yt{i:08d}", f"[MV] Gongwon 공원 - Song {i} (Official Video)", "Gongwon Official",
+            f"https://i.ytimg.com/vi/yt{i:08d}/hqdefault.jpg", "Lorem ipsum dolor sit amet " * 8,
+            None, VideoCategory.MV, False, 215, published - timedelta(hours=i)
+        )
+        for i in range(count)
+    ]
+
+
+def build_app(rows) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/before")
+    async def before():
+        videos = [Video(**dict(zip(VIDEO_LIST_FIELDS, row))) for row in rows]
+        return {
+            "videos": videos,
+            "total": 5000,
+            "skip": 0,
+            "limit": len(rows),
+            "has_more": True,
+            "next_cursor": "cursor"
+        }
+
+    @app.get("/after")
+    async def after():
+        page = PaginatedVideosResponse.model_validate({
+            "videos": [dict(zip(VIDEO_LIST_FIELDS, row)) for row in rows],
+            "total": 5000,
+            "skip": 0,
+            "limit": len(rows),
+            "has_more": True,
+            "next_cursor": "cursor"
+        })
+        return Response(content=to_json(page), media_type="application/json")
+
+    return app
+
+
+async def measure(client: httpx.AsyncClient, path: str, requests: int) -> float:
+    for _ in range(50):  # Warm up
+        (await client.get(path)).raise_for_status()
+    started = time.perf_counter()
+    for _ in range(requests):
+        await client.get(path)
+    return requests / (time.perf_counter() - started)
+
+
+async def main(requests: int, row_count: int) -> None:
+    app = build_app(make_rows(row_count))
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        before_body = (await client.get("/before")).json()
+        after_body = (await client.get("/after")).json()
+        assert before_body["videos"][0]["title"] == after_body["videos"][0]["title"]
+
+        before_rps = await measure(client, "/before", requests)
+        after_rps = await measure(client, "/after", requests)
+
+    print(f"{row_count}-row page, {requests} sequential requests (in-process ASGI)")
+    print(f"  before (ORM + jsonable_encoder):     {before_rps:8.1f} req/s")
+    print(f"  after  (tuples + pydantic-core JSON): {after_rps:8.1f} req/s  ({after_rps / before_rps:.2f}x)")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Video list response path benchmark")
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--rows", type=int, default=100)
+    args = parser.parse_args()
+    asyncio.run(main(args.requests, args.rows))
@@ -17,6 +17,75 @@ class Settings(BaseSettings):
 
     # YouTube API
     YOUTUBE_API_KEY: str
+    YOUTUBE_FETCH_CONCURRENCY: int = 4  # Parallel videos?id= lookups while paging a playlist
+
+    # YouTube HTTP client (shared connection pool)
+    YOUTUBE_HTTP_MAX_CONNECTIONS: int = 20
+    YOUTUBE_HTTP_MAX_KEEPALIVE_CONNECTIONS: int = 10
+    YOUTUBE_HTTP_KEEPALIVE_EXPIRY: float = 60.0  # Seconds an idle connection is kept open
+    YOUTUBE_HTTP_TIMEOUT: float = 15.0
+    YOUTUBE_HTTP_CONNECT_TIMEOUT: float = 5.0
+    YOUTUBE_HTTP2: bool = True
+
+    # YouTube metadata cache (TTLs in seconds)
+    YOUTUBE_CACHE_TTL_VIDEO: float = 60 * 60
+    YOUTUBE_CACHE_TTL_HANDLE: float = 3 * 24 * 60 * 60
+    YOUTUBE_CACHE_TTL_CHANNEL: float = 5 * 60
+    YOUTUBE_CACHE_MAX_BYTES: int = 16 * 1024 * 1024
+
+    # Background import jobs
+    IMPORT_JOB_WORKERS: int = 2
+    IMPORT_JOBS_STATE_PATH: str = "uploads/import_jobs.json"  # Empty to keep jobs in memory only
+
+    # Scheduled channel sync
+    SYNC_SCHEDULER_ENABLED: bool = False  # Run the sync loop inside the API process
+    SYNC_INTERVAL_MINUTES: float = 60
+    SYNC_STALE_AFTER_HOURS: float = 24  # Only sync collections not synced within this window
+    SYNC_MAX_CONCURRENCY: int = 3
+    YOUTUBE_DAILY_QUOTA_BUDGET: int = 8000  # Quota units the sync may spend per day (API default is 10000)
+
+    # Search backend: "postgres" (tsvector + pg_trgm, see migrate_add_video_search.py)
+    # or "memory" (in-process index built at startup, no extensions needed; same prefix
+    # matching and title-weighted ranking, but no typo-tolerant matches)
+    SEARCH_BACKEND: str = "postgres"
+
+    # HTTP caching of collection/video reads (ETag + Cache-Control)
+    HTTP_CACHE_PUBLIC: bool = True  # Allow shared caches (CDN/proxy) to store responses
+    HTTP_CACHE_MAX_AGE: int = 0  # Seconds a response is fresh; 0 revalidates every time via ETag
+    # Seconds a cache may serve stale while revalidating. Browsers honor it too, so a
+    # non-zero value can show admins stale lists after an edit; opt in for CDN/nginx setups
+    HTTP_CACHE_STALE_WHILE_REVALIDATE: int = 0
+
+    # Server-side response cache for hot reads: "memory", "redis" or "none"
+    RESPONSE_CACHE_BACKEND: str = "memory"
+    RESPONSE_CACHE_MAX_BYTES: int = 32 * 1024 * 1024  # Memory backend only
+    RESPONSE_CACHE_TTL: float = 5 * 60  # Upper bound on staleness between worker processes
+    REDIS_URL: Optional[str] = None  # e.g. redis://localhost:6379/0 (requires the redis package)
+
+    # Supabase Storage client (shared async connection pool)
+    SUPABASE_HTTP_MAX_CONNECTIONS: int = 10
+    SUPABASE_HTTP_TIMEOUT: float = 30.0  # Per read/write; large uploads stream within it
+    SUPABASE_HTTP_CONNECT_TIMEOUT: float = 5.0
+    STORAGE_MAX_CONCURRENT_UPLOADS: int = 8  # Objects uploaded at once across all requests
+    IMAGE_PROCESSING_WORKERS: int = 2  # Threads decoding/encoding uploaded images
+
+    # Image uploads (streamed to UPLOAD_TEMP_DIR, then resized)
+    UPLOAD_MAX_BYTES: int = 20 * 1024 * 1024
+    UPLOAD_TEMP_DIR: str = "uploads/tmp"
+    UPLOAD_SESSION_TTL: float = 24 * 60 * 60  # Seconds an unfinished resumable upload is kept
+
+    # Uploaded image variants: "webp" or "avif" (falls back to webp if Pillow lacks AVIF)
+    IMAGE_FORMAT: str = "webp"
+    IMAGE_QUALITY: int = 80
+
+    # YouTube thumbnail proxy (/api/thumbs): downscaled copies kept on disk, LRU-evicted
+    THUMB_CACHE_DIR: str = "cache/thumbs"
+    # Enforced per process: with N workers sharing THUMB_CACHE_DIR the directory can grow
+    # to about N x this. Give each worker its own directory for a strict bound.
+    THUMB_CACHE_MAX_BYTES: int = 256 * 1024 * 1024
+
+    # Prometheus-style /metrics endpoint and per-request instrumentation
+    METRICS_ENABLED: bool = True
 
     # CORS
     CORS_ORIGINS: str = "http://localhost:5173,http://localhost:3000"
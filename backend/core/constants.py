@@ -15,6 +15,15 @@ DEFAULT_SKIP = 0
 # ============================================================================
 DEFAULT_IMPORT_LIMIT = 5000
 MAX_DESCRIPTION_LENGTH = 500
+IMPORT_BATCH_SIZE = 500  # Rows per multi-row INSERT during bulk import
+INCREMENTAL_STOP_AFTER_KNOWN = 10  # Consecutive already-stored videos that end an incremental import
+RECLASSIFY_STREAM_CHUNK_SIZE = 5000  # Rows fetched per server-side cursor round trip
+RECLASSIFY_UPDATE_CHUNK_SIZE = 10000  # Video IDs per UPDATE ... WHERE id = ANY(:ids)
+RECLASSIFY_DIFF_SAMPLE_SIZE = 10  # Example video IDs listed per category change
+INGEST_MAX_REPORTED_ERRORS = 100  # Per-row errors listed in a bulk ingest report
+INGEST_MAX_CSV_RECORD_CHARS = 64 * 1024  # Longest CSV record (quoted fields may span lines)
+EXPORT_CHUNK_SIZE = 1000  # Rows fetched per server-side cursor round trip while exporting
+IMPORT_JOB_STATE_FLUSH_SECONDS = 2.0  # Import job changes are written to the state file at most this often
 
 # ============================================================================
 # YouTube API
@@ -22,12 +31,46 @@ MAX_DESCRIPTION_LENGTH = 500
 YOUTUBE_MAX_RESULTS_PER_PAGE = 50
 SHORTS_MAX_DURATION_SECONDS = 60
 YOUTUBE_API_BASE_URL = "https://www.googleapis.com/youtube/v3"
+YOUTUBE_API_HOST = "www.googleapis.com"
+YOUTUBE_QUOTA_TIMEZONE = "America/Los_Angeles"  # Daily quota resets at midnight Pacific Time
+PARSE_BATCH_MAX_URLS = 500  # URLs accepted per POST /videos/parse-batch
+
+# Quota units per call, by endpoint (https://developers.google.com/youtube/v3/determine_quota_cost)
+YOUTUBE_QUOTA_COSTS = {
+    "channels": 1,
+    "playlistItems": 1,
+    "videos": 1,
+    "playlists": 1,
+    "search": 100,
+}
+
+# ============================================================================
+# Scheduled Channel Sync
+# ============================================================================
+SYNC_ACTIVITY_WINDOW_DAYS = 30  # Recent uploads in this window raise sync priority
+SYNC_NEVER_SYNCED_STALENESS_HOURS = 24 * 365  # Treat never-synced collections as a year stale
+SYNC_RESUME_PAGES = 10  # Playlist pages reserved for continuing a sync that stopped at its page cap
 
 # ============================================================================
 # Supabase Storage
 # ============================================================================
 SUPABASE_BUCKET_NAME = "images"
 ALLOWED_IMAGE_TYPES = ["image/jpeg", "image/png", "image/gif", "image/webp"]
+# Maximum width per stored variant of an uploaded image (smaller images are never upscaled)
+IMAGE_VARIANT_WIDTHS = {"thumb": 160, "card": 480, "cover": 1600}
+IMAGE_MAX_PIXELS = 50_000_000  # Reject larger uploads before decoding (decompression bomb guard)
+IMAGE_CACHE_CONTROL_SECONDS = 365 * 24 * 60 * 60  # Variants are content-addressed, so never change
+
+# ============================================================================
+# YouTube Thumbnail Proxy
+# ============================================================================
+YOUTUBE_THUMBNAIL_BASE_URL = "https://i.ytimg.com/vi"
+YOUTUBE_THUMBNAIL_HOST = "i.ytimg.com"
+# Thumbnails YouTube publishes per video, by file name and width. Every video has
+# hqdefault; sddefault and maxresdefault may be missing. hq/sd are letterboxed 4:3.
+YOUTUBE_THUMBNAIL_SOURCES = [("mqdefault", 320), ("hqdefault", 480), ("sddefault", 640), ("maxresdefault", 1280)]
+THUMB_PROXY_SIZES = {"small": 320, "card": 480, "large": 960}  # Served width by size name (16:9)
+THUMB_CACHE_CONTROL_SECONDS = 365 * 24 * 60 * 60
 
 # ============================================================================
 # Video Category Classification Keywords
@@ -41,6 +84,19 @@ CATEGORY_KEYWORDS = {
     "INTERVIEW": ["INTERVIEW", "TALK", "Q&A"]
 }
 
+# Highest priority first: a title matching several categories gets the earliest one
+CATEGORY_PRIORITY = ["FANCAM", "MV", "LIVE", "BEHIND", "VLOG", "INTERVIEW"]
+
+# ============================================================================
+# Search
+# ============================================================================
+SEARCH_MAX_QUERY_LENGTH = 200
+SEARCH_DEFAULT_LIMIT = 20
+SEARCH_MAX_LIMIT = 100
+SEARCH_MIN_SUBSTRING_LENGTH = 3  # Shortest query the title trigram index can serve for substring matches
+SEARCH_INDEX_BUILD_CHUNK_SIZE = 5000  # Rows fetched per server-side cursor round trip while building
+SEARCH_INDEX_MAX_DEAD_RATIO = 0.25  # Compact the in-memory index once this share of documents is dead
+
 # ============================================================================
 # Environment
 # ============================================================================
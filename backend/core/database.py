@@ -5,6 +5,7 @@ from sqlalchemy import text
 from contextlib import asynccontextmanager
 
 from core.config import settings
+from core.metrics import metrics
 
 # Construct Async Database URL
 DATABASE_URL = settings.ASYNC_DATABASE_URL
@@ -38,6 +39,20 @@ engine = create_async_engine(
     connect_args=connect_args
 )
 
+
+def _pool_gauge(stat: str):
+    """Reads a pool statistic (QueuePool.size/checkedout/overflow) when /metrics is scraped"""
+    def read():
+        value = getattr(engine.pool, stat, None)
+        # overflow() is negative while fewer than pool_size connections exist
+        return [((), max(0, value()))] if value else []
+    return read
+
+
+metrics.gauge("cura_db_pool_size", "Connections the pool keeps open (pool_size)", callback=_pool_gauge("size"))
+metrics.gauge("cura_db_pool_checked_out", "Connections currently checked out of the pool", callback=_pool_gauge("checkedout"))
+metrics.gauge("cura_db_pool_overflow", "Connections open beyond pool_size (up to max_overflow)", callback=_pool_gauge("overflow"))
+
 # Create session factory (singleton)
 # This is created once and reused for all sessions
 AsyncSessionLocal = async_sessionmaker(
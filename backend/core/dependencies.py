@@ -1,35 +1,69 @@
 """
 Dependency injection providers for CURA API
 """
-from supabase import create_client, Client
+import asyncio
+from typing import Optional
+
+import httpx
+from supabase import AsyncClient, AsyncClientOptions, acreate_client
 from core.config import settings
 
 
 # Singleton instance
-_supabase_client: Client = None
+_supabase_client: Optional[AsyncClient] = None
+_supabase_http_client: Optional[httpx.AsyncClient] = None
+_supabase_lock = asyncio.Lock()
 
 
-def get_supabase_client() -> Client:
+async def get_supabase_client() -> AsyncClient:
     """
-    Get or create Supabase client (singleton pattern)
+    Get or create the async Supabase client (singleton pattern)
+    
+    All requests share one pooled httpx client with connection limits and
+    timeouts, so storage calls never block the event loop.
     
     Returns:
-        Client: Supabase client instance
+        AsyncClient: Supabase client instance
         
     Raises:
         RuntimeError: If Supabase credentials are not configured
     """
-    global _supabase_client
+    global _supabase_client, _supabase_http_client
     
     if _supabase_client is None:
-        if not settings.SUPABASE_URL or not settings.SUPABASE_KEY_FINAL:
-            raise RuntimeError(
-                "SUPABASE_URL and SUPABASE_KEY must be set in environment variables"
-            )
-        
-        _supabase_client = create_client(
-            settings.SUPABASE_URL,
-            settings.SUPABASE_KEY_FINAL
-        )
+        async with _supabase_lock:
+            if _supabase_client is None:
+                if not settings.SUPABASE_URL or not settings.SUPABASE_KEY_FINAL:
+                    raise RuntimeError(
+                        "SUPABASE_URL and SUPABASE_KEY must be set in environment variables"
+                    )
+                
+                _supabase_http_client = httpx.AsyncClient(
+                    limits=httpx.Limits(
+                        max_connections=settings.SUPABASE_HTTP_MAX_CONNECTIONS,
+                        max_keepalive_connections=settings.SUPABASE_HTTP_MAX_CONNECTIONS
+                    ),
+                    timeout=httpx.Timeout(
+                        settings.SUPABASE_HTTP_TIMEOUT,
+                        connect=settings.SUPABASE_HTTP_CONNECT_TIMEOUT
+                    )
+                )
+                _supabase_client = await acreate_client(
+                    settings.SUPABASE_URL,
+                    settings.SUPABASE_KEY_FINAL,
+                    options=AsyncClientOptions(httpx_client=_supabase_http_client)
+                )
     
     return _supabase_client
+
+
+async def close_supabase_client() -> None:
+    """
+    Close the Supabase client's pooled connections. Called on app shutdown.
+    """
+    global _supabase_client, _supabase_http_client
+    
+    if _supabase_http_client is not None:
+        await _supabase_http_client.aclose()
+    _supabase_client = None
+    _supabase_http_client = None
@@ -0,0 +1,119 @@
+"""
+HTTP caching helpers for CURA API (strong ETags, conditional GET, Cache-Control)
+"""
+import hashlib
+from typing import Optional
+
+from fastapi import Request, Response
+
+from core.config import settings
+
+
+def make_etag(*parts) -> str:
+    """
+    Build a strong ETag from the values that determine a response body
+    
+    Args:
+        parts: Resource version(s) plus every query parameter that changes the body
+        
+    Returns:
+        Quoted ETag value
+    """
+    key = "|".join("" if part is None else str(part) for part in parts)
+    return f'"{hashlib.blake2b(key.encode(), digest_size=12).hexdigest()}"'
+
+
+def cache_control_header() -> str:
+    """
+    Cache-Control for cacheable API reads, from settings
+    
+    Returns:
+        Cache-Control header value
+    """
+    directives = [
+        "public" if settings.HTTP_CACHE_PUBLIC else "private",
+        f"max-age={settings.HTTP_CACHE_MAX_AGE}"
+    ]
+    if settings.HTTP_CACHE_STALE_WHILE_REVALIDATE:
+        directives.append(f"stale-while-revalidate={settings.HTTP_CACHE_STALE_WHILE_REVALIDATE}")
+    return ", ".join(directives)
+
+
+def is_not_modified(request: Request, etag: str) -> bool:
+    """
+    Check If-None-Match against the current ETag (weak comparison, RFC 9110)
+    
+    Args:
+        request: Incoming request
+        etag: Current ETag of the resource
+        
+    Returns:
+        True if the client's cached copy is current
+    """
+    header: Optional[str] = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    current = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == current for tag in header.split(","))
+
+
+def set_cache_headers(response: Response, etag: str) -> None:
+    """
+    Attach ETag and Cache-Control to a response
+    
+    Args:
+        response: Response (or FastAPI's injected response) to update
+        etag: Current ETag of the resource
+    """
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = cache_control_header()
+
+
+def not_modified_response(etag: str) -> Response:
+    """
+    Build a 304 Not Modified response
+    
+    Args:
+        etag: Current ETag of the resource
+        
+    Returns:
+        Empty 304 response with validators
+    """
+    response = Response(status_code=304)
+    set_cache_headers(response, etag)
+    return response
+
+
+def json_response(body: bytes, etag: str) -> Response:
+    """
+    Build a JSON response from pre-serialized bytes with validators
+    
+    Args:
+        body: Serialized JSON body
+        etag: ETag of the body
+        
+    Returns:
+        200 response with ETag and Cache-Control
+    """
+    response = Response(content=body, media_type="application/json")
+    set_cache_headers(response, etag)
+    return response
+
+
+def conditional_json_response(request: Request, body: bytes, etag: str) -> Response:
+    """
+    Answer a GET from a serialized body, honoring If-None-Match
+    
+    Args:
+        request: Incoming request
+        body: Serialized JSON body
+        etag: ETag of the body
+        
+    Returns:
+        304 if the client's copy is current, otherwise the JSON response
+    """
+    if is_not_modified(request, etag):
+        return not_modified_response(etag)
+    return json_response(body, etag)
@@ -1,7 +1,9 @@
-from datetime import datetime
+from datetime import date, datetime
 from enum import Enum
-from typing import Optional, List
+from typing import Any, Optional, List, Dict
 from sqlmodel import SQLModel, Field, Relationship
+from sqlalchemy import Column, UniqueConstraint, Index, text
+from sqlalchemy.dialects.postgresql import JSONB
 
 class CollectionType(str, Enum):
     OFFICIAL = "OFFICIAL"
@@ -19,6 +21,36 @@ class Collection(SQLModel, table=True):
     official_link: Optional[str] = None
     created_at: datetime = Field(default_factory=datetime.utcnow)
 
+    # Resized copies of uploaded images ({"thumb": {"url", "width", "height"}, ...})
+    cover_image_variants: Dict[str, Any] = Field(
+        default_factory=dict,
+        sa_column=Column(JSONB, nullable=False, server_default=text("'{}'::jsonb"))
+    )
+    profile_image_variants: Dict[str, Any] = Field(
+        default_factory=dict,
+        sa_column=Column(JSONB, nullable=False, server_default=text("'{}'::jsonb"))
+    )
+
+    # Denormalized counters, maintained by CollectionService.adjust_video_counts
+    video_count: int = Field(default=0, sa_column_kwargs={"server_default": text("0")})
+    category_counts: Dict[str, int] = Field(
+        default_factory=dict,
+        sa_column=Column(JSONB, nullable=False, server_default=text("'{}'::jsonb"))
+    )
+
+    # Bumped by every change to the collection or its videos (drives HTTP ETags)
+    revision: int = Field(default=0, sa_column_kwargs={"server_default": text("0")})
+
+    # Channel sync watermark (newest imported video and time of the last import)
+    last_synced_at: Optional[datetime] = None
+    last_synced_video_id: Optional[str] = None
+    last_synced_published_at: Optional[datetime] = None
+    # Set when an incremental sync stopped at its page cap before reaching known videos:
+    # the next sync continues from this playlist page, and only videos published at or
+    # before the floor count as "known" (the stop condition)
+    sync_resume_page_token: Optional[str] = None
+    sync_resume_floor: Optional[datetime] = None
+
     videos: List["Video"] = Relationship(back_populates="collection")
 
 class VideoCategory(str, Enum):
@@ -33,6 +65,9 @@ class VideoCategory(str, Enum):
 
 class Video(SQLModel, table=True):
     __tablename__ = "videos"
+    __table_args__ = (
+        UniqueConstraint("collection_id", "youtube_video_id", name="uq_videos_collection_youtube_video"),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
     collection_id: Optional[int] = Field(default=None, foreign_key="collections.id")
@@ -43,7 +78,28 @@ class Video(SQLModel, table=True):
     description: Optional[str] = None
     comment: Optional[str] = None
     category: VideoCategory = Field(default=VideoCategory.ETC)
+    # Set when the category was chosen by hand; bulk re-classification leaves these alone
+    category_manual: bool = Field(default=False, sa_column_kwargs={"server_default": text("false")})
     duration_seconds: int = Field(default=0)
     published_at: datetime
 
     collection: Optional[Collection] = Relationship(back_populates="videos")
+
+
+# Keyset pagination index: each page of a collection is an index range scan
+Index(
+    "ix_videos_collection_published_id",
+    Video.collection_id,
+    Video.published_at.desc(),
+    Video.id.desc()
+)
+
+
+class YouTubeQuotaUsage(SQLModel, table=True):
+    """YouTube Data API quota units spent per quota day (Pacific Time) and endpoint, by all processes"""
+    __tablename__ = "youtube_quota_usage"
+
+    day: date = Field(primary_key=True)
+    endpoint: str = Field(primary_key=True)
+    units: int = Field(default=0)
+    calls: int = Field(default=0)
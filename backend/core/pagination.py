@@ -0,0 +1,79 @@
+"""
+Keyset (cursor) pagination helpers for CURA API
+"""
+import base64
+import json
+from datetime import datetime
+from typing import Tuple
+
+
+def encode_cursor(published_at: datetime, video_id: int) -> str:
+    """
+    Encode the (published_at, id) position of the last row into an opaque cursor
+    
+    Args:
+        published_at: Publish time of the last returned video
+        video_id: ID of the last returned video
+        
+    Returns:
+        URL-safe cursor string
+    """
+    payload = json.dumps([published_at.isoformat(), video_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """
+    Decode a cursor produced by encode_cursor
+    
+    Args:
+        cursor: Opaque cursor string
+        
+    Returns:
+        Tuple of (published_at, id)
+        
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        published_at, video_id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return datetime.fromisoformat(published_at), int(video_id)
+    except Exception as e:
+        raise ValueError("Invalid cursor") from e
+
+
+def encode_rank_cursor(rank: float, video_id: int) -> str:
+    """
+    Encode the (rank, id) position of the last search result into an opaque cursor
+    
+    Args:
+        rank: Relevance score of the last returned video
+        video_id: ID of the last returned video
+        
+    Returns:
+        URL-safe cursor string
+    """
+    payload = json.dumps([rank, video_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_rank_cursor(cursor: str) -> Tuple[float, int]:
+    """
+    Decode a cursor produced by encode_rank_cursor
+    
+    Args:
+        cursor: Opaque cursor string
+        
+    Returns:
+        Tuple of (rank, id)
+        
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        rank, video_id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return float(rank), int(video_id)
+    except Exception as e:
+        raise ValueError("Invalid cursor") from e
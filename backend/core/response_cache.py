@@ -0,0 +1,283 @@
+"""
+Response cache for hot read endpoints (serialized JSON plus its ETag)
+
+Entries live in a namespace ("collections" for the list, "collection:{id}" for a
+collection and its video pages). Every namespace has a generation number that is
+part of the cache key; invalidating a namespace bumps its generation, so stale
+entries become unreachable at once. A lookup remembers the generation it saw and
+a later store is written under that generation, so a response computed before a
+concurrent invalidation can never be served afterwards.
+"""
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Set, Tuple
+
+from core.config import settings
+from core.logger import setup_logger
+
+try:
+    import redis.asyncio as aioredis
+except ImportError:  # Optional dependency, only needed for RESPONSE_CACHE_BACKEND=redis
+    aioredis = None
+
+logger = setup_logger(__name__)
+
+LIST_NAMESPACE = "collections"
+GLOBAL_NAMESPACE = "all"
+
+
+def collection_namespace(collection_id: int) -> str:
+    return f"collection:{collection_id}"
+
+
+@dataclass
+class CachedResponse:
+    """Serialized response body with its ETag"""
+    etag: str
+    body: bytes
+
+    def to_bytes(self) -> bytes:
+        return self.etag.encode() + b"\n" + self.body
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "CachedResponse":
+        etag, body = data.split(b"\n", 1)
+        return cls(etag.decode(), body)
+
+
+@dataclass
+class CacheLookup:
+    """Result of ResponseCache.get; pass it back to ResponseCache.set on a miss"""
+    namespace: str
+    key: str
+    generation: str
+    entry: Optional[CachedResponse] = None
+
+
+class MemoryCacheBackend:
+    """In-process LRU with TTL and a memory bound (per worker process)"""
+
+    def __init__(self, max_bytes: int, ttl: float):
+        self._max_bytes = max_bytes
+        self._ttl = ttl
+        # full key -> (expires at, namespace, value)
+        self._entries: "OrderedDict[str, Tuple[float, str, CachedResponse]]" = OrderedDict()
+        self._namespace_keys: Dict[str, Set[str]] = {}
+        self._generations: Dict[str, int] = {}
+        self._bytes = 0
+        self._evictions = 0
+
+    async def get_generations(self, namespaces: List[str]) -> List[int]:
+        return [self._generations.get(namespace, 0) for namespace in namespaces]
+
+    async def get(self, full_key: str) -> Optional[CachedResponse]:
+        entry = self._entries.get(full_key)
+        if entry is None:
+            return None
+        expires_at, _, value = entry
+        if expires_at <= time.monotonic():
+            self._remove(full_key)
+            return None
+        self._entries.move_to_end(full_key)
+        return value
+
+    async def set(self, namespace: str, full_key: str, value: CachedResponse) -> None:
+        size = len(value.body) + len(value.etag) + len(full_key)
+        if size > self._max_bytes:
+            return
+        self._remove(full_key)
+        self._entries[full_key] = (time.monotonic() + self._ttl, namespace, value)
+        self._namespace_keys.setdefault(namespace, set()).add(full_key)
+        self._bytes += size
+        while self._bytes > self._max_bytes:
+            self._remove(next(iter(self._entries)))
+            self._evictions += 1
+
+    async def invalidate(self, namespace: str) -> None:
+        self._generations[namespace] = self._generations.get(namespace, 0) + 1
+        if namespace == GLOBAL_NAMESPACE:
+            self._entries.clear()
+            self._namespace_keys.clear()
+            self._bytes = 0
+            return
+        # Entries of older generations are unreachable; free their memory now
+        for full_key in self._namespace_keys.pop(namespace, set()):
+            self._remove(full_key)
+
+    def _remove(self, full_key: str) -> None:
+        entry = self._entries.pop(full_key, None)
+        if entry is None:
+            return
+        _, namespace, value = entry
+        self._bytes -= len(value.body) + len(value.etag) + len(full_key)
+        keys = self._namespace_keys.get(namespace)
+        if keys is not None:
+            keys.discard(full_key)
+            if not keys:
+                del self._namespace_keys[namespace]
+
+    async def close(self) -> None:
+        pass
+
+    def get_stats(self) -> dict:
+        return {
+            "backend": "memory",
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "max_bytes": self._max_bytes,
+            "evictions": self._evictions
+        }
+
+
+class RedisCacheBackend:
+    """
+    Redis-protocol backend shared by all workers. Entries expire after the TTL;
+    memory is bounded by the server's maxmemory policy (e.g. allkeys-lru).
+    """
+
+    def __init__(self, url: str, ttl: float, prefix: str = "cura:response"):
+        self._client = aioredis.from_url(url)
+        self._ttl = int(ttl)
+        self._prefix = prefix
+
+    async def get_generations(self, namespaces: List[str]) -> List[int]:
+        values = await self._client.mget([f"{self._prefix}:gen:{namespace}" for namespace in namespaces])
+        return [int(value or 0) for value in values]
+
+    async def get(self, full_key: str) -> Optional[CachedResponse]:
+        data = await self._client.get(f"{self._prefix}:{full_key}")
+        return CachedResponse.from_bytes(data) if data else None
+
+    async def set(self, namespace: str, full_key: str, value: CachedResponse) -> None:
+        await self._client.set(f"{self._prefix}:{full_key}", value.to_bytes(), ex=self._ttl)
+
+    async def invalidate(self, namespace: str) -> None:
+        await self._client.incr(f"{self._prefix}:gen:{namespace}")
+
+    async def close(self) -> None:
+        await self._client.aclose()
+
+    def get_stats(self) -> dict:
+        return {"backend": "redis", "ttl": self._ttl}
+
+
+class ResponseCache:
+    """
+    Caches serialized responses with explicit, generation-based invalidation.
+
+    Backend errors are logged and treated as misses, so the cache never breaks reads.
+    """
+
+    def __init__(self, backend):
+        self._backend = backend
+        self._stats = {"hits": 0, "misses": 0, "stores": 0, "invalidations": 0, "errors": 0}
+
+    @property
+    def enabled(self) -> bool:
+        return self._backend is not None
+
+    async def get(self, namespace: str, key: str) -> CacheLookup:
+        """
+        Look up a cached response
+
+        Args:
+            namespace: Invalidation namespace (see collection_namespace)
+            key: Key of the response within the namespace (all params that change the body)
+
+        Returns:
+            CacheLookup whose entry is None on a miss
+        """
+        lookup = CacheLookup(namespace, key, generation="")
+        if not self.enabled:
+            return lookup
+        try:
+            global_generation, generation = await self._backend.get_generations([GLOBAL_NAMESPACE, namespace])
+            lookup.generation = f"{global_generation}.{generation}"
+            lookup.entry = await self._backend.get(self._full_key(lookup))
+        except Exception as e:
+            self._stats["errors"] += 1
+            logger.warning(f"Response cache lookup failed: {e}")
+            lookup.generation = ""
+        self._stats["hits" if lookup.entry else "misses"] += 1
+        return lookup
+
+    async def set(self, lookup: CacheLookup, etag: str, body: bytes) -> None:
+        """
+        Store a response under the generation seen by the lookup
+
+        Args:
+            lookup: Result of the preceding get (a miss)
+            etag: ETag of the response
+            body: Serialized JSON body
+        """
+        if not self.enabled or not lookup.generation:
+            return
+        try:
+            await self._backend.set(lookup.namespace, self._full_key(lookup), CachedResponse(etag, body))
+            self._stats["stores"] += 1
+        except Exception as e:
+            self._stats["errors"] += 1
+            logger.warning(f"Response cache store failed: {e}")
+
+    async def invalidate(self, *namespaces: str) -> None:
+        """
+        Invalidate every cached response in the given namespaces
+        (call after the change is committed)
+        """
+        if not self.enabled:
+            return
+        for namespace in namespaces:
+            try:
+                await self._backend.invalidate(namespace)
+                self._stats["invalidations"] += 1
+            except Exception as e:
+                self._stats["errors"] += 1
+                logger.warning(f"Response cache invalidation failed for {namespace}: {e}")
+
+    async def invalidate_collection(self, collection_id: int) -> None:
+        """Invalidate a collection, its video pages and the collection list"""
+        await self.invalidate(collection_namespace(collection_id), LIST_NAMESPACE)
+
+    async def invalidate_all(self) -> None:
+        """Invalidate every cached response"""
+        await self.invalidate(GLOBAL_NAMESPACE)
+
+    async def close(self) -> None:
+        if self.enabled:
+            await self._backend.close()
+
+    def get_stats(self) -> dict:
+        """
+        Returns hit/miss counters, hit ratio and backend size information.
+        """
+        if not self.enabled:
+            return {"backend": "none"}
+        lookups = self._stats["hits"] + self._stats["misses"]
+        return {
+            **self._backend.get_stats(),
+            **self._stats,
+            "hit_ratio": round(self._stats["hits"] / lookups, 4) if lookups else 0.0
+        }
+
+    @staticmethod
+    def _full_key(lookup: CacheLookup) -> str:
+        return f"{lookup.namespace}:{lookup.generation}:{lookup.key}"
+
+
+def _create_backend():
+    backend = settings.RESPONSE_CACHE_BACKEND
+    if backend == "none":
+        return None
+    if backend == "redis":
+        if aioredis is None:
+            logger.warning("RESPONSE_CACHE_BACKEND=redis but the redis package is not installed; using memory")
+        elif not settings.REDIS_URL:
+            logger.warning("RESPONSE_CACHE_BACKEND=redis but REDIS_URL is not set; using memory")
+        else:
+            return RedisCacheBackend(settings.REDIS_URL, settings.RESPONSE_CACHE_TTL)
+    return MemoryCacheBackend(settings.RESPONSE_CACHE_MAX_BYTES, settings.RESPONSE_CACHE_TTL)
+
+
+# Singleton instance
+response_cache = ResponseCache(_create_backend())
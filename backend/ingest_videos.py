@@ -0,0 +1,39 @@
+"""
+Bulk-load curated videos into a collection from an NDJSON or CSV file (no YouTube API calls).
+
+Usage:
+    python ingest_videos.py --collection 3 --file videos.ndjson
+    python ingest_videos.py --collection 3 --file videos.csv --format csv
+"""
+import argparse
+import asyncio
+from core.database import get_session_context
+from services.ingest_service import ingest_service
+
+READ_CHUNK_SIZE = 1024 * 1024
+
+async def read_chunks(path):
+    with open(path, "rb") as f:
+        while chunk := f.read(READ_CHUNK_SIZE):
+            yield chunk
+
+async def ingest(collection_id, path, ingest_format):
+    async with get_session_context() as session:
+        report = await ingest_service.ingest(session, collection_id, read_chunks(path), ingest_format)
+    print(
+        f"{report['imported_count']} imported, {report['skipped_count']} already present, "
+        f"{report['duplicate_count']} duplicates, {report['error_count']} errors "
+        f"({report['total_rows']} rows, {report['rows_per_sec']} rows/s)"
+    )
+    for error in report["errors"]:
+        print(f"  line {error['line']}: {error['error']}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Bulk-load videos from NDJSON or CSV")
+    parser.add_argument("--collection", type=int, required=True, help="Collection ID")
+    parser.add_argument("--file", required=True, help="Path to the NDJSON or CSV file")
+    parser.add_argument("--format", choices=["ndjson", "csv"], default=None,
+                        help="File format (default: from the file extension)")
+    args = parser.parse_args()
+    ingest_format = args.format or ("csv" if args.file.lower().endswith(".csv") else "ndjson")
+    asyncio.run(ingest(args.collection, args.file, ingest_format))
@@ -1,8 +1,8 @@
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
-from api.routers import collections, videos, upload
-from core.database import init_db
+from fastapi.responses import JSONResponse, PlainTextResponse
+from api.routers import collections, videos, upload, jobs, search, thumbs
+from core.database import init_db, get_session_context
 from core.config import settings
 from core.constants import API_TITLE, API_VERSION, API_DESCRIPTION
 from core.exceptions import (
@@ -14,6 +14,15 @@ from core.exceptions import (
     StorageError
 )
 from core.logger import setup_logger
+from core.metrics import metrics, MetricsMiddleware
+from services.video_service import video_service
+from services.job_service import import_job_runner
+from services.sync_service import sync_scheduler
+from services.search_index import search_index
+from core.response_cache import response_cache
+from core.dependencies import close_supabase_client
+from services.image_service import image_service
+from services.thumbnail_service import thumbnail_service
 
 # Setup logger
 logger = setup_logger(__name__)
@@ -33,8 +42,13 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["ETag"],
 )
 
+# Request count/latency per route template (outermost, so CORS handling is included)
+if settings.METRICS_ENABLED:
+    app.add_middleware(MetricsMiddleware)
+
 
 # Global Exception Handlers
 @app.exception_handler(ResourceNotFoundError)
@@ -159,6 +173,25 @@ async def startup_event():
         # Initialize database
         await init_db()
         logger.info("✅ Database initialized successfully")
+        
+        # Create shared YouTube HTTP client
+        await video_service.start()
+        logger.info("✅ YouTube HTTP client ready")
+        
+        # Build the in-memory search index before accepting writes
+        if settings.SEARCH_BACKEND == "memory":
+            async with get_session_context() as session:
+                await search_index.build(session)
+            logger.info(f"✅ Search index built ({search_index.get_stats()['videos']} videos)")
+        
+        # Start background import workers (resumes interrupted jobs)
+        await import_job_runner.start()
+        logger.info("✅ Import job workers started")
+        
+        # Start scheduled channel sync
+        if settings.SYNC_SCHEDULER_ENABLED:
+            sync_scheduler.start(settings.SYNC_INTERVAL_MINUTES)
+            logger.info(f"✅ Channel sync scheduled every {settings.SYNC_INTERVAL_MINUTES} minutes")
         logger.info("🎉 CURA API started successfully!")
         
     except Exception as e:
@@ -170,9 +203,20 @@ async def startup_event():
 async def shutdown_event():
     """Application shutdown event handler"""
     try:
+        await sync_scheduler.stop()
+        await import_job_runner.stop()
+        logger.info("🛑 Import job workers stopped")
+        
+        # Before the engine: closing flushes YouTube quota usage to the database
+        await video_service.close()
+        logger.info("🔒 YouTube HTTP client closed")
         from core.database import engine
         await engine.dispose()
         logger.info("🔒 Database connection closed")
+        await close_supabase_client()
+        image_service.close()
+        logger.info("🔒 Supabase storage client closed")
+        await response_cache.close()
         logger.info("👋 CURA API shutdown complete")
     except Exception as e:
         logger.exception(f"❌ Error during shutdown: {str(e)}")
@@ -194,11 +238,27 @@ async def health_check():
     """Health check endpoint"""
     return {
         "status": "healthy",
-        "environment": settings.ENV
+        "environment": settings.ENV,
+        "youtube_http_pool": video_service.get_pool_metrics(),
+        "youtube_cache": video_service.cache.get_stats(),
+        "youtube_quota": video_service.quota.get_usage(),
+        "response_cache": response_cache.get_stats(),
+        "thumbnail_cache": thumbnail_service.get_stats()
     }
 
 
+@app.get("/metrics", include_in_schema=False)
+async def metrics_endpoint():
+    """Metrics in Prometheus text format (HTTP, database pool, YouTube calls)"""
+    if not settings.METRICS_ENABLED:
+        return PlainTextResponse("Metrics are disabled\n", status_code=404)
+    return PlainTextResponse(metrics.render(), media_type="text/plain; version=0.0.4; charset=utf-8")
+
+
 # Include Routers
 app.include_router(collections.router, prefix="/api")
 app.include_router(videos.router, prefix="/api")
 app.include_router(upload.router, prefix="/api")
+app.include_router(jobs.router, prefix="/api")
+app.include_router(search.router, prefix="/api")
+app.include_router(thumbs.router, prefix="/api")
@@ -0,0 +1,23 @@
+import asyncio
+from sqlalchemy import text
+from core.database import engine, get_session_context
+from services.collection_service import collection_service
+
+async def migrate():
+    async with engine.begin() as conn:
+        print("Adding video_count and category_counts columns to collections table...")
+        await conn.execute(text(
+            "ALTER TABLE collections ADD COLUMN IF NOT EXISTS video_count INTEGER NOT NULL DEFAULT 0"
+        ))
+        await conn.execute(text(
+            "ALTER TABLE collections ADD COLUMN IF NOT EXISTS category_counts JSONB NOT NULL DEFAULT '{}'::jsonb"
+        ))
+        print("Successfully added counter columns.")
+
+    async with get_session_context() as session:
+        print("Backfilling counters from videos table...")
+        updated = await collection_service.reconcile_video_counts(session)
+        print(f"Backfilled counters for {updated} collections.")
+
+if __name__ == "__main__":
+    asyncio.run(migrate())
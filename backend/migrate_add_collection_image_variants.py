@@ -0,0 +1,17 @@
+import asyncio
+from sqlalchemy import text
+from core.database import engine
+
+async def migrate():
+    async with engine.begin() as conn:
+        print("Adding cover_image_variants and profile_image_variants columns to collections table...")
+        await conn.execute(text(
+            "ALTER TABLE collections ADD COLUMN IF NOT EXISTS cover_image_variants JSONB NOT NULL DEFAULT '{}'::jsonb"
+        ))
+        await conn.execute(text(
+            "ALTER TABLE collections ADD COLUMN IF NOT EXISTS profile_image_variants JSONB NOT NULL DEFAULT '{}'::jsonb"
+        ))
+        print("Successfully added image variant columns.")
+
+if __name__ == "__main__":
+    asyncio.run(migrate())
@@ -0,0 +1,11 @@
+from core.database import engine
+from sqlalchemy import text
+import asyncio
+
+async def migrate():
+    async with engine.begin() as conn:
+        await conn.execute(text("ALTER TABLE collections ADD COLUMN IF NOT EXISTS revision INTEGER NOT NULL DEFAULT 0"))
+    print("Migration complete: Added revision column to collections table.")
+
+if __name__ == "__main__":
+    asyncio.run(migrate())
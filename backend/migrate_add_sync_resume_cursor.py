@@ -0,0 +1,12 @@
+from core.database import engine
+from sqlalchemy import text
+import asyncio
+
+async def migrate():
+    async with engine.begin() as conn:
+        await conn.execute(text("ALTER TABLE collections ADD COLUMN IF NOT EXISTS sync_resume_page_token VARCHAR"))
+        await conn.execute(text("ALTER TABLE collections ADD COLUMN IF NOT EXISTS sync_resume_floor TIMESTAMP"))
+    print("Migration complete: Added sync resume cursor columns to collections table.")
+
+if __name__ == "__main__":
+    asyncio.run(migrate())
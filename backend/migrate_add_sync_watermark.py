@@ -0,0 +1,13 @@
+from core.database import engine
+from sqlalchemy import text
+import asyncio
+
+async def migrate():
+    async with engine.begin() as conn:
+        await conn.execute(text("ALTER TABLE collections ADD COLUMN IF NOT EXISTS last_synced_at TIMESTAMP"))
+        await conn.execute(text("ALTER TABLE collections ADD COLUMN IF NOT EXISTS last_synced_video_id VARCHAR"))
+        await conn.execute(text("ALTER TABLE collections ADD COLUMN IF NOT EXISTS last_synced_published_at TIMESTAMP"))
+    print("Migration complete: Added sync watermark columns to collections table.")
+
+if __name__ == "__main__":
+    asyncio.run(migrate())
@@ -0,0 +1,13 @@
+from core.database import engine
+from sqlalchemy import text
+import asyncio
+
+async def migrate():
+    async with engine.begin() as conn:
+        await conn.execute(text(
+            "ALTER TABLE videos ADD COLUMN IF NOT EXISTS category_manual BOOLEAN NOT NULL DEFAULT false"
+        ))
+    print("Migration complete: Added category_manual column to videos table.")
+
+if __name__ == "__main__":
+    asyncio.run(migrate())
@@ -0,0 +1,20 @@
+import asyncio
+from sqlalchemy import text
+from core.database import engine
+
+async def migrate():
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block
+    async with engine.connect() as conn:
+        conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+        print("Adding keyset pagination index on videos(collection_id, published_at DESC, id DESC)...")
+        try:
+            await conn.execute(text(
+                "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_videos_collection_published_id "
+                "ON videos (collection_id, published_at DESC, id DESC)"
+            ))
+            print("Successfully added ix_videos_collection_published_id.")
+        except Exception as e:
+            print(f"Error: {e}")
+
+if __name__ == "__main__":
+    asyncio.run(migrate())
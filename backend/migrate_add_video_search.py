@@ -0,0 +1,47 @@
+import asyncio
+from sqlalchemy import text
+from core.database import engine
+
+# 'simple' keeps words as-is (no English stemming), which suits mixed Korean/English titles.
+# Weights: title A, comment B, description C.
+SEARCH_VECTOR_SQL = (
+    "ALTER TABLE videos ADD COLUMN IF NOT EXISTS search_vector tsvector "
+    "GENERATED ALWAYS AS ("
+    "setweight(to_tsvector('simple', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('simple', coalesce(comment, '')), 'B') || "
+    "setweight(to_tsvector('simple', coalesce(description, '')), 'C')"
+    ") STORED"
+)
+
+INDEXES = [
+    (
+        "ix_videos_search_vector",
+        "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_videos_search_vector "
+        "ON videos USING GIN (search_vector)"
+    ),
+    (
+        "ix_videos_title_trgm",
+        "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_videos_title_trgm "
+        "ON videos USING GIN (title gin_trgm_ops)"
+    ),
+]
+
+async def migrate():
+    async with engine.begin() as conn:
+        print("Enabling pg_trgm and adding videos.search_vector (rewrites the videos table)...")
+        await conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+        await conn.execute(text(SEARCH_VECTOR_SQL))
+
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction block
+    async with engine.connect() as conn:
+        conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+        for name, sql in INDEXES:
+            print(f"Adding {name}...")
+            try:
+                await conn.execute(text(sql))
+                print(f"Successfully added {name}.")
+            except Exception as e:
+                print(f"Error: {e}")
+
+if __name__ == "__main__":
+    asyncio.run(migrate())
@@ -0,0 +1,28 @@
+import asyncio
+from sqlalchemy import text
+from core.database import engine
+
+async def migrate():
+    async with engine.begin() as conn:
+        print("Removing duplicate videos within collections...")
+        result = await conn.execute(text("""
+            DELETE FROM videos a
+            USING videos b
+            WHERE a.collection_id = b.collection_id
+              AND a.youtube_video_id = b.youtube_video_id
+              AND a.id > b.id
+        """))
+        print(f"Removed {result.rowcount} duplicate rows.")
+
+        print("Adding unique constraint on videos(collection_id, youtube_video_id)...")
+        try:
+            await conn.execute(text(
+                "ALTER TABLE videos ADD CONSTRAINT uq_videos_collection_youtube_video "
+                "UNIQUE (collection_id, youtube_video_id)"
+            ))
+            print("Successfully added uq_videos_collection_youtube_video.")
+        except Exception as e:
+            print(f"Error (might already exist): {e}")
+
+if __name__ == "__main__":
+    asyncio.run(migrate())
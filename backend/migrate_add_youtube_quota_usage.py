@@ -0,0 +1,18 @@
+from core.database import engine
+from sqlalchemy import text
+import asyncio
+
+async def migrate():
+    async with engine.begin() as conn:
+        await conn.execute(text(
+            "CREATE TABLE IF NOT EXISTS youtube_quota_usage ("
+            "day DATE NOT NULL, "
+            "endpoint VARCHAR NOT NULL, "
+            "units INTEGER NOT NULL DEFAULT 0, "
+            "calls INTEGER NOT NULL DEFAULT 0, "
+            "PRIMARY KEY (day, endpoint))"
+        ))
+    print("Migration complete: Added youtube_quota_usage table.")
+
+if __name__ == "__main__":
+    asyncio.run(migrate())
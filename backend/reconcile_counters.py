@@ -0,0 +1,22 @@
+"""
+Rebuild denormalized video counters on collections from the videos table.
+
+Usage:
+    python reconcile_counters.py                 # all collections
+    python reconcile_counters.py --collection 3  # a single collection
+"""
+import argparse
+import asyncio
+from core.database import get_session_context
+from services.collection_service import collection_service
+
+async def reconcile(collection_id=None):
+    async with get_session_context() as session:
+        updated = await collection_service.reconcile_video_counts(session, collection_id)
+        print(f"Reconciled counters for {updated} collections.")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Rebuild collection video counters")
+    parser.add_argument("--collection", type=int, default=None, help="Collection ID (default: all)")
+    args = parser.parse_args()
+    asyncio.run(reconcile(args.collection))
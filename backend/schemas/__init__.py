@@ -7,16 +7,26 @@ from schemas.collection_schemas import (
     CollectionCreate,
     CollectionUpdate,
     CollectionResponse,
-    VideoImportRequest
+    VideoImportRequest,
+    CategoryChange,
+    ReclassifyResponse,
+    IngestRowError,
+    IngestBatch,
+    BulkIngestResponse
 )
 from schemas.video_schemas import (
     VideoBase,
     VideoCreate,
     VideoUpdate,
     VideoResponse,
-    VideoParseRequest
+    VideoParseRequest,
+    VideoParseBatchRequest,
+    VideoParseResult,
+    VideoParseBatchResponse
 )
-from schemas.upload_schemas import UploadResponse
+from schemas.upload_schemas import ImageVariantInfo, UploadResponse, UploadSessionResponse
+from schemas.job_schemas import ImportJobResponse
+from schemas.search_schemas import SearchHit, SearchResponse
 
 __all__ = [
     "CollectionBase",
@@ -24,10 +34,23 @@ __all__ = [
     "CollectionUpdate",
     "CollectionResponse",
     "VideoImportRequest",
+    "CategoryChange",
+    "ReclassifyResponse",
+    "IngestRowError",
+    "IngestBatch",
+    "BulkIngestResponse",
     "VideoBase",
     "VideoCreate",
     "VideoUpdate",
     "VideoResponse",
     "VideoParseRequest",
+    "VideoParseBatchRequest",
+    "VideoParseResult",
+    "VideoParseBatchResponse",
+    "ImageVariantInfo",
     "UploadResponse",
+    "UploadSessionResponse",
+    "ImportJobResponse",
+    "SearchHit",
+    "SearchResponse",
 ]
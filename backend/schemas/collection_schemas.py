@@ -1,7 +1,8 @@
 from pydantic import BaseModel
-from typing import Optional
+from typing import Dict, List, Optional
 from datetime import datetime
-from core.models import CollectionType
+from core.models import CollectionType, VideoCategory
+from schemas.upload_schemas import ImageVariantInfo
 
 
 class CollectionBase(BaseModel):
@@ -16,6 +17,8 @@ class CollectionCreate(CollectionBase):
     cover_image_url: Optional[str] = None
     profile_image_url: Optional[str] = None
     official_link: Optional[str] = None
+    cover_image_variants: Dict[str, ImageVariantInfo] = {}  # From the upload response
+    profile_image_variants: Dict[str, ImageVariantInfo] = {}
 
 
 class CollectionUpdate(BaseModel):
@@ -26,6 +29,8 @@ class CollectionUpdate(BaseModel):
     profile_image_url: Optional[str] = None
     official_link: Optional[str] = None
     type: Optional[CollectionType] = None
+    cover_image_variants: Optional[Dict[str, ImageVariantInfo]] = None  # Cleared when only the URL changes
+    profile_image_variants: Optional[Dict[str, ImageVariantInfo]] = None
 
 
 class CollectionResponse(CollectionBase):
@@ -34,8 +39,13 @@ class CollectionResponse(CollectionBase):
     cover_image_url: Optional[str]
     profile_image_url: Optional[str]
     official_link: Optional[str]
+    cover_image_variants: Dict[str, ImageVariantInfo] = {}  # Resized copies for srcset
+    profile_image_variants: Dict[str, ImageVariantInfo] = {}
     created_at: datetime
     video_count: int = 0  # Number of videos in collection
+    category_counts: Dict[str, int] = {}  # Number of videos per category
+    last_synced_at: Optional[datetime] = None  # Time of the last channel import
+    revision: int = 0  # Bumped on every change to the collection or its videos
 
     class Config:
         from_attributes = True
@@ -46,3 +56,49 @@ class VideoImportRequest(BaseModel):
     limit: int = 5000
     custom_channel_url: Optional[str] = None  # Import from custom channel instead of official_link
     default_category: Optional[str] = None  # Default category for imported videos
+    incremental: bool = False  # Stop at the first run of already-imported videos
+
+
+class CategoryChange(BaseModel):
+    """Videos moved from one category to another by re-classification"""
+    collection_id: Optional[int]
+    from_category: VideoCategory
+    to_category: VideoCategory
+    count: int
+    sample_video_ids: List[int]  # A few of the affected video IDs
+
+
+class ReclassifyResponse(BaseModel):
+    """Schema for bulk re-classification results"""
+    dry_run: bool
+    scanned_count: int  # Videos classified (manually categorized videos are excluded)
+    changed_count: int
+    changes: List[CategoryChange]
+    duration_ms: float
+
+
+class IngestRowError(BaseModel):
+    """A row rejected by bulk ingest"""
+    line: int  # 1-based line number in the uploaded file
+    error: str
+
+
+class IngestBatch(BaseModel):
+    """One multi-row INSERT of a bulk ingest"""
+    batch: int
+    size: int
+    inserted_count: int
+    duration_ms: float
+
+
+class BulkIngestResponse(BaseModel):
+    """Schema for bulk ingest results"""
+    total_rows: int
+    imported_count: int
+    duplicate_count: int  # Repeated within the file
+    skipped_count: int  # Already in the collection
+    error_count: int
+    errors: List[IngestRowError]  # First INGEST_MAX_REPORTED_ERRORS errors
+    batches: List[IngestBatch]
+    rows_per_sec: float
+    duration_ms: float
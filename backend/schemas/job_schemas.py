@@ -0,0 +1,25 @@
+from pydantic import BaseModel
+from typing import Optional
+from datetime import datetime
+
+
+class ImportJobResponse(BaseModel):
+    """Schema for background import job status"""
+    id: str
+    collection_id: int
+    status: str
+    limit: int
+    expected_count: Optional[int] = None
+    fetched_count: int
+    imported_count: int
+    skipped_count: int
+    checkpoint_page_token: Optional[str] = None
+    throughput_per_sec: Optional[float] = None  # Videos fetched per second
+    eta_seconds: Optional[float] = None
+    error: Optional[str] = None
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
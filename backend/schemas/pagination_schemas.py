@@ -1,5 +1,7 @@
-from pydantic import BaseModel
-from typing import List, Optional
+from functools import lru_cache
+from pydantic import BaseModel, create_model
+from typing import List, Optional, Tuple, Type
+from datetime import datetime
 
 class VideoResponse(BaseModel):
     """영상 응답 스키마"""
@@ -12,17 +14,86 @@ class VideoResponse(BaseModel):
     description: Optional[str] = None
     comment: Optional[str] = None
     category: str
+    category_manual: bool = False
     duration_seconds: int
-    published_at: str
+    published_at: datetime
     
     class Config:
         from_attributes = True
 
 
+# Column order of the video list query (matches VideoResponse fields)
+VIDEO_LIST_FIELDS = tuple(VideoResponse.model_fields)
+
+
 class PaginatedVideosResponse(BaseModel):
     """페이지네이션된 영상 목록 응답"""
     videos: List[VideoResponse]
-    total: int
+    total: Optional[int] = None
     skip: int
     limit: int
     has_more: bool
+    next_cursor: Optional[str] = None
+
+
+# Named projections for the `fields=` parameter of video listings
+VIDEO_FIELD_PRESETS = {
+    "card": ("id", "youtube_video_id", "title", "thumbnail_url", "category", "duration_seconds", "published_at"),
+}
+# Always selected: the keyset cursor is built from them
+VIDEO_REQUIRED_FIELDS = ("id", "published_at")
+
+
+def parse_video_fields(fields: Optional[str]) -> Tuple[str, ...]:
+    """
+    Resolve a `fields=` value (field names and/or presets, comma separated)
+    
+    Args:
+        fields: e.g. "card", "card,channel_name" or "id,title" (None for all fields)
+        
+    Returns:
+        Selected field names in VideoResponse order
+        
+    Raises:
+        ValueError: If a name is neither a field nor a preset
+    """
+    if not fields:
+        return VIDEO_LIST_FIELDS
+    selected = set(VIDEO_REQUIRED_FIELDS)
+    for name in (part.strip() for part in fields.split(",")):
+        if not name:
+            continue
+        if name in VIDEO_FIELD_PRESETS:
+            selected.update(VIDEO_FIELD_PRESETS[name])
+        elif name in VideoResponse.model_fields:
+            selected.add(name)
+        else:
+            raise ValueError(f"Unknown field: {name}")
+    return tuple(field for field in VIDEO_LIST_FIELDS if field in selected)
+
+
+@lru_cache(maxsize=64)
+def get_paginated_videos_model(fields: Tuple[str, ...]) -> Type[BaseModel]:
+    """
+    Response model for a projection of VideoResponse (built once per field set)
+    
+    Args:
+        fields: Field names from parse_video_fields
+        
+    Returns:
+        PaginatedVideosResponse, or an equivalent model whose videos carry only `fields`
+    """
+    if fields == VIDEO_LIST_FIELDS:
+        return PaginatedVideosResponse
+    video_model = create_model(
+        "VideoFieldsResponse",
+        **{
+            field: (VideoResponse.model_fields[field].annotation, VideoResponse.model_fields[field])
+            for field in fields
+        }
+    )
+    return create_model(
+        "PaginatedVideoFieldsResponse",
+        __base__=PaginatedVideosResponse,
+        videos=(List[video_model], ...)
+    )
@@ -0,0 +1,17 @@
+from pydantic import BaseModel
+from typing import List, Optional
+from schemas.video_schemas import VideoResponse
+
+
+class SearchHit(VideoResponse):
+    """Video search result with its relevance score"""
+    rank: float
+
+
+class SearchResponse(BaseModel):
+    """Schema for ranked, cursor-paginated search results"""
+    query: str
+    videos: List[SearchHit]
+    limit: int
+    has_more: bool
+    next_cursor: Optional[str] = None
@@ -1,6 +1,25 @@
 from pydantic import BaseModel
+from typing import Dict, Optional
+
+
+class ImageVariantInfo(BaseModel):
+    """One stored size of an uploaded image"""
+    url: str
+    width: int
+    height: int
 
 
 class UploadResponse(BaseModel):
     """Schema for file upload response"""
-    url: str
+    url: str  # Largest variant
+    variants: Dict[str, ImageVariantInfo] = {}  # By variant name (thumb, card, cover)
+    srcset: str = ""  # "url 160w, url 480w, ..." for <img srcset>
+    content_hash: Optional[str] = None
+    deduplicated: bool = False  # Image was already stored; nothing was uploaded
+
+
+class UploadSessionResponse(BaseModel):
+    """Schema for a new resumable upload session"""
+    id: str
+    upload_offset: int  # Bytes received so far
+    upload_length: int  # Total bytes expected
@@ -1,7 +1,8 @@
-from pydantic import BaseModel
-from typing import Optional
+from pydantic import BaseModel, Field
+from typing import Any, Dict, List, Optional
 from datetime import datetime
 from core.models import VideoCategory
+from core.constants import PARSE_BATCH_MAX_URLS
 
 
 class VideoBase(BaseModel):
@@ -39,6 +40,7 @@ class VideoResponse(VideoBase):
     description: Optional[str]
     comment: Optional[str]
     category: VideoCategory
+    category_manual: bool = False  # Category was set by hand and is kept on re-classification
     duration_seconds: int
     published_at: datetime
 
@@ -49,3 +51,23 @@ class VideoResponse(VideoBase):
 class VideoParseRequest(BaseModel):
     """Schema for video URL parsing request"""
     url: str
+
+
+class VideoParseBatchRequest(BaseModel):
+    """Schema for batch video URL parsing request"""
+    urls: List[str] = Field(..., min_length=1, max_length=PARSE_BATCH_MAX_URLS)
+
+
+class VideoParseResult(BaseModel):
+    """Parse result for one URL: metadata, or the reason it could not be parsed"""
+    url: str
+    youtube_video_id: Optional[str]
+    video: Optional[Dict[str, Any]] = None  # Same shape as POST /videos/parse
+    error: Optional[str] = None
+
+
+class VideoParseBatchResponse(BaseModel):
+    """Schema for batch video URL parsing response (results in input order)"""
+    results: List[VideoParseResult]
+    video_count: int
+    error_count: int
@@ -0,0 +1,91 @@
+"""
+Category Classifier
+Keyword classifier built once from CATEGORY_KEYWORDS
+"""
+import re
+from typing import Dict, List, Sequence, Tuple
+
+from core.constants import CATEGORY_KEYWORDS, CATEGORY_PRIORITY, SHORTS_MAX_DURATION_SECONDS
+from core.models import VideoCategory
+
+
+class CategoryClassifier:
+    """
+    Classifies videos by title keywords and duration.
+
+    All keywords are compiled into one alternation regex that screens each title in a
+    single scan; most titles contain no keyword and are ETC after that one call. The
+    rest are checked keyword by keyword in priority order with plain substring tests,
+    which gives the same result as the per-category keyword scans it replaces.
+    """
+
+    def __init__(
+        self,
+        keywords: Dict[str, List[str]],
+        priority: List[str],
+        shorts_max_duration: int
+    ):
+        self._shorts_max_duration = shorts_max_duration
+        # Highest priority first; a keyword listed under several categories keeps the first
+        self._keywords: List[Tuple[str, VideoCategory]] = []
+        seen = set()
+        for name in priority:
+            for keyword in keywords[name]:
+                keyword = keyword.upper()
+                if keyword not in seen:
+                    seen.add(keyword)
+                    self._keywords.append((keyword, VideoCategory(name)))
+
+        # Group alternatives by first character (the regex engine rejects most positions
+        # on one char), longest keyword first
+        by_first_char: Dict[str, List[str]] = {}
+        for keyword in sorted(seen, key=len, reverse=True):
+            by_first_char.setdefault(keyword[0], []).append(re.escape(keyword[1:]))
+        self._any_keyword = re.compile("|".join(
+            f"{re.escape(first)}(?:{'|'.join(rests)})" for first, rests in by_first_char.items()
+        )).search
+
+    @classmethod
+    def from_constants(cls) -> "CategoryClassifier":
+        return cls(CATEGORY_KEYWORDS, CATEGORY_PRIORITY, SHORTS_MAX_DURATION_SECONDS)
+
+    def classify(self, title: str, duration_seconds: int) -> VideoCategory:
+        """
+        Classify a single video
+
+        Args:
+            title: Video title
+            duration_seconds: Video duration in seconds
+
+        Returns:
+            VideoCategory enum value
+        """
+        # Shorts (Duration <= configured threshold)
+        if duration_seconds <= self._shorts_max_duration:
+            return VideoCategory.SHORTS
+
+        title_upper = title.upper()
+        if self._any_keyword(title_upper) is None:
+            return VideoCategory.ETC
+        for keyword, category in self._keywords:
+            if keyword in title_upper:
+                return category
+        return VideoCategory.ETC
+
+    def classify_many(self, titles: Sequence[str], durations: Sequence[int]) -> List[VideoCategory]:
+        """
+        Classify a batch of videos
+
+        Args:
+            titles: Video titles
+            durations: Video durations in seconds, parallel to `titles`
+
+        Returns:
+            VideoCategory per video, in input order
+        """
+        classify = self.classify
+        return [classify(title, duration) for title, duration in zip(titles, durations)]
+
+
+# Singleton instance
+category_classifier = CategoryClassifier.from_constants()
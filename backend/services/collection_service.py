@@ -2,14 +2,27 @@
 Collection Service Layer
 Handles business logic for collection operations
 """
-from typing import List, Optional
+import time
+from contextlib import aclosing
+from datetime import datetime
+from typing import Awaitable, Callable, Dict, List, Optional, Set, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy import delete as sql_delete
+from sqlalchemy import delete as sql_delete, update, func, Integer, any_, bindparam
+from sqlalchemy.dialects.postgresql import ARRAY, insert as pg_insert
 
 from core.models import Collection, Video, VideoCategory
-from core.constants import MAX_DESCRIPTION_LENGTH, CATEGORY_KEYWORDS, SHORTS_MAX_DURATION_SECONDS
+from core.constants import (
+    MAX_DESCRIPTION_LENGTH,
+    IMPORT_BATCH_SIZE,
+    RECLASSIFY_STREAM_CHUNK_SIZE,
+    RECLASSIFY_UPDATE_CHUNK_SIZE,
+    RECLASSIFY_DIFF_SAMPLE_SIZE
+)
 from services.video_service import video_service
+from services.category_classifier import category_classifier
+from services.search_index import search_index
+from core.response_cache import response_cache, LIST_NAMESPACE
 
 
 class CollectionService:
@@ -51,6 +64,52 @@ class CollectionService:
         result = await session.execute(select(Collection))
         return list(result.scalars().all())
 
+    async def get_revision(
+        self,
+        session: AsyncSession,
+        collection_id: int
+    ) -> Optional[int]:
+        """
+        Get a collection's revision without loading the row
+        
+        Args:
+            session: Database session
+            collection_id: Collection ID
+            
+        Returns:
+            Revision or None if not found
+        """
+        result = await session.execute(
+            select(Collection.revision).where(Collection.id == collection_id)
+        )
+        return result.scalar_one_or_none()
+
+    async def get_collections_version(
+        self,
+        session: AsyncSession
+    ) -> Tuple[int, int, int]:
+        """
+        Version of the whole collection list
+        
+        Creating a collection raises max(id), deleting one lowers the count and
+        any other change bumps a revision, so every change produces a new tuple.
+        
+        Args:
+            session: Database session
+            
+        Returns:
+            Tuple of (count, max id, sum of revisions)
+        """
+        result = await session.execute(
+            select(
+                func.count(Collection.id),
+                func.coalesce(func.max(Collection.id), 0),
+                func.coalesce(func.sum(Collection.revision), 0)
+            )
+        )
+        count, max_id, revision_sum = result.one()
+        return count, max_id, int(revision_sum)
+
     async def create_collection(
         self, 
         session: AsyncSession,
@@ -70,6 +129,7 @@ class CollectionService:
         session.add(collection)
         await session.commit()
         await session.refresh(collection)
+        await response_cache.invalidate(LIST_NAMESPACE)
         return collection
 
     async def update_collection(
@@ -93,14 +153,25 @@ class CollectionService:
         if not collection:
             return None
         
+        # Variants belong to the previous image once its URL changes without new ones
+        for url_field, variants_field in (
+            ("cover_image_url", "cover_image_variants"),
+            ("profile_image_url", "profile_image_variants")
+        ):
+            new_url = update_data.get(url_field)
+            if new_url is not None and new_url != getattr(collection, url_field) and update_data.get(variants_field) is None:
+                update_data[variants_field] = {}
+        
         # Update only non-None fields
         for key, value in update_data.items():
             if value is not None:
                 setattr(collection, key, value)
+        collection.revision = Collection.revision + 1
         
         session.add(collection)
         await session.commit()
         await session.refresh(collection)
+        await response_cache.invalidate_collection(collection_id)
         return collection
 
     async def delete_all_videos(
@@ -125,7 +196,10 @@ class CollectionService:
         await session.execute(
             sql_delete(Video).where(Video.collection_id == collection_id)
         )
+        await self.reset_video_counts(session, collection_id)
         await session.commit()
+        search_index.remove_collection(collection_id)
+        await response_cache.invalidate_collection(collection_id)
         return True
 
     async def delete_collection(
@@ -155,6 +229,8 @@ class CollectionService:
         # Delete the collection
         await session.delete(collection)
         await session.commit()
+        search_index.remove_collection(collection_id)
+        await response_cache.invalidate_collection(collection_id)
         return True
 
     async def import_videos_from_channel(
@@ -163,17 +239,29 @@ class CollectionService:
         collection_id: int,
         limit: int = 5000,
         custom_channel_url: Optional[str] = None,
-        default_category: Optional[str] = None
+        default_category: Optional[str] = None,
+        page_token: Optional[str] = None,
+        on_progress: Optional[Callable[[dict], Awaitable[None]]] = None,
+        incremental: bool = False
     ) -> dict:
         """
         Import videos from a YouTube channel
         
+        Playlist pages are buffered into IMPORT_BATCH_SIZE multi-row inserts and each
+        batch is committed as soon as it is written, so an interrupted import keeps its
+        progress and can resume from the reported checkpoint page token.
+        
         Args:
             session: Database session
             collection_id: Collection ID
             limit: Maximum number of videos to import
             custom_channel_url: Optional custom channel URL (takes priority over official_link)
             default_category: Optional default category for all imported videos
+            page_token: Optional playlist page token to resume from
+            on_progress: Optional async callback receiving progress after every page
+            incremental: Stop at the first run of videos already in the collection.
+                If the walk stops at `limit` first, a resume cursor is saved on the
+                collection and the next incremental import continues from it
             
         Returns:
             Dictionary with import results
@@ -199,69 +287,483 @@ class CollectionService:
             raise ValueError("Could not resolve YouTube Channel ID from URL")
         
         # Get uploads playlist
-        playlist_id = await video_service.get_channel_uploads_playlist_id(
-            channel_id
-        )
+        channel_info = await video_service.get_channel_info(channel_id)
+        playlist_id = channel_info.get("uploads_playlist_id") if channel_info else None
         if not playlist_id:
             raise ValueError("Could not find 'Uploads' playlist for this channel")
         
-        # Fetch videos
-        videos_data = await video_service.get_playlist_videos(
-            playlist_id, 
-            limit=limit
-        )
+        # Resolve default category once (invalid values fall back to classification)
+        forced_category = None
+        if default_category:
+            try:
+                forced_category = VideoCategory[default_category.upper()]
+            except KeyError:
+                forced_category = None
         
-        # Import videos
-        imported_count = 0
+        # Load existing video IDs for this collection in a single query
+        existing_ids = await self._get_existing_video_ids(session, collection_id)
         
-        for v_data in videos_data:
-            # Check if video already exists in this collection
-            existing = await session.execute(
-                select(Video).where(
-                    Video.collection_id == collection_id,
-                    Video.youtube_video_id == v_data["youtube_video_id"]
+        # Incremental walks stop at a run of known videos. A walk that hit its limit first
+        # leaves a cursor: continue from its page, and only count videos that were known
+        # before that walk began (the floor) as known, so re-seen new ones don't stop it.
+        known_video_ids = None
+        resume_floor = None
+        if incremental:
+            if page_token is None and collection.sync_resume_page_token:
+                page_token = collection.sync_resume_page_token
+                resume_floor = collection.sync_resume_floor
+                known_video_ids = (
+                    await self._get_existing_video_ids(session, collection_id, published_before=resume_floor)
+                    if resume_floor else set()
                 )
+            else:
+                known_video_ids = set(existing_ids)
+                if existing_ids:
+                    resume_floor = (await session.execute(
+                        select(func.max(Video.published_at)).where(Video.collection_id == collection_id)
+                    )).scalar()
+        
+        progress = {
+            "expected_count": min(limit, channel_info.get("video_count") or limit),
+            "fetched_count": 0,
+            "imported_count": 0,
+            "skipped_count": 0,
+            "checkpoint_page_token": page_token
+        }
+        batches: List[dict] = []
+        rows: List[dict] = []
+        newest_video: Optional[dict] = None
+        last_page_token = page_token
+        
+        async def flush(checkpoint_page_token: Optional[str]) -> None:
+            """Write buffered rows, commit, and advance the resume checkpoint"""
+            nonlocal rows
+            inserted_rows: List[dict] = []
+            if rows:
+                flushed_batches, category_deltas, inserted_rows = await self._bulk_insert_videos(session, rows)
+                await self.adjust_video_counts(session, collection_id, category_deltas)
+                for batch in flushed_batches:
+                    batch["batch"] = len(batches) + 1
+                    batches.append(batch)
+                inserted_count = sum(batch["inserted_count"] for batch in flushed_batches)
+                progress["imported_count"] += inserted_count
+                progress["skipped_count"] += len(rows) - inserted_count
+                rows = []
+            await session.commit()
+            search_index.add_many(inserted_rows)
+            await response_cache.invalidate_collection(collection_id)
+            progress["checkpoint_page_token"] = checkpoint_page_token
+        
+        # Fetch videos page by page
+        pages = video_service.iter_playlist_video_pages(
+            playlist_id,
+            limit=limit,
+            page_token=page_token,
+            known_video_ids=known_video_ids
+        )
+        async with aclosing(pages):
+            async for page_videos, next_page_token in pages:
+                for v_data in page_videos:
+                    if newest_video is None or v_data["published_at"] > newest_video["published_at"]:
+                        newest_video = v_data
+                    youtube_video_id = v_data["youtube_video_id"]
+                    # Skip videos already in the collection (or repeated in this fetch)
+                    if youtube_video_id in existing_ids:
+                        progress["skipped_count"] += 1
+                        continue
+                    existing_ids.add(youtube_video_id)
+                    rows.append(self._build_video_row(collection_id, v_data, forced_category))
+                progress["fetched_count"] += len(page_videos)
+                last_page_token = next_page_token
+                
+                # Import videos in batched multi-row inserts
+                if len(rows) >= IMPORT_BATCH_SIZE:
+                    await flush(next_page_token)
+                if on_progress:
+                    await on_progress(dict(progress))
+        
+        # Record the sync watermark together with the final batch
+        collection.last_synced_at = datetime.utcnow()
+        if newest_video and (
+            collection.last_synced_published_at is None
+            or newest_video["published_at"] >= collection.last_synced_published_at
+        ):
+            collection.last_synced_video_id = newest_video["youtube_video_id"]
+            collection.last_synced_published_at = newest_video["published_at"]
+        if incremental:
+            # A remaining page token means the walk stopped at `limit` before known videos
+            collection.sync_resume_page_token = last_page_token
+            collection.sync_resume_floor = resume_floor if last_page_token else None
+        session.add(collection)
+        await self.bump_revision(session, collection_id)
+        
+        await flush(None)
+        if on_progress:
+            await on_progress(dict(progress))
+        
+        imported_count = progress["imported_count"]
+        
+        return {
+            "message": f"Successfully imported {imported_count} videos.",
+            "imported_count": imported_count,
+            "skipped_count": progress["skipped_count"],
+            "fetched_count": progress["fetched_count"],
+            "batches": batches
+        }
+
+    async def insert_videos(
+        self,
+        session: AsyncSession,
+        collection_id: int,
+        rows: List[dict]
+    ) -> Tuple[List[dict], int]:
+        """
+        Insert prepared video rows, skipping ones already in the collection, and commit
+        
+        Counters, the search index and the response cache are updated with the
+        inserted rows.
+        
+        Args:
+            session: Database session
+            collection_id: Collection ID
+            rows: Video rows with every videos column except id
+            
+        Returns:
+            Tuple of per-batch results and number of inserted rows
+        """
+        batches, category_deltas, inserted_rows = await self._bulk_insert_videos(session, rows)
+        await self.adjust_video_counts(session, collection_id, category_deltas)
+        await session.commit()
+        search_index.add_many(inserted_rows)
+        await response_cache.invalidate_collection(collection_id)
+        return batches, len(inserted_rows)
+
+    async def _get_existing_video_ids(
+        self,
+        session: AsyncSession,
+        collection_id: int,
+        published_before: Optional[datetime] = None
+    ) -> Set[str]:
+        """
+        Load the YouTube video IDs already stored in a collection
+        
+        Args:
+            session: Database session
+            collection_id: Collection ID
+            published_before: Only videos published at or before this time
+            
+        Returns:
+            Set of YouTube video IDs
+        """
+        query = select(Video.youtube_video_id).where(Video.collection_id == collection_id)
+        if published_before is not None:
+            query = query.where(Video.published_at <= published_before)
+        result = await session.execute(query)
+        return set(result.scalars().all())
+
+    def _build_video_row(
+        self,
+        collection_id: int,
+        v_data: dict,
+        category: Optional[VideoCategory] = None
+    ) -> dict:
+        """
+        Build an insertable video row from fetched YouTube data
+        
+        Args:
+            collection_id: Collection ID
+            v_data: Video data from VideoService
+            category: Import-wide default category (classified from title/duration if None).
+                Not marked category_manual, so re-classification can still correct it.
+            
+        Returns:
+            Dictionary of column values for the videos table
+        """
+        duration_seconds = v_data.get("duration_seconds", 0)
+        if category is None:
+            category = self._classify_video_category(v_data["title"], duration_seconds)
+        
+        return {
+            "collection_id": collection_id,
+            "youtube_video_id": v_data["youtube_video_id"],
+            "title": v_data["title"],
+            "channel_name": v_data["channel_name"],
+            "thumbnail_url": v_data["thumbnail_url"],
+            "description": (v_data.get("description") or "")[:MAX_DESCRIPTION_LENGTH],
+            "published_at": v_data["published_at"],
+            "duration_seconds": duration_seconds,
+            "category": category,
+            "category_manual": False
+        }
+
+    async def _bulk_insert_videos(
+        self,
+        session: AsyncSession,
+        rows: List[dict]
+    ) -> Tuple[List[dict], Dict[VideoCategory, int], List[dict]]:
+        """
+        Insert video rows with batched multi-row INSERT ... ON CONFLICT DO NOTHING
+        
+        Args:
+            session: Database session
+            rows: Video rows built by _build_video_row
+            
+        Returns:
+            Tuple of per-batch results (size, inserted count, duration in ms),
+            inserted video counts per category, and the inserted rows with their new IDs
+        """
+        batches = []
+        category_deltas: Dict[VideoCategory, int] = {}
+        inserted_rows: List[dict] = []
+        for offset in range(0, len(rows), IMPORT_BATCH_SIZE):
+            chunk = rows[offset:offset + IMPORT_BATCH_SIZE]
+            started = time.perf_counter()
+            
+            stmt = (
+                pg_insert(Video)
+                .values(chunk)
+                .on_conflict_do_nothing(index_elements=["collection_id", "youtube_video_id"])
+                .returning(Video.id, Video.collection_id, Video.youtube_video_id, Video.category)
             )
-            if existing.scalars().first():
-                continue
+            result = await session.execute(stmt)
+            inserted = result.all()
+            inserted_count = len(inserted)
+            chunk_by_key = {(row["collection_id"], row["youtube_video_id"]): row for row in chunk}
+            for video_id, cid, youtube_video_id, category in inserted:
+                category_deltas[category] = category_deltas.get(category, 0) + 1
+                inserted_rows.append({**chunk_by_key[(cid, youtube_video_id)], "id": video_id})
             
-            # Classify category or use default if provided
-            if default_category:
-                # Use provided default category
-                try:
-                    category = VideoCategory[default_category.upper()]
-                except KeyError:
-                    # Invalid category, fall back to classification
-                    category = self._classify_video_category(
-                        v_data["title"],
-                        v_data.get("duration_seconds", 0)
-                    )
-            else:
-                category = self._classify_video_category(
-                    v_data["title"],
-                    v_data.get("duration_seconds", 0)
+            batches.append({
+                "batch": len(batches) + 1,
+                "size": len(chunk),
+                "inserted_count": inserted_count,
+                "duration_ms": round((time.perf_counter() - started) * 1000, 2)
+            })
+        return batches, category_deltas, inserted_rows
+
+    async def adjust_video_counts(
+        self,
+        session: AsyncSession,
+        collection_id: int,
+        category_deltas: Dict[VideoCategory, int]
+    ) -> None:
+        """
+        Atomically adjust a collection's video_count and category_counts
+        (and bump its revision)
+        
+        Runs a single UPDATE in the caller's transaction; the caller commits.
+        
+        Args:
+            session: Database session
+            collection_id: Collection ID
+            category_deltas: Change in video count per category (e.g. {MV: 1, ETC: -1})
+        """
+        category_deltas = {
+            VideoCategory(category).value: delta
+            for category, delta in category_deltas.items()
+            if delta
+        }
+        if not category_deltas:
+            return
+        
+        counts_expr = Collection.category_counts
+        for category, delta in category_deltas.items():
+            current = func.coalesce(Collection.category_counts[category].astext.cast(Integer), 0)
+            counts_expr = counts_expr.op("||")(func.jsonb_build_object(category, current + delta))
+        
+        await session.execute(
+            update(Collection)
+            .where(Collection.id == collection_id)
+            .values(
+                video_count=Collection.video_count + sum(category_deltas.values()),
+                category_counts=counts_expr,
+                revision=Collection.revision + 1
+            )
+            .execution_options(synchronize_session=False)
+        )
+
+    async def bump_revision(
+        self,
+        session: AsyncSession,
+        collection_id: int
+    ) -> None:
+        """
+        Mark a collection as changed (for edits that do not move counters)
+        
+        Runs in the caller's transaction; the caller commits.
+        
+        Args:
+            session: Database session
+            collection_id: Collection ID
+        """
+        await session.execute(
+            update(Collection)
+            .where(Collection.id == collection_id)
+            .values(revision=Collection.revision + 1)
+            .execution_options(synchronize_session=False)
+        )
+
+    async def reset_video_counts(
+        self,
+        session: AsyncSession,
+        collection_id: int
+    ) -> None:
+        """
+        Reset a collection's counters to zero (after deleting all of its videos)
+        
+        Args:
+            session: Database session
+            collection_id: Collection ID
+        """
+        await session.execute(
+            update(Collection)
+            .where(Collection.id == collection_id)
+            .values(video_count=0, category_counts={}, revision=Collection.revision + 1)
+            .execution_options(synchronize_session=False)
+        )
+
+    async def reconcile_video_counts(
+        self,
+        session: AsyncSession,
+        collection_id: Optional[int] = None
+    ) -> int:
+        """
+        Rebuild video_count and category_counts from the videos table
+        
+        Args:
+            session: Database session
+            collection_id: Collection to rebuild (all collections if None)
+            
+        Returns:
+            Number of collections updated
+        """
+        counts_query = (
+            select(Video.collection_id, Video.category, func.count(Video.id))
+            .group_by(Video.collection_id, Video.category)
+        )
+        collections_query = select(Collection.id)
+        if collection_id is not None:
+            counts_query = counts_query.where(Video.collection_id == collection_id)
+            collections_query = collections_query.where(Collection.id == collection_id)
+        
+        counts: Dict[int, Dict[str, int]] = {}
+        for cid, category, count in (await session.execute(counts_query)).all():
+            counts.setdefault(cid, {})[VideoCategory(category).value] = count
+        
+        collection_ids = (await session.execute(collections_query)).scalars().all()
+        for cid in collection_ids:
+            category_counts = counts.get(cid, {})
+            await session.execute(
+                update(Collection)
+                .where(Collection.id == cid)
+                .values(
+                    video_count=sum(category_counts.values()),
+                    category_counts=category_counts,
+                    revision=Collection.revision + 1
                 )
+                .execution_options(synchronize_session=False)
+            )
+        await session.commit()
+        await response_cache.invalidate_all()
+        return len(collection_ids)
+
+    async def reclassify_videos(
+        self,
+        session: AsyncSession,
+        collection_id: Optional[int] = None,
+        dry_run: bool = False
+    ) -> dict:
+        """
+        Re-run category classification over existing videos
+        
+        Videos are streamed through a server-side cursor and classified in batches.
+        Changes are applied as one UPDATE ... WHERE id = ANY(:ids) per category change,
+        and counters are adjusted in the same transaction. Videos whose category was
+        set by hand (category_manual) are left alone.
+        
+        Args:
+            session: Database session
+            collection_id: Collection to reclassify (all collections if None)
+            dry_run: Only report the changes, without writing them
             
-            # Create video
-            new_video = Video(
-                collection_id=collection_id,
-                youtube_video_id=v_data["youtube_video_id"],
-                title=v_data["title"],
-                channel_name=v_data["channel_name"],
-                thumbnail_url=v_data["thumbnail_url"],
-                description=v_data["description"][:MAX_DESCRIPTION_LENGTH],
-                published_at=v_data["published_at"],
-                duration_seconds=v_data.get("duration_seconds", 0),
-                category=category
+        Returns:
+            Dictionary with scanned/changed counts and the changes per category
+        """
+        started = time.perf_counter()
+        query = (
+            select(Video.id, Video.collection_id, Video.title, Video.duration_seconds, Video.category)
+            .where(Video.category_manual.is_(False))
+            .execution_options(yield_per=RECLASSIFY_STREAM_CHUNK_SIZE)
+        )
+        if collection_id is not None:
+            query = query.where(Video.collection_id == collection_id)
+        
+        # (collection_id, old category, new category) -> video IDs
+        changes: Dict[Tuple[Optional[int], VideoCategory, VideoCategory], List[int]] = {}
+        scanned_count = 0
+        result = await session.stream(query)
+        async for chunk in result.partitions():
+            new_categories = category_classifier.classify_many(
+                [row.title for row in chunk], [row.duration_seconds for row in chunk]
             )
-            session.add(new_video)
-            imported_count += 1
+            for row, new_category in zip(chunk, new_categories):
+                old_category = VideoCategory(row.category)
+                if new_category != old_category:
+                    changes.setdefault((row.collection_id, old_category, new_category), []).append(row.id)
+            scanned_count += len(chunk)
         
-        await session.commit()
+        changed_count = 0
+        if not dry_run:
+            applied: List[Tuple[List[int], VideoCategory]] = []
+            ids_param = bindparam("ids", type_=ARRAY(Integer))
+            for (cid, old_category, new_category), video_ids in changes.items():
+                updated_ids: List[int] = []
+                for offset in range(0, len(video_ids), RECLASSIFY_UPDATE_CHUNK_SIZE):
+                    # Re-check category and flag so concurrent edits are not overwritten
+                    result = await session.execute(
+                        update(Video)
+                        .where(
+                            Video.id == any_(ids_param),
+                            Video.category == old_category,
+                            Video.category_manual.is_(False)
+                        )
+                        .values(category=new_category)
+                        .returning(Video.id)
+                        .execution_options(synchronize_session=False),
+                        {"ids": video_ids[offset:offset + RECLASSIFY_UPDATE_CHUNK_SIZE]}
+                    )
+                    updated_ids.extend(result.scalars().all())
+                if cid is not None:
+                    updated = len(updated_ids)
+                    await self.adjust_video_counts(session, cid, {old_category: -updated, new_category: updated})
+                applied.append((updated_ids, new_category))
+                changed_count += len(updated_ids)
+            await session.commit()
+            for updated_ids, new_category in applied:
+                search_index.set_category(updated_ids, new_category)
+            for cid in {cid for cid, _, _ in changes}:
+                if cid is not None:
+                    await response_cache.invalidate_collection(cid)
+        else:
+            changed_count = sum(len(video_ids) for video_ids in changes.values())
         
         return {
-            "message": f"Successfully imported {imported_count} videos.",
-            "imported_count": imported_count
+            "dry_run": dry_run,
+            "scanned_count": scanned_count,
+            "changed_count": changed_count,
+            "changes": [
+                {
+                    "collection_id": cid,
+                    "from_category": old_category,
+                    "to_category": new_category,
+                    "count": len(video_ids),
+                    "sample_video_ids": video_ids[:RECLASSIFY_DIFF_SAMPLE_SIZE]
+                }
+                for (cid, old_category, new_category), video_ids in sorted(
+                    changes.items(), key=lambda item: (item[0][0] or 0, -len(item[1]))
+                )
+            ],
+            "duration_ms": round((time.perf_counter() - started) * 1000, 2)
         }
 
     def _classify_video_category(
@@ -279,38 +781,7 @@ class CollectionService:
         Returns:
             VideoCategory enum value
         """
-        title_upper = title.upper()
-        
-        # 1. Shorts (Duration <= configured threshold)
-        if duration_seconds <= SHORTS_MAX_DURATION_SECONDS:
-            return VideoCategory.SHORTS
-        
-        # 2. FANCAM (Priority: Specific type of live/performance)
-        if any(kw in title_upper for kw in CATEGORY_KEYWORDS["FANCAM"]):
-            return VideoCategory.FANCAM
-        
-        # 3. MV
-        if any(kw in title_upper for kw in CATEGORY_KEYWORDS["MV"]):
-            return VideoCategory.MV
-        
-        # 4. LIVE
-        if any(kw in title_upper for kw in CATEGORY_KEYWORDS["LIVE"]):
-            return VideoCategory.LIVE
-        
-        # 5. BEHIND
-        if any(kw in title_upper for kw in CATEGORY_KEYWORDS["BEHIND"]):
-            return VideoCategory.BEHIND
-        
-        # 6. VLOG
-        if any(kw in title_upper for kw in CATEGORY_KEYWORDS["VLOG"]):
-            return VideoCategory.VLOG
-        
-        # 7. INTERVIEW
-        if any(kw in title_upper for kw in CATEGORY_KEYWORDS["INTERVIEW"]):
-            return VideoCategory.INTERVIEW
-        
-        # 8. Default
-        return VideoCategory.ETC
+        return category_classifier.classify(title, duration_seconds)
 
 
 # Singleton instance
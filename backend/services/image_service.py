@@ -0,0 +1,213 @@
+"""
+Image Service
+Decodes uploaded images once and stores resized variants under content-hash names
+"""
+import asyncio
+import hashlib
+import io
+import re
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Union
+
+from PIL import Image, ImageOps, UnidentifiedImageError, features
+from supabase import AsyncClient
+
+from core.config import settings
+from core.constants import (
+    SUPABASE_BUCKET_NAME,
+    IMAGE_VARIANT_WIDTHS,
+    IMAGE_MAX_PIXELS,
+    IMAGE_CACHE_CONTROL_SECONDS
+)
+from core.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+IMAGE_MEDIA_TYPES = {"webp": "image/webp", "avif": "image/avif"}
+# Stored as "{content hash}/{variant}-{width}x{height}.{format}"
+VARIANT_NAME_PATTERN = re.compile(r"^(?P<name>[a-z]+)-(?P<width>\d+)x(?P<height>\d+)\.(?P<format>[a-z]+)$")
+
+
+@dataclass
+class ImageVariant:
+    """An encoded, resized copy of an uploaded image"""
+    name: str
+    width: int
+    height: int
+    data: bytes = b""
+
+
+class ImageService:
+    """
+    Service class for uploaded images.
+
+    Every upload is decoded once and written as one variant per IMAGE_VARIANT_WIDTHS
+    entry. Objects live under a hash of the original bytes (and the variant settings),
+    so uploading the same picture again finds the existing variants and skips both
+    the encoding and the upload.
+
+    Decoding/encoding runs on a dedicated pool of IMAGE_PROCESSING_WORKERS threads and
+    storage calls use the async Supabase client, so uploads never block the event loop.
+    At most STORAGE_MAX_CONCURRENT_UPLOADS objects are uploaded at once.
+    """
+
+    def __init__(self):
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._upload_slots = asyncio.Semaphore(max(1, settings.STORAGE_MAX_CONCURRENT_UPLOADS))
+        self.image_format = settings.IMAGE_FORMAT.lower()
+        if self.image_format not in IMAGE_MEDIA_TYPES:
+            logger.warning(f"Unknown IMAGE_FORMAT={settings.IMAGE_FORMAT}; using webp")
+            self.image_format = "webp"
+        elif self.image_format == "avif" and not features.check("avif"):
+            logger.warning("IMAGE_FORMAT=avif but Pillow was built without AVIF support; using webp")
+            self.image_format = "webp"
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=max(1, settings.IMAGE_PROCESSING_WORKERS),
+                thread_name_prefix="image"
+            )
+        return self._executor
+
+    def close(self) -> None:
+        """
+        Stops the image processing threads. Called on app shutdown.
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    @staticmethod
+    def new_digest(data: bytes = b""):
+        """Digest of an upload's bytes; feed it chunk by chunk as they arrive"""
+        return hashlib.blake2b(data, digest_size=16)
+
+    def content_hash(self, digest) -> str:
+        """
+        Storage folder for an upload: changes with the bytes or with the variant settings
+        """
+        digest = digest.copy()
+        digest.update(f"{self.image_format}:{settings.IMAGE_QUALITY}:{sorted(IMAGE_VARIANT_WIDTHS.items())}".encode())
+        return digest.hexdigest()
+
+    def render_variants(self, source: Union[bytes, str]) -> List[ImageVariant]:
+        """
+        Decode an image once and encode every variant (CPU-bound; runs on the executor)
+
+        Args:
+            source: Original image bytes, or the path of a file holding them
+
+        Returns:
+            Variants from largest to smallest
+
+        Raises:
+            ValueError: If the data is not a supported image or is too large
+        """
+        try:
+            with Image.open(io.BytesIO(source) if isinstance(source, bytes) else source) as original:
+                if original.width * original.height > IMAGE_MAX_PIXELS:
+                    raise ValueError("Image is too large")
+                # JPEGs can be decoded at 1/2, 1/4 or 1/8 scale; keep at least the largest variant
+                largest = max(IMAGE_VARIANT_WIDTHS.values())
+                original.draft("RGB", (largest, largest))
+                image = ImageOps.exif_transpose(original)
+                has_alpha = image.mode in ("RGBA", "LA") or (image.mode == "P" and "transparency" in image.info)
+                image = image.convert("RGBA" if has_alpha else "RGB")
+        except (UnidentifiedImageError, Image.DecompressionBombError, OSError) as e:
+            raise ValueError(f"Unsupported or corrupt image: {e}")
+
+        variants = []
+        # Each variant is resized from the previous (larger) one
+        for name, max_width in sorted(IMAGE_VARIANT_WIDTHS.items(), key=lambda item: item[1], reverse=True):
+            if image.width > max_width:
+                height = max(1, round(image.height * max_width / image.width))
+                image = image.resize((max_width, height), Image.Resampling.LANCZOS, reducing_gap=3.0)
+            buffer = io.BytesIO()
+            image.save(buffer, format=self.image_format.upper(), quality=settings.IMAGE_QUALITY)
+            variants.append(ImageVariant(name, image.width, image.height, buffer.getvalue()))
+        return variants
+
+    async def store_image(
+        self,
+        supabase: AsyncClient,
+        source: Union[bytes, str],
+        digest=None
+    ) -> Dict[str, Any]:
+        """
+        Store the variants of an uploaded image, reusing them if already stored
+
+        Args:
+            supabase: Supabase client
+            source: Original image bytes, or the path of a file holding them
+            digest: new_digest() fed with the original bytes (computed from source bytes if omitted)
+
+        Returns:
+            Dictionary with the largest variant's URL, every variant (url, width,
+            height), a srcset string, the content hash and whether it was a duplicate
+
+        Raises:
+            ValueError: If the data is not a supported image or is too large
+        """
+        bucket = supabase.storage.from_(SUPABASE_BUCKET_NAME)
+        content_hash = self.content_hash(digest or self.new_digest(source))
+
+        existing = await bucket.list(content_hash)
+        variants = self._parse_stored_variants(existing)
+        deduplicated = variants is not None
+        if not deduplicated:
+            loop = asyncio.get_running_loop()
+            variants = await loop.run_in_executor(self.executor, self.render_variants, source)
+            await asyncio.gather(*(self._upload_variant(bucket, content_hash, variant) for variant in variants))
+
+        urls = {}
+        for variant in variants:
+            urls[variant.name] = {
+                "url": await bucket.get_public_url(self._object_path(content_hash, variant)),
+                "width": variant.width,
+                "height": variant.height
+            }
+        largest = max(variants, key=lambda variant: variant.width)
+        return {
+            "url": urls[largest.name]["url"],
+            "variants": urls,
+            # Small images give several variants of the same width; srcset needs unique widths
+            "srcset": ", ".join(
+                f"{info['url']} {width}w"
+                for width, info in {info["width"]: info for info in urls.values()}.items()
+            ),
+            "content_hash": content_hash,
+            "deduplicated": deduplicated
+        }
+
+    async def _upload_variant(self, bucket, content_hash: str, variant: ImageVariant) -> None:
+        async with self._upload_slots:
+            await bucket.upload(
+                path=self._object_path(content_hash, variant),
+                file=variant.data,
+                file_options={
+                    "content-type": IMAGE_MEDIA_TYPES[self.image_format],
+                    "cache-control": str(IMAGE_CACHE_CONTROL_SECONDS),
+                    "upsert": "true"  # Replaces variants left by an interrupted upload
+                }
+            )
+
+    def _object_path(self, content_hash: str, variant: ImageVariant) -> str:
+        return f"{content_hash}/{variant.name}-{variant.width}x{variant.height}.{self.image_format}"
+
+    def _parse_stored_variants(self, objects: List[dict]) -> Optional[List[ImageVariant]]:
+        """Variants already in storage, or None unless every configured variant is there"""
+        stored = {}
+        for obj in objects:
+            match = VARIANT_NAME_PATTERN.match(obj.get("name", ""))
+            if match and match["format"] == self.image_format and match["name"] in IMAGE_VARIANT_WIDTHS:
+                stored[match["name"]] = ImageVariant(match["name"], int(match["width"]), int(match["height"]))
+        if len(stored) != len(IMAGE_VARIANT_WIDTHS):
+            return None
+        return sorted(stored.values(), key=lambda variant: variant.width, reverse=True)
+
+
+# Singleton instance
+image_service = ImageService()
@@ -0,0 +1,253 @@
+"""
+Ingest Service
+Bulk-loads curated videos from streamed NDJSON or CSV without calling YouTube
+"""
+import codecs
+import csv
+import json
+import time
+from datetime import timezone
+from typing import AsyncIterator, Dict, List, Optional, Set, Tuple
+
+from pydantic import TypeAdapter, ValidationError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.constants import (
+    IMPORT_BATCH_SIZE,
+    INGEST_MAX_CSV_RECORD_CHARS,
+    INGEST_MAX_REPORTED_ERRORS,
+    MAX_DESCRIPTION_LENGTH
+)
+from schemas.video_schemas import VideoCreate
+from services.category_classifier import category_classifier
+from services.collection_service import collection_service
+
+video_batch_adapter = TypeAdapter(List[VideoCreate])
+
+# (line number, parsed record or None, parse error or None)
+Record = Tuple[int, Optional[dict], Optional[str]]
+
+
+async def iter_lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[str]:
+    """Decode a byte stream into lines (UTF-8, optional BOM, LF or CRLF)"""
+    decoder = codecs.getincrementaldecoder("utf-8-sig")(errors="replace")
+    buffer = ""
+    async for chunk in chunks:
+        buffer += decoder.decode(chunk)
+        *lines, buffer = buffer.split("\n")
+        for line in lines:
+            yield line.rstrip("\r")
+    buffer += decoder.decode(b"", final=True)
+    if buffer:
+        yield buffer.rstrip("\r")
+
+
+async def iter_ndjson_records(chunks: AsyncIterator[bytes]) -> AsyncIterator[Record]:
+    """One JSON object per line; blank lines are ignored"""
+    line_number = 0
+    async for line in iter_lines(chunks):
+        line_number += 1
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError as e:
+            yield line_number, None, f"Invalid JSON: {e.msg}"
+            continue
+        if not isinstance(record, dict):
+            yield line_number, None, "Expected a JSON object"
+            continue
+        yield line_number, record, None
+
+
+def _quote_state_after(line: str, in_quotes: bool) -> bool:
+    """
+    Whether a CSV record is still inside a quoted field at the end of `line`
+
+    As in csv.reader, a quote only opens a quoted field at the start of a field, so a
+    stray quote inside an unquoted cell (12" Remix) does not. `in_quotes` is the state
+    carried over from the previous line of the same record.
+    """
+    field_start = not in_quotes
+    i = 0
+    while i < len(line):
+        char = line[i]
+        if in_quotes:
+            if char == '"':
+                if line[i + 1:i + 2] == '"':
+                    i += 1  # Escaped quote
+                else:
+                    in_quotes = False
+        elif char == '"' and field_start:
+            in_quotes = True
+            field_start = False
+        else:
+            field_start = char == ","
+        i += 1
+    return in_quotes
+
+
+async def iter_csv_records(chunks: AsyncIterator[bytes]) -> AsyncIterator[Record]:
+    """CSV with a header row; empty cells count as missing values"""
+    header: Optional[List[str]] = None
+    pending: List[str] = []
+    pending_chars = 0
+    in_quotes = False
+    start_line = 0
+    line_number = 0
+    async for line in iter_lines(chunks):
+        line_number += 1
+        if not pending:
+            start_line = line_number
+        pending.append(line)
+        pending_chars += len(line) + 1
+        # A quoted field may span lines; wait until it is closed
+        in_quotes = _quote_state_after(line, in_quotes)
+        if in_quotes:
+            if pending_chars > INGEST_MAX_CSV_RECORD_CHARS:
+                yield start_line, None, f"Record is longer than {INGEST_MAX_CSV_RECORD_CHARS} characters (unclosed quote?)"
+                pending, pending_chars, in_quotes = [], 0, False
+            continue
+        values = next(csv.reader(["\n".join(pending)]), [])
+        pending, pending_chars = [], 0
+        if header is None:
+            header = [name.strip() for name in values]
+            continue
+        if not any(values):
+            continue
+        if len(values) != len(header):
+            yield start_line, None, f"Expected {len(header)} columns, got {len(values)}"
+            continue
+        yield start_line, {name: value for name, value in zip(header, values) if value != ""}, None
+    if pending:
+        yield start_line, None, "Unterminated quoted field"
+
+
+class IngestService:
+    """Service class for bulk video ingest"""
+
+    async def ingest(
+        self,
+        session: AsyncSession,
+        collection_id: int,
+        chunks: AsyncIterator[bytes],
+        ingest_format: str
+    ) -> dict:
+        """
+        Load videos shaped like VideoCreate into a collection
+
+        Rows are validated and inserted in IMPORT_BATCH_SIZE batches (multi-row
+        INSERT ... ON CONFLICT DO NOTHING, one commit per batch). Rows without a
+        category are classified from title and duration. Invalid rows are reported
+        with their line number and do not stop the load.
+
+        Args:
+            session: Database session
+            collection_id: Collection ID
+            chunks: Raw request/file body
+            ingest_format: "ndjson" or "csv"
+
+        Returns:
+            Dictionary with counts, rows/sec and per-row errors
+        """
+        started = time.perf_counter()
+        report = {
+            "total_rows": 0,
+            "imported_count": 0,
+            "duplicate_count": 0,  # Repeated youtube_video_id within the load
+            "skipped_count": 0,  # Already in the collection
+            "error_count": 0,
+            "errors": [],
+            "batches": []
+        }
+        seen: Set[str] = set()
+        batch: List[Tuple[int, dict]] = []
+
+        records = iter_csv_records(chunks) if ingest_format == "csv" else iter_ndjson_records(chunks)
+        async for line_number, record, error in records:
+            report["total_rows"] += 1
+            if error:
+                self._add_error(report, line_number, error)
+                continue
+            batch.append((line_number, record))
+            if len(batch) >= IMPORT_BATCH_SIZE:
+                await self._write_batch(session, collection_id, batch, seen, report)
+                batch = []
+        if batch:
+            await self._write_batch(session, collection_id, batch, seen, report)
+
+        report["errors"].sort(key=lambda error: error["line"])
+        duration = time.perf_counter() - started
+        report["duration_ms"] = round(duration * 1000, 2)
+        report["rows_per_sec"] = round(report["total_rows"] / duration, 1) if duration > 0 else 0.0
+        return report
+
+    async def _write_batch(
+        self,
+        session: AsyncSession,
+        collection_id: int,
+        batch: List[Tuple[int, dict]],
+        seen: Set[str],
+        report: dict
+    ) -> None:
+        records = [record for _, record in batch]
+        try:
+            videos = video_batch_adapter.validate_python(records)
+        except ValidationError as e:
+            # Validate the whole batch once; on failure drop the failing rows and re-validate
+            bad: Dict[int, str] = {}
+            for err in e.errors():
+                index = err["loc"][0]
+                field = ".".join(str(part) for part in err["loc"][1:]) or "row"
+                bad.setdefault(index, f"{field}: {err['msg']}")
+            for index, message in bad.items():
+                self._add_error(report, batch[index][0], message)
+            batch = [item for index, item in enumerate(batch) if index not in bad]
+            records = [record for _, record in batch]
+            videos = video_batch_adapter.validate_python(records)
+
+        rows = []
+        for (_, record), video in zip(batch, videos):
+            if video.youtube_video_id in seen:
+                report["duplicate_count"] += 1
+                continue
+            seen.add(video.youtube_video_id)
+
+            published_at = video.published_at
+            if published_at.tzinfo is not None:
+                published_at = published_at.astimezone(timezone.utc).replace(tzinfo=None)
+            category_manual = bool(record.get("category"))
+            row = {
+                "collection_id": collection_id,
+                "youtube_video_id": video.youtube_video_id,
+                "title": video.title,
+                "channel_name": video.channel_name,
+                "thumbnail_url": video.thumbnail_url,
+                "description": (video.description or "")[:MAX_DESCRIPTION_LENGTH],
+                "comment": video.comment,
+                "category": video.category,
+                "category_manual": category_manual,
+                "duration_seconds": video.duration_seconds,
+                "published_at": published_at
+            }
+            if not category_manual:
+                row["category"] = category_classifier.classify(video.title, video.duration_seconds)
+            rows.append(row)
+
+        if not rows:
+            return
+        batches, inserted_count = await collection_service.insert_videos(session, collection_id, rows)
+        for result in batches:
+            result["batch"] = len(report["batches"]) + 1
+            report["batches"].append(result)
+        report["imported_count"] += inserted_count
+        report["skipped_count"] += len(rows) - inserted_count
+
+    def _add_error(self, report: dict, line_number: int, message: str) -> None:
+        report["error_count"] += 1
+        if len(report["errors"]) < INGEST_MAX_REPORTED_ERRORS:
+            report["errors"].append({"line": line_number, "error": message})
+
+
+# Singleton instance
+ingest_service = IngestService()
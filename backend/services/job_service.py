@@ -0,0 +1,344 @@
+"""
+Import Job Service
+Runs channel imports in the background with progress polling, cancellation and resume
+"""
+import asyncio
+import json
+import os
+import uuid
+from datetime import datetime
+from enum import Enum
+from typing import Dict, List, Optional
+
+from pydantic import BaseModel
+
+from core.config import settings
+from core.constants import IMPORT_JOB_STATE_FLUSH_SECONDS
+from core.database import get_session_context
+from core.logger import setup_logger
+from services.collection_service import collection_service
+
+logger = setup_logger(__name__)
+
+
+class JobStatus(str, Enum):
+    QUEUED = "QUEUED"
+    RUNNING = "RUNNING"
+    SUCCEEDED = "SUCCEEDED"
+    FAILED = "FAILED"
+    CANCELLED = "CANCELLED"
+
+
+FINISHED_STATUSES = {JobStatus.SUCCEEDED, JobStatus.FAILED, JobStatus.CANCELLED}
+
+
+class ImportJob(BaseModel):
+    """State of a background channel import"""
+    id: str
+    collection_id: int
+    status: JobStatus = JobStatus.QUEUED
+
+    # Import parameters
+    limit: int
+    custom_channel_url: Optional[str] = None
+    default_category: Optional[str] = None
+    incremental: bool = False
+
+    # Progress (accumulated across resumed runs)
+    expected_count: Optional[int] = None
+    fetched_count: int = 0
+    imported_count: int = 0
+    skipped_count: int = 0
+    checkpoint_page_token: Optional[str] = None  # Next page after the last committed batch
+    # Counts as of the last commit, so a resumed run does not double count
+    committed_fetched_count: int = 0
+    committed_imported_count: int = 0
+    committed_skipped_count: int = 0
+
+    error: Optional[str] = None
+    cancel_requested: bool = False
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    updated_at: datetime
+
+
+class InMemoryJobStore:
+    """
+    Job store kept in process memory.
+
+    When `state_path` is set, changes are snapshotted to a JSON file so unfinished
+    jobs survive a restart. Snapshots are written off the event loop and at most
+    every IMPORT_JOB_STATE_FLUSH_SECONDS, so saves in between are coalesced into
+    one write; call `close()` on shutdown to write the last changes. Swap for a
+    Postgres-backed store with the same methods to share jobs between workers.
+    """
+
+    def __init__(self, state_path: Optional[str] = None):
+        self._jobs: Dict[str, ImportJob] = {}
+        self._state_path = state_path
+        self._dirty = False
+        self._flush_task: Optional[asyncio.Task] = None
+        self._write_lock = asyncio.Lock()
+        self._load()
+
+    def get(self, job_id: str) -> Optional[ImportJob]:
+        return self._jobs.get(job_id)
+
+    def list(self) -> List[ImportJob]:
+        return sorted(self._jobs.values(), key=lambda job: job.created_at, reverse=True)
+
+    def list_unfinished(self) -> List[ImportJob]:
+        return [job for job in self.list() if job.status not in FINISHED_STATUSES]
+
+    def save(self, job: ImportJob, persist: bool = True) -> None:
+        """
+        Store a job change
+
+        Args:
+            job: Changed job
+            persist: Whether the change must reach the state file; progress that a
+                resumed run recomputes from the checkpoint can skip it
+        """
+        job.updated_at = datetime.utcnow()
+        self._jobs[job.id] = job
+        if not persist or not self._state_path:
+            return
+        self._dirty = True
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_later())
+
+    async def flush(self) -> bool:
+        """
+        Write the current jobs to the state file if anything changed
+
+        Returns:
+            False if the write failed (the changes stay pending)
+        """
+        async with self._write_lock:
+            if not self._dirty:
+                return True
+            self._dirty = False
+            # Snapshot on the event loop so the jobs are not read while being changed
+            snapshot = [job.model_dump(mode="json") for job in self._jobs.values()]
+            try:
+                await asyncio.to_thread(self._write, snapshot)
+            except Exception as e:
+                self._dirty = True
+                logger.error(f"Failed to write import job state to {self._state_path}: {e}")
+                return False
+            return True
+
+    async def close(self) -> None:
+        """
+        Write pending changes and stop the background writer
+        """
+        await self.flush()
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            await asyncio.gather(self._flush_task, return_exceptions=True)
+            self._flush_task = None
+
+    async def _flush_later(self) -> None:
+        # Saves made while a write is running set _dirty again and are picked up next round
+        while self._dirty:
+            await asyncio.sleep(IMPORT_JOB_STATE_FLUSH_SECONDS)
+            if not await self.flush():
+                return
+
+    def _load(self) -> None:
+        if not self._state_path or not os.path.exists(self._state_path):
+            return
+        try:
+            with open(self._state_path, encoding="utf-8") as f:
+                for data in json.load(f):
+                    job = ImportJob.model_validate(data)
+                    self._jobs[job.id] = job
+        except Exception as e:
+            logger.error(f"Failed to load import job state from {self._state_path}: {e}")
+
+    def _write(self, snapshot: List[dict]) -> None:
+        directory = os.path.dirname(self._state_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{self._state_path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(snapshot, f)
+        os.replace(tmp_path, self._state_path)
+
+
+class ImportJobRunner:
+    """Bounded pool of workers that run channel imports from a queue"""
+
+    def __init__(self, store: InMemoryJobStore, workers: int):
+        self.store = store
+        self._workers = workers
+        self._queue: asyncio.Queue = asyncio.Queue()
+        self._worker_tasks: List[asyncio.Task] = []
+        self._running: Dict[str, asyncio.Task] = {}
+
+    async def start(self) -> None:
+        """
+        Start workers and re-queue jobs interrupted by a previous shutdown
+        """
+        if self._worker_tasks:
+            return
+        self._worker_tasks = [
+            asyncio.create_task(self._worker()) for _ in range(self._workers)
+        ]
+        for job in reversed(self.store.list_unfinished()):
+            if job.cancel_requested:
+                self._finish(job, JobStatus.CANCELLED)
+                continue
+            logger.info(f"Resuming import job {job.id} from page token {job.checkpoint_page_token}")
+            self._reset_to_checkpoint(job)
+            self._queue.put_nowait(job.id)
+
+    async def stop(self) -> None:
+        """
+        Stop workers. Running jobs stay unfinished so they resume on next start.
+        """
+        for task in self._worker_tasks:
+            task.cancel()
+        await asyncio.gather(*self._worker_tasks, return_exceptions=True)
+        self._worker_tasks = []
+        self._running.clear()
+        # Jobs interrupted above were saved as QUEUED; write them before exiting
+        await self.store.close()
+
+    def submit(
+        self,
+        collection_id: int,
+        limit: int,
+        custom_channel_url: Optional[str] = None,
+        default_category: Optional[str] = None,
+        incremental: bool = False
+    ) -> ImportJob:
+        """
+        Queue a channel import and return its job immediately
+        """
+        now = datetime.utcnow()
+        job = ImportJob(
+            id=uuid.uuid4().hex,
+            collection_id=collection_id,
+            limit=limit,
+            custom_channel_url=custom_channel_url,
+            default_category=default_category,
+            incremental=incremental,
+            created_at=now,
+            updated_at=now
+        )
+        self.store.save(job)
+        self._queue.put_nowait(job.id)
+        return job
+
+    def get(self, job_id: str) -> Optional[ImportJob]:
+        return self.store.get(job_id)
+
+    def list(self) -> List[ImportJob]:
+        return self.store.list()
+
+    def cancel(self, job_id: str) -> Optional[ImportJob]:
+        """
+        Cancel a queued or running job. Batches already committed are kept.
+        """
+        job = self.store.get(job_id)
+        if not job or job.status in FINISHED_STATUSES:
+            return job
+        job.cancel_requested = True
+        task = self._running.get(job_id)
+        if task:
+            task.cancel()
+        else:
+            self._finish(job, JobStatus.CANCELLED)
+        return job
+
+    async def _worker(self) -> None:
+        while True:
+            job_id = await self._queue.get()
+            job = self.store.get(job_id)
+            if not job or job.status in FINISHED_STATUSES:
+                continue
+            task = asyncio.create_task(self._run(job))
+            self._running[job_id] = task
+            try:
+                await task
+            except asyncio.CancelledError:
+                # Re-raise only when the worker itself is being stopped
+                if asyncio.current_task().cancelling():
+                    raise
+            finally:
+                self._running.pop(job_id, None)
+
+    async def _run(self, job: ImportJob) -> None:
+        job.status = JobStatus.RUNNING
+        job.started_at = job.started_at or datetime.utcnow()
+        self.store.save(job)
+
+        # Counts committed by earlier runs; progress from this run is added on top
+        base_fetched = job.committed_fetched_count
+        base_imported = job.committed_imported_count
+        base_skipped = job.committed_skipped_count
+
+        async def on_progress(progress: dict) -> None:
+            job.expected_count = job.expected_count or progress["expected_count"]
+            job.fetched_count = base_fetched + progress["fetched_count"]
+            job.imported_count = base_imported + progress["imported_count"]
+            job.skipped_count = base_skipped + progress["skipped_count"]
+            # Only checkpoints need to be persisted: a resumed run restarts from the last one
+            checkpointed = progress["checkpoint_page_token"] != job.checkpoint_page_token
+            if checkpointed:
+                self._commit_checkpoint(job, progress["checkpoint_page_token"])
+            self.store.save(job, persist=checkpointed)
+
+        try:
+            async with get_session_context() as session:
+                await collection_service.import_videos_from_channel(
+                    session,
+                    job.collection_id,
+                    limit=max(job.limit - base_fetched, 0),
+                    custom_channel_url=job.custom_channel_url,
+                    default_category=job.default_category,
+                    page_token=job.checkpoint_page_token,
+                    on_progress=on_progress,
+                    incremental=job.incremental
+                )
+            self._finish(job, JobStatus.SUCCEEDED)
+        except asyncio.CancelledError:
+            if job.cancel_requested:
+                self._reset_to_checkpoint(job)
+                self._finish(job, JobStatus.CANCELLED)
+            else:
+                # Shutdown: leave the job resumable from its checkpoint
+                self._reset_to_checkpoint(job)
+                job.status = JobStatus.QUEUED
+                self.store.save(job)
+            raise
+        except Exception as e:
+            logger.exception(f"Import job {job.id} failed: {e}")
+            self._reset_to_checkpoint(job)
+            job.error = str(e)
+            self._finish(job, JobStatus.FAILED)
+
+    def _commit_checkpoint(self, job: ImportJob, page_token: Optional[str]) -> None:
+        job.checkpoint_page_token = page_token
+        job.committed_fetched_count = job.fetched_count
+        job.committed_imported_count = job.imported_count
+        job.committed_skipped_count = job.skipped_count
+
+    def _reset_to_checkpoint(self, job: ImportJob) -> None:
+        job.fetched_count = job.committed_fetched_count
+        job.imported_count = job.committed_imported_count
+        job.skipped_count = job.committed_skipped_count
+
+    def _finish(self, job: ImportJob, status: JobStatus) -> None:
+        job.status = status
+        job.finished_at = datetime.utcnow()
+        self.store.save(job)
+
+
+# Singleton instance
+import_job_runner = ImportJobRunner(
+    InMemoryJobStore(settings.IMPORT_JOBS_STATE_PATH or None),
+    workers=settings.IMPORT_JOB_WORKERS
+)
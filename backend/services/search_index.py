@@ -0,0 +1,378 @@
+"""
+Search Index
+In-process inverted index over video titles, channel names and comments.
+Used by SearchService when SEARCH_BACKEND is "memory" (no Postgres extensions needed).
+"""
+import heapq
+import re
+import sys
+import time
+from array import array
+from bisect import bisect_left, insort
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+
+from core.constants import SEARCH_INDEX_BUILD_CHUNK_SIZE, SEARCH_INDEX_MAX_DEAD_RATIO
+from core.logger import setup_logger
+from core.models import Video, VideoCategory
+
+logger = setup_logger(__name__)
+
+WORD_PATTERN = re.compile(r"\w+")
+# Hangul, CJK ideographs and kana: scripts written without spaces between words
+CJK_PATTERN = re.compile(r"[ᄀ-ᇿ぀-ヿ㄰-㆏㐀-䶿一-鿿가-힯]+")
+
+CATEGORIES = list(VideoCategory)
+CATEGORY_CODES = {category: code for code, category in enumerate(CATEGORIES)}
+NO_COLLECTION = -1
+DEAD = -1
+# Field weights of a matching token, mirroring the Postgres search_vector ('A' title, 'B' comment)
+TITLE_WEIGHT = 1.0
+OTHER_WEIGHT = 0.4
+
+
+def tokenize(text: Optional[str]) -> Set[str]:
+    """
+    Split text into index tokens
+
+    Latin words are kept whole (lowercased). CJK runs are split into overlapping
+    bigrams, so "민지직캠" indexes 민지/지직/직캠 and a search for 직캠 finds it.
+
+    Args:
+        text: Text to tokenize
+
+    Returns:
+        Set of tokens
+    """
+    tokens: Set[str] = set()
+    if not text:
+        return tokens
+    for word in WORD_PATTERN.findall(text.lower()):
+        position = 0
+        for run in CJK_PATTERN.finditer(word):
+            if run.start() > position:
+                tokens.add(word[position:run.start()])
+            cjk = run.group()
+            if len(cjk) == 1:
+                tokens.add(cjk)
+            else:
+                tokens.update(cjk[i:i + 2] for i in range(len(cjk) - 1))
+            position = run.end()
+        if position < len(word):
+            tokens.add(word[position:])
+    return tokens
+
+
+class SearchIndex:
+    """
+    Inverted index from tokens to document numbers.
+
+    Every indexed version of a video gets a new document number, so postings are
+    append-only `array('i')` lists that stay sorted. Each entry is `docno << 1`, with
+    the low bit set when the token occurs in the title. Updating or deleting a video
+    marks its old document dead; dead documents are dropped by compaction once they
+    make up more than SEARCH_INDEX_MAX_DEAD_RATIO of the index. Per-document video ID,
+    collection ID and category are kept in parallel arrays.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.build_seconds: Optional[float] = None
+        self.built_at: Optional[datetime] = None
+        self._reset()
+
+    def _reset(self) -> None:
+        self._postings: Dict[str, array] = {}
+        self._sorted_tokens: Optional[List[str]] = None  # For prefix lookups; built on first search
+        self._doc_video = array("i")  # docno -> video ID (DEAD once replaced or deleted)
+        self._doc_collection = array("i")  # docno -> collection ID
+        self._doc_category = array("b")  # docno -> index into CATEGORIES
+        self._video_doc: Dict[int, int] = {}  # video ID -> live docno
+        self._dead = 0
+
+    async def build(self, session: AsyncSession) -> None:
+        """
+        Build the index from the videos table with a streamed query
+
+        Args:
+            session: Database session
+        """
+        started = time.perf_counter()
+        self._reset()
+        result = await session.stream(
+            select(Video.id, Video.collection_id, Video.category, Video.title, Video.channel_name, Video.comment)
+            .order_by(Video.id)
+            .execution_options(yield_per=SEARCH_INDEX_BUILD_CHUNK_SIZE)
+        )
+        async for chunk in result.partitions():
+            for row in chunk:
+                self._add(row.id, row.collection_id, row.category, row.title, row.channel_name, row.comment)
+        self.enabled = True
+        self.build_seconds = round(time.perf_counter() - started, 3)
+        self.built_at = datetime.utcnow()
+        logger.info(f"Search index built: {len(self._video_doc)} videos in {self.build_seconds}s")
+
+    def add(self, video: Video) -> None:
+        """Index a new video, or re-index an updated one"""
+        if self.enabled:
+            self._add(video.id, video.collection_id, video.category, video.title, video.channel_name, video.comment)
+            self._maybe_compact()
+
+    def add_many(self, rows: Iterable[dict]) -> None:
+        """Index inserted video rows (dicts with id and the indexed columns)"""
+        if self.enabled:
+            for row in rows:
+                self._add(
+                    row["id"], row["collection_id"], row["category"],
+                    row["title"], row["channel_name"], row.get("comment")
+                )
+            self._maybe_compact()
+
+    def remove(self, video_id: int) -> None:
+        """Drop a deleted video"""
+        if self.enabled:
+            self._kill(video_id)
+            self._maybe_compact()
+
+    def remove_collection(self, collection_id: int) -> None:
+        """Drop every video of a collection"""
+        if not self.enabled:
+            return
+        doc_collection = self._doc_collection
+        for video_id, docno in list(self._video_doc.items()):
+            if doc_collection[docno] == collection_id:
+                self._kill(video_id)
+        self._maybe_compact()
+
+    def set_category(self, video_ids: Iterable[int], category: VideoCategory) -> None:
+        """Record a category change (postings are unaffected)"""
+        if not self.enabled:
+            return
+        code = CATEGORY_CODES[VideoCategory(category)]
+        for video_id in video_ids:
+            docno = self._video_doc.get(video_id)
+            if docno is not None:
+                self._doc_category[docno] = code
+
+    def search(
+        self,
+        query: str,
+        limit: int,
+        collection_id: Optional[int] = None,
+        category: Optional[str] = None,
+        after: Optional[Tuple[float, int]] = None
+    ) -> Tuple[List[Tuple[int, float]], bool]:
+        """
+        Find videos matching every query token as a prefix, most relevant first
+
+        Matches and order follow the Postgres backend's prefix tsquery: each query token
+        scores TITLE_WEIGHT when found in the title (else OTHER_WEIGHT), scaled by how
+        much of the matched word it covers (1.0 for an exact word). The rank is the mean
+        over query tokens; ties are broken by newest (highest ID) first. Unlike Postgres
+        there is no typo-tolerant trigram matching, and ranks are on a different scale,
+        so cursors are not interchangeable between backends.
+
+        Args:
+            query: Search query
+            limit: Maximum number of results to return
+            collection_id: Optional collection filter
+            category: Optional category filter (e.g., 'MV', 'FANCAM', 'ALL')
+            after: (rank, video ID) of the last result of the previous page (keyset cursor)
+
+        Returns:
+            Tuple of ((video ID, rank) pairs, whether more results exist)
+        """
+        tokens = tokenize(query)
+        if not tokens:
+            return [], False
+
+        category_code = None
+        if category and category != "ALL":
+            try:
+                category_code = CATEGORY_CODES[VideoCategory(category)]
+            except ValueError:
+                return [], False
+
+        # Resolve each query token to the index tokens it prefixes; rarest first
+        sorted_tokens = self._get_sorted_tokens()
+        matches = []
+        for token in tokens:
+            matched = []
+            position = bisect_left(sorted_tokens, token)
+            while position < len(sorted_tokens) and sorted_tokens[position].startswith(token):
+                matched.append(sorted_tokens[position])
+                position += 1
+            if not matched:
+                return [], False
+            matches.append((sum(len(self._postings[word]) for word in matched), token, matched))
+        matches.sort()
+
+        scores: Optional[Dict[int, float]] = None
+        for _, token, matched in matches:
+            scores = self._score_token(token, matched, scores)
+            if not scores:
+                return [], False
+
+        doc_video = self._doc_video
+        doc_collection = self._doc_collection
+        doc_category = self._doc_category
+        token_count = len(tokens)
+        results = []
+        for docno, score in scores.items():
+            video_id = doc_video[docno]
+            if video_id == DEAD:
+                continue
+            if collection_id is not None and doc_collection[docno] != collection_id:
+                continue
+            if category_code is not None and doc_category[docno] != category_code:
+                continue
+            rank = round(score / token_count, 6)
+            if after is not None and (rank, video_id) >= after:
+                continue
+            results.append((rank, video_id))
+
+        page = heapq.nlargest(limit + 1, results)
+        return [(video_id, rank) for rank, video_id in page[:limit]], len(page) > limit
+
+    def _score_token(
+        self,
+        token: str,
+        matched: List[str],
+        candidates: Optional[Dict[int, float]]
+    ) -> Dict[int, float]:
+        """
+        Add one query token's best score to each candidate document
+
+        Args:
+            token: Query token
+            matched: Index tokens starting with `token`
+            candidates: Scores so far (documents matching the earlier tokens), or None
+                for the first token
+
+        Returns:
+            Scores of the documents that also match `token`
+        """
+        best: Dict[int, float] = {}
+        for word in matched:
+            quality = len(token) / len(word)
+            title_score = quality * TITLE_WEIGHT
+            other_score = quality * OTHER_WEIGHT
+            for entry in self._postings[word]:
+                docno = entry >> 1
+                if candidates is not None and docno not in candidates:
+                    continue
+                score = title_score if entry & 1 else other_score
+                if score > best.get(docno, 0.0):
+                    best[docno] = score
+        if candidates is None:
+            return best
+        return {docno: candidates[docno] + score for docno, score in best.items()}
+
+    def _get_sorted_tokens(self) -> List[str]:
+        if self._sorted_tokens is None:
+            self._sorted_tokens = sorted(self._postings)
+        return self._sorted_tokens
+
+    def get_stats(self) -> dict:
+        """
+        Index size and build statistics
+
+        Returns:
+            Dictionary with document/token counts, estimated memory and build time
+        """
+        postings_bytes = sum(
+            sys.getsizeof(token) + sys.getsizeof(token_postings)
+            for token, token_postings in self._postings.items()
+        )
+        memory_bytes = (
+            postings_bytes
+            + sys.getsizeof(self._postings)
+            + sys.getsizeof(self._doc_video)
+            + sys.getsizeof(self._doc_collection)
+            + sys.getsizeof(self._doc_category)
+            + sys.getsizeof(self._video_doc)
+        )
+        return {
+            "enabled": self.enabled,
+            "videos": len(self._video_doc),
+            "documents": len(self._doc_video),
+            "dead_documents": self._dead,
+            "tokens": len(self._postings),
+            "postings": sum(len(token_postings) for token_postings in self._postings.values()),
+            "postings_bytes": postings_bytes,
+            "memory_bytes": memory_bytes,
+            "build_seconds": self.build_seconds,
+            "built_at": self.built_at.isoformat() if self.built_at else None
+        }
+
+    def _add(
+        self,
+        video_id: int,
+        collection_id: Optional[int],
+        category: VideoCategory,
+        title: str,
+        channel_name: str,
+        comment: Optional[str]
+    ) -> None:
+        self._kill(video_id)
+        docno = len(self._doc_video)
+        self._doc_video.append(video_id)
+        self._doc_collection.append(NO_COLLECTION if collection_id is None else collection_id)
+        self._doc_category.append(CATEGORY_CODES[VideoCategory(category)])
+        self._video_doc[video_id] = docno
+
+        postings = self._postings
+        title_tokens = tokenize(title)
+        for token in title_tokens | tokenize(channel_name) | tokenize(comment):
+            entry = docno << 1 | (token in title_tokens)
+            token_postings = postings.get(token)
+            if token_postings is None:
+                token = sys.intern(token)
+                postings[token] = array("i", (entry,))
+                if self._sorted_tokens is not None:
+                    insort(self._sorted_tokens, token)
+            else:
+                token_postings.append(entry)
+
+    def _kill(self, video_id: int) -> None:
+        docno = self._video_doc.pop(video_id, None)
+        if docno is not None:
+            self._doc_video[docno] = DEAD
+            self._dead += 1
+
+    def _maybe_compact(self) -> None:
+        if self._dead <= len(self._doc_video) * SEARCH_INDEX_MAX_DEAD_RATIO:
+            return
+        started = time.perf_counter()
+        # Renumber live documents in order, so postings stay sorted
+        remap = array("i", [DEAD]) * len(self._doc_video)
+        doc_video, doc_collection, doc_category = array("i"), array("i"), array("b")
+        for docno, video_id in enumerate(self._doc_video):
+            if video_id == DEAD:
+                continue
+            remap[docno] = len(doc_video)
+            doc_video.append(video_id)
+            doc_collection.append(self._doc_collection[docno])
+            doc_category.append(self._doc_category[docno])
+
+        postings: Dict[str, array] = {}
+        for token, token_postings in self._postings.items():
+            live = array("i", (
+                remap[entry >> 1] << 1 | entry & 1 for entry in token_postings if remap[entry >> 1] != DEAD
+            ))
+            if live:
+                postings[token] = live
+
+        self._postings = postings
+        self._sorted_tokens = None
+        self._doc_video, self._doc_collection, self._doc_category = doc_video, doc_collection, doc_category
+        self._video_doc = {video_id: docno for docno, video_id in enumerate(doc_video)}
+        self._dead = 0
+        logger.info(f"Search index compacted in {time.perf_counter() - started:.3f}s")
+
+
+# Singleton instance
+search_index = SearchIndex()
@@ -0,0 +1,174 @@
+"""
+Search Service
+Full-text and trigram search over videos (requires migrate_add_video_search.py),
+or the in-process search index when SEARCH_BACKEND is "memory"
+"""
+import re
+from typing import List, Optional
+
+from sqlalchemy import Float, cast, func, literal, literal_column, or_, tuple_, String
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+
+from core.config import settings
+from core.constants import SEARCH_MIN_SUBSTRING_LENGTH
+from core.models import Video
+from core.pagination import encode_rank_cursor, decode_rank_cursor
+from services.search_index import search_index
+
+# Generated column added by migrate_add_video_search.py (not mapped on the model so
+# regular video queries do not load it)
+search_vector = literal_column("videos.search_vector", TSVECTOR)
+
+WORD_PATTERN = re.compile(r"\w+")
+
+
+class SearchService:
+    """Service class for video search"""
+
+    def _build_tsquery(self, query: str) -> Optional[str]:
+        """
+        Build a prefix-matching tsquery string (every word must match)
+        
+        Args:
+            query: User search query
+            
+        Returns:
+            tsquery text such as "직캠:* & stage:*", or None if the query has no words
+        """
+        words = WORD_PATTERN.findall(query)
+        if not words:
+            return None
+        return " & ".join(f"{word}:*" for word in words)
+
+    async def search(
+        self,
+        session: AsyncSession,
+        query: str,
+        limit: int,
+        collection_id: Optional[int] = None,
+        category: Optional[str] = None,
+        cursor: Optional[str] = None
+    ) -> dict:
+        """
+        Search videos by title, description and comment
+        
+        A video matches when its search_vector matches every query word (as a prefix),
+        when the query is a typo-tolerant trigram match for a word in the title, or when
+        the title contains the query as a substring. Results are ordered by relevance
+        and paged with a (rank, id) keyset cursor.
+        
+        Args:
+            session: Database session
+            query: Search query
+            limit: Maximum number of results to return
+            collection_id: Optional collection to search in
+            category: Optional category filter (e.g., 'MV', 'FANCAM', 'ALL')
+            cursor: Opaque cursor from a previous page's next_cursor
+            
+        Returns:
+            Dictionary with ranked videos, has_more and next_cursor
+            
+        Raises:
+            ValueError: If the cursor is invalid
+        """
+        query = query.strip()
+        if settings.SEARCH_BACKEND == "memory":
+            return await self._search_memory(session, query, limit, collection_id, category, cursor)
+        
+        tsquery_text = self._build_tsquery(query)
+        if not tsquery_text:
+            return {"query": query, "videos": [], "limit": limit, "has_more": False, "next_cursor": None}
+        
+        tsquery = func.to_tsquery("simple", tsquery_text)
+        conditions = [
+            search_vector.op("@@")(tsquery),
+            Video.title.op("%>")(query)
+        ]
+        # Shorter substrings cannot use the trigram index; the prefix tsquery covers them
+        if len(query) >= SEARCH_MIN_SUBSTRING_LENGTH:
+            escaped = query.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+            conditions.append(Video.title.ilike(f"%{escaped}%", escape="\\"))
+        
+        rank = cast(
+            func.ts_rank_cd(search_vector, tsquery) + func.word_similarity(literal(query), Video.title),
+            Float
+        )
+        rank_column = rank.label("rank")
+        stmt = select(Video, rank_column).where(or_(*conditions))
+        if collection_id is not None:
+            stmt = stmt.where(Video.collection_id == collection_id)
+        if category and category != "ALL":
+            stmt = stmt.where(cast(Video.category, String) == category)
+        if cursor:
+            cursor_rank, cursor_id = decode_rank_cursor(cursor)
+            stmt = stmt.where(tuple_(rank, Video.id) < tuple_(cursor_rank, cursor_id))
+        
+        result = await session.execute(
+            stmt.order_by(rank_column.desc(), Video.id.desc()).limit(limit + 1)
+        )
+        rows = result.all()
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+        
+        videos: List[dict] = [
+            {**video.model_dump(), "rank": video_rank} for video, video_rank in rows
+        ]
+        next_cursor = None
+        if has_more and rows:
+            next_cursor = encode_rank_cursor(rows[-1][1], rows[-1][0].id)
+        
+        return {
+            "query": query,
+            "videos": videos,
+            "limit": limit,
+            "has_more": has_more,
+            "next_cursor": next_cursor
+        }
+
+    async def _search_memory(
+        self,
+        session: AsyncSession,
+        query: str,
+        limit: int,
+        collection_id: Optional[int],
+        category: Optional[str],
+        cursor: Optional[str]
+    ) -> dict:
+        """
+        Search with the in-process index (prefix matching ranked like the Postgres
+        tsquery, without its typo-tolerant trigram matches; see SearchIndex.search)
+        
+        Raises:
+            ValueError: If the cursor is invalid
+        """
+        after = decode_rank_cursor(cursor) if cursor else None
+        hits, has_more = search_index.search(
+            query, limit, collection_id=collection_id, category=category, after=after
+        )
+        videos_by_id = {}
+        if hits:
+            result = await session.execute(select(Video).where(Video.id.in_([video_id for video_id, _ in hits])))
+            videos_by_id = {video.id: video for video in result.scalars().all()}
+        videos = [
+            {**videos_by_id[video_id].model_dump(), "rank": rank}
+            for video_id, rank in hits
+            if video_id in videos_by_id
+        ]
+        
+        next_cursor = None
+        if has_more and hits:
+            next_cursor = encode_rank_cursor(hits[-1][1], hits[-1][0])
+        
+        return {
+            "query": query,
+            "videos": videos,
+            "limit": limit,
+            "has_more": has_more,
+            "next_cursor": next_cursor
+        }
+
+
+# Singleton instance
+search_service = SearchService()
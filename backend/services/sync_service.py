@@ -0,0 +1,265 @@
+"""
+Sync Service
+Periodically refreshes collections from their official YouTube channels within a daily quota budget
+"""
+import asyncio
+import math
+from datetime import datetime, timedelta
+from typing import List, Optional
+
+from sqlalchemy import func
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+
+from core.config import settings
+from core.constants import (
+    DEFAULT_IMPORT_LIMIT,
+    YOUTUBE_MAX_RESULTS_PER_PAGE,
+    SYNC_ACTIVITY_WINDOW_DAYS,
+    SYNC_NEVER_SYNCED_STALENESS_HOURS,
+    SYNC_RESUME_PAGES
+)
+from core.database import get_session_context
+from core.logger import setup_logger
+from core.models import Collection, Video
+from services.collection_service import collection_service
+from services.video_service import video_service
+
+logger = setup_logger(__name__)
+
+# Quota units for resolving a channel: channels?forHandle= (usually cached) + channels?id=
+CHANNEL_LOOKUP_COST = 2
+# Quota units per playlist page: playlistItems + videos?id=
+PAGE_COST = 2
+
+
+class SyncCandidate:
+    """A collection due for sync, with its priority and estimated quota cost"""
+
+    def __init__(
+        self,
+        collection_id: int,
+        title: str,
+        staleness_hours: float,
+        recent_videos: int,
+        estimated_cost: int,
+        resuming: bool = False
+    ):
+        self.collection_id = collection_id
+        self.title = title
+        self.staleness_hours = staleness_hours
+        self.recent_videos = recent_videos
+        self.estimated_cost = estimated_cost
+        self.resuming = resuming
+
+    @property
+    def score(self) -> float:
+        # Stale and active channels first: staleness weighted by recent upload activity
+        return self.staleness_hours * (1 + math.log1p(self.recent_videos))
+
+
+class SyncScheduler:
+    """
+    Syncs every collection with an official_link using incremental imports.
+
+    Collections are ranked by staleness and recent activity, and syncs are only
+    started while the quota spent today plus the estimates of running syncs stays
+    within YOUTUBE_DAILY_QUOTA_BUDGET. Spending is read from the shared
+    youtube_quota_usage table, so YouTube calls made by the API, imports and other
+    sync runs count against the same budget. At most `concurrency` channels sync at once.
+
+    A sync never fetches more pages than its reservation covers. If that cap cuts a
+    walk short of the known videos (more new uploads than estimated), the import saves
+    a resume cursor and the collection stays due until a later run finishes the walk.
+    Run it in one place only (a single API worker or the sync_collections.py CLI).
+    """
+
+    def __init__(
+        self,
+        daily_budget: int,
+        concurrency: int,
+        stale_after_hours: float
+    ):
+        self.daily_budget = daily_budget
+        self.concurrency = concurrency
+        self.stale_after_hours = stale_after_hours
+        self._task: Optional[asyncio.Task] = None
+        self._reserved = 0
+        # Held from the budget check until the reservation is added (the check awaits the DB)
+        self._budget_lock = asyncio.Lock()
+        self.last_run: Optional[dict] = None
+
+    async def remaining_budget(self) -> int:
+        """Daily budget minus units spent today (by every process) and reserved by running syncs"""
+        units_today = await video_service.quota.shared_units_today()
+        return self.daily_budget - units_today - self._reserved
+
+    async def rank_collections(self, session: AsyncSession) -> List[SyncCandidate]:
+        """
+        List collections due for sync, highest priority first
+
+        Args:
+            session: Database session
+
+        Returns:
+            Ranked sync candidates
+        """
+        now = datetime.utcnow()
+        activity_since = now - timedelta(days=SYNC_ACTIVITY_WINDOW_DAYS)
+        recent_videos = (
+            select(Video.collection_id, func.count(Video.id).label("recent_videos"))
+            .where(Video.published_at >= activity_since)
+            .group_by(Video.collection_id)
+            .subquery()
+        )
+        result = await session.execute(
+            select(
+                Collection.id,
+                Collection.title,
+                Collection.video_count,
+                Collection.last_synced_at,
+                Collection.sync_resume_page_token,
+                func.coalesce(recent_videos.c.recent_videos, 0)
+            )
+            .outerjoin(recent_videos, recent_videos.c.collection_id == Collection.id)
+            .where(Collection.official_link.is_not(None), Collection.official_link != "")
+        )
+
+        candidates = []
+        for collection_id, title, video_count, last_synced_at, resume_page_token, recent in result.all():
+            if last_synced_at is None:
+                staleness_hours = SYNC_NEVER_SYNCED_STALENESS_HOURS
+            else:
+                staleness_hours = (now - last_synced_at).total_seconds() / 3600
+            resuming = resume_page_token is not None
+            # An unfinished walk is due right away; otherwise new uploads it missed would wait a day
+            if staleness_hours < self.stale_after_hours and not resuming:
+                continue
+            candidates.append(SyncCandidate(
+                collection_id,
+                title,
+                staleness_hours,
+                recent,
+                self.estimate_cost(video_count, recent, resuming),
+                resuming
+            ))
+        return sorted(candidates, key=lambda c: c.score, reverse=True)
+
+    def estimate_cost(self, video_count: int, recent_videos: int, resuming: bool = False) -> int:
+        """
+        Estimate quota units for an incremental sync
+
+        Args:
+            video_count: Videos already in the collection
+            recent_videos: Videos published in the activity window
+            resuming: The collection has a resume cursor from a capped walk
+
+        Returns:
+            Estimated quota units
+        """
+        if resuming:
+            # The size of the gap is unknown; continue in fixed slices
+            pages = SYNC_RESUME_PAGES
+        elif not video_count:
+            # First import walks the whole uploads playlist
+            pages = math.ceil(DEFAULT_IMPORT_LIMIT / YOUTUBE_MAX_RESULTS_PER_PAGE)
+        else:
+            # New uploads since the last sync plus the page where known videos begin
+            pages = 1 + recent_videos // YOUTUBE_MAX_RESULTS_PER_PAGE
+        return CHANNEL_LOOKUP_COST + pages * PAGE_COST
+
+    async def run_once(self) -> dict:
+        """
+        Sync due collections within the remaining daily budget
+
+        Returns:
+            Run summary (synced, skipped for budget, failed, quota used)
+        """
+        started_units = video_service.quota.units_today
+        async with get_session_context() as session:
+            candidates = await self.rank_collections(session)
+
+        semaphore = asyncio.Semaphore(self.concurrency)
+        summary = {
+            "started_at": datetime.utcnow().isoformat(),
+            "candidates": len(candidates),
+            "synced": [],
+            "skipped_budget": [],
+            "failed": []
+        }
+
+        async def sync(candidate: SyncCandidate) -> None:
+            async with semaphore:
+                # Reserve the estimate before spending so concurrent syncs respect the budget;
+                # the lock keeps other syncs from checking before this reservation is added
+                async with self._budget_lock:
+                    if candidate.estimated_cost > await self.remaining_budget():
+                        summary["skipped_budget"].append(candidate.collection_id)
+                        return
+                    self._reserved += candidate.estimated_cost
+                try:
+                    # Never fetch more pages than the reservation covers
+                    pages = max((candidate.estimated_cost - CHANNEL_LOOKUP_COST) // PAGE_COST, 1)
+                    async with get_session_context() as session:
+                        result = await collection_service.import_videos_from_channel(
+                            session,
+                            candidate.collection_id,
+                            limit=min(DEFAULT_IMPORT_LIMIT, pages * YOUTUBE_MAX_RESULTS_PER_PAGE),
+                            incremental=True
+                        )
+                    summary["synced"].append({
+                        "collection_id": candidate.collection_id,
+                        "imported_count": result["imported_count"]
+                    })
+                except Exception as e:
+                    logger.error(f"Sync failed for collection {candidate.collection_id} ({candidate.title}): {e}")
+                    summary["failed"].append(candidate.collection_id)
+                finally:
+                    self._reserved -= candidate.estimated_cost
+
+        await asyncio.gather(*(sync(candidate) for candidate in candidates))
+
+        summary["quota_units_used"] = video_service.quota.units_today - started_units
+        # Spent today by every process, this run included
+        summary["quota_units_today"] = await video_service.quota.shared_units_today()
+        summary["finished_at"] = datetime.utcnow().isoformat()
+        self.last_run = summary
+        logger.info(
+            f"Sync run: {len(summary['synced'])} synced, {len(summary['skipped_budget'])} over budget, "
+            f"{len(summary['failed'])} failed, {summary['quota_units_used']} quota units"
+        )
+        return summary
+
+    async def run_forever(self, interval_minutes: float) -> None:
+        """
+        Run sync passes on a fixed cadence until cancelled
+
+        Args:
+            interval_minutes: Minutes between runs
+        """
+        while True:
+            try:
+                await self.run_once()
+            except Exception as e:
+                logger.exception(f"Sync run failed: {e}")
+            await asyncio.sleep(interval_minutes * 60)
+
+    def start(self, interval_minutes: float) -> None:
+        """Start the in-process scheduler loop"""
+        if self._task is None:
+            self._task = asyncio.create_task(self.run_forever(interval_minutes))
+
+    async def stop(self) -> None:
+        """Stop the in-process scheduler loop"""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+
+# Singleton instance
+sync_scheduler = SyncScheduler(
+    daily_budget=settings.YOUTUBE_DAILY_QUOTA_BUDGET,
+    concurrency=settings.SYNC_MAX_CONCURRENCY,
+    stale_after_hours=settings.SYNC_STALE_AFTER_HOURS
+)
@@ -0,0 +1,229 @@
+"""
+Thumbnail Service
+Fetches YouTube thumbnails once, downscales them to card sizes and keeps them in a
+bounded on-disk LRU cache
+"""
+import asyncio
+import io
+import os
+import time
+import uuid
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+import httpx
+from PIL import Image, UnidentifiedImageError
+
+from core.config import settings
+from core.constants import YOUTUBE_THUMBNAIL_BASE_URL, YOUTUBE_THUMBNAIL_SOURCES, THUMB_PROXY_SIZES
+from core.exceptions import ExternalAPIError
+from core.logger import setup_logger
+from services.image_service import image_service, IMAGE_MEDIA_TYPES
+from services.video_service import video_service
+
+logger = setup_logger(__name__)
+
+
+class ThumbnailService:
+    """
+    Service class for proxied YouTube thumbnails.
+
+    A thumbnail is fetched from i.ytimg.com through the shared YouTube HTTP client the
+    first time a (video, size) pair is requested, cropped to 16:9, downscaled and
+    encoded in IMAGE_FORMAT on the image thread pool, then written to THUMB_CACHE_DIR.
+    Later requests are served straight from the file. Files are evicted least-recently-
+    used once they exceed THUMB_CACHE_MAX_BYTES; concurrent misses for the same file
+    share one fetch (single-flight).
+
+    The LRU order and byte count live in memory, so the size bound assumes a single
+    process owns THUMB_CACHE_DIR. Other processes sharing the directory keep their own
+    accounting (the disk bound grows with the number of processes) and may delete files
+    this one still lists; such an entry is dropped and fetched again on its next request.
+    On startup the order is rebuilt from file modification times, so files served often
+    before a restart may be evicted early afterwards.
+    """
+
+    def __init__(self):
+        self.cache_dir = settings.THUMB_CACHE_DIR
+        self.max_bytes = settings.THUMB_CACHE_MAX_BYTES
+        self._entries: Optional["OrderedDict[str, int]"] = None  # File name -> size, oldest first
+        self._bytes = 0
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._index_lock = asyncio.Lock()
+        self._stats = {"hits": 0, "misses": 0, "coalesced": 0, "evictions": 0, "upstream_bytes": 0}
+
+    @property
+    def media_type(self) -> str:
+        return IMAGE_MEDIA_TYPES[image_service.image_format]
+
+    async def get_thumbnail(self, video_id: str, size: str) -> Optional[str]:
+        """
+        Returns the path of a cached thumbnail, fetching and resizing it on a miss
+
+        Args:
+            video_id: YouTube video ID (validated by the caller)
+            size: Key of THUMB_PROXY_SIZES
+
+        Returns:
+            File path, or None if YouTube has no thumbnail for the video
+
+        Raises:
+            ExternalAPIError: If YouTube could not be reached
+        """
+        entries = await self._get_index()
+        name = f"{video_id}-{size}.{image_service.image_format}"
+        if name in entries:
+            path = os.path.join(self.cache_dir, name)
+            if os.path.isfile(path):
+                entries.move_to_end(name)
+                self._stats["hits"] += 1
+                return path
+            # Deleted by another process sharing the directory; fetch it again
+            self._bytes -= entries.pop(name)
+
+        inflight = self._inflight.get(name)
+        if inflight is not None:
+            self._stats["coalesced"] += 1
+            return await asyncio.shield(inflight)
+
+        self._stats["misses"] += 1
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[name] = future
+        try:
+            path = await self._load(video_id, THUMB_PROXY_SIZES[size], name)
+        except BaseException as e:
+            if isinstance(e, Exception):
+                future.set_exception(e)
+                # Mark as retrieved when nobody else was waiting
+                future.exception()
+            else:
+                future.cancel()
+            raise
+        else:
+            future.set_result(path)
+            return path
+        finally:
+            self._inflight.pop(name, None)
+
+    async def _load(self, video_id: str, width: int, name: str) -> Optional[str]:
+        source = await self._fetch_source(video_id, width)
+        if source is None:
+            return None
+        loop = asyncio.get_running_loop()
+        data = await loop.run_in_executor(image_service.executor, self.render, source, width)
+        path = os.path.join(self.cache_dir, name)
+        await asyncio.to_thread(self._write_file, path, data)
+        self._add(name, len(data))
+        return path
+
+    async def _fetch_source(self, video_id: str, width: int) -> Optional[bytes]:
+        """Smallest published thumbnail at least `width` wide, else the largest one found"""
+        larger = [source for source, source_width in YOUTUBE_THUMBNAIL_SOURCES if source_width >= width]
+        smaller = [source for source, source_width in reversed(YOUTUBE_THUMBNAIL_SOURCES) if source_width < width]
+        for source in larger + smaller:
+            try:
+                response = await video_service.client.get(f"{YOUTUBE_THUMBNAIL_BASE_URL}/{video_id}/{source}.jpg")
+            except httpx.HTTPError as e:
+                raise ExternalAPIError("Could not fetch YouTube thumbnail", {"video_id": video_id, "error": str(e)})
+            if response.status_code == 200:
+                self._stats["upstream_bytes"] += len(response.content)
+                return response.content
+            if response.status_code != 404:
+                raise ExternalAPIError(
+                    "Could not fetch YouTube thumbnail",
+                    {"video_id": video_id, "status_code": response.status_code}
+                )
+        return None
+
+    def render(self, source: bytes, width: int) -> bytes:
+        """
+        Crop a thumbnail to 16:9 and downscale it to `width` (CPU-bound; runs on the image pool)
+
+        Raises:
+            ExternalAPIError: If YouTube returned something that is not an image
+        """
+        try:
+            with Image.open(io.BytesIO(source)) as original:
+                original.draft("RGB", (width, width))
+                image = original.convert("RGB")
+        except (UnidentifiedImageError, OSError) as e:
+            raise ExternalAPIError("YouTube returned an invalid thumbnail", {"error": str(e)})
+
+        # hqdefault/sddefault are 4:3 with black bars around 16:9 videos
+        crop_height = round(image.width * 9 / 16)
+        if crop_height < image.height:
+            top = (image.height - crop_height) // 2
+            image = image.crop((0, top, image.width, top + crop_height))
+        if image.width > width:
+            image = image.resize((width, max(1, round(image.height * width / image.width))), Image.Resampling.LANCZOS)
+
+        buffer = io.BytesIO()
+        image.save(buffer, format=image_service.image_format.upper(), quality=settings.IMAGE_QUALITY)
+        return buffer.getvalue()
+
+    def _write_file(self, path: str, data: bytes) -> None:
+        # Write then rename, so a file being served is never partially written
+        temp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+        with open(temp_path, "wb") as f:
+            f.write(data)
+        os.replace(temp_path, path)
+
+    async def _get_index(self) -> "OrderedDict[str, int]":
+        if self._entries is None:
+            async with self._index_lock:
+                if self._entries is None:
+                    # Scanning a large cache directory would block the event loop
+                    entries = await asyncio.to_thread(self._scan_cache_dir)
+                    self._entries = entries
+                    self._bytes = sum(entries.values())
+                    self._evict()
+        return self._entries
+
+    def _scan_cache_dir(self) -> "OrderedDict[str, int]":
+        os.makedirs(self.cache_dir, exist_ok=True)
+        files = []
+        with os.scandir(self.cache_dir) as it:
+            for entry in it:
+                if not entry.is_file():
+                    continue
+                stat = entry.stat()
+                if entry.name.endswith(".tmp"):
+                    # Left by an interrupted write (recent ones may be another process's write)
+                    if stat.st_mtime < time.time() - 3600:
+                        os.remove(entry.path)
+                    continue
+                files.append((stat.st_mtime, entry.name, stat.st_size))
+        return OrderedDict((name, size) for _, name, size in sorted(files))
+
+    def _add(self, name: str, size: int) -> None:
+        self._bytes += size - self._entries.pop(name, 0)
+        self._entries[name] = size
+        self._evict()
+
+    def _evict(self) -> None:
+        # Always keep the newest file, even if it alone is over the limit
+        while self._bytes > self.max_bytes and len(self._entries) > 1:
+            name, size = self._entries.popitem(last=False)
+            self._bytes -= size
+            self._stats["evictions"] += 1
+            try:
+                os.remove(os.path.join(self.cache_dir, name))
+            except FileNotFoundError:
+                pass
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Returns cache size and hit/miss counters
+        """
+        lookups = self._stats["hits"] + self._stats["misses"] + self._stats["coalesced"]
+        return {
+            "files": len(self._entries) if self._entries is not None else 0,
+            "bytes": self._bytes,
+            "max_bytes": self.max_bytes,
+            "hit_rate": round(self._stats["hits"] / lookups, 3) if lookups else 0.0,
+            **self._stats
+        }
+
+
+# Singleton instance
+thumbnail_service = ThumbnailService()
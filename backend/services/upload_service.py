@@ -0,0 +1,308 @@
+"""
+Upload Service
+Receives uploads chunk by chunk into temp files (size cap, magic-byte type check)
+and keeps resumable TUS-style upload sessions
+"""
+import asyncio
+import os
+import time
+import uuid
+from dataclasses import dataclass, field
+from typing import AsyncIterator, Dict, List, Optional
+
+from python_multipart.exceptions import MultipartParseError
+from python_multipart.multipart import MultipartParser, parse_options_header
+
+from core.config import settings
+from core.constants import ALLOWED_IMAGE_TYPES
+from core.logger import setup_logger
+from services.image_service import image_service
+
+logger = setup_logger(__name__)
+
+SNIFF_BYTES = 12  # Long enough for every signature below
+IMAGE_SIGNATURES = [
+    (b"\xff\xd8\xff", "image/jpeg"),
+    (b"\x89PNG\r\n\x1a\n", "image/png"),
+    (b"GIF87a", "image/gif"),
+    (b"GIF89a", "image/gif"),
+]
+
+
+def sniff_image_type(head: bytes) -> Optional[str]:
+    """
+    Detect the image type from the first bytes of a file (ignores the declared content type)
+
+    Args:
+        head: First SNIFF_BYTES bytes
+
+    Returns:
+        MIME type, or None if the bytes are not a known image format
+    """
+    for signature, content_type in IMAGE_SIGNATURES:
+        if head.startswith(signature):
+            return content_type
+    if head[:4] == b"RIFF" and head[8:12] == b"WEBP":
+        return "image/webp"
+    return None
+
+
+class UploadRejected(Exception):
+    """An upload was refused (too large, wrong type, malformed or out of sequence)"""
+
+    def __init__(self, status_code: int, detail: str):
+        super().__init__(detail)
+        self.status_code = status_code
+        self.detail = detail
+
+
+class UploadReceiver:
+    """
+    Writes an upload to a temp file as chunks arrive, so memory use is bounded by
+    the chunk size. The type is checked on the first chunk and the size on every chunk.
+    """
+
+    def __init__(self, max_bytes: int):
+        os.makedirs(settings.UPLOAD_TEMP_DIR, exist_ok=True)
+        self.path = os.path.join(settings.UPLOAD_TEMP_DIR, f"{uuid.uuid4().hex}.part")
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.content_type: Optional[str] = None
+        self.digest = image_service.new_digest()
+        self._head = b""
+        self._file = open(self.path, "wb")
+
+    async def write(self, chunk: bytes) -> None:
+        """
+        Append a chunk
+
+        Raises:
+            UploadRejected: If the upload grows past max_bytes or is not an allowed image
+        """
+        if not chunk:
+            return
+        if self.size + len(chunk) > self.max_bytes:
+            raise UploadRejected(413, f"File is larger than {self.max_bytes // (1024 * 1024)} MB")
+        if self.content_type is None:
+            self._head += chunk[:SNIFF_BYTES - len(self._head)]
+            if len(self._head) >= SNIFF_BYTES:
+                self._check_type()
+        self.digest.update(chunk)
+        await asyncio.to_thread(self._file.write, chunk)
+        self.size += len(chunk)
+
+    def finish(self) -> None:
+        """
+        Close the file once every byte was received
+
+        Raises:
+            UploadRejected: If the (short) upload is not an allowed image
+        """
+        if self.content_type is None:
+            self._check_type()
+        self._file.close()
+
+    def discard(self) -> None:
+        """Close and delete the temp file"""
+        self._file.close()
+        try:
+            os.remove(self.path)
+        except FileNotFoundError:
+            pass
+
+    def _check_type(self) -> None:
+        content_type = sniff_image_type(self._head)
+        if content_type not in ALLOWED_IMAGE_TYPES:
+            raise UploadRejected(415, "File must be a JPEG, PNG, GIF or WebP image")
+        self.content_type = content_type
+
+
+@dataclass
+class UploadSession:
+    """A resumable upload: the client PATCHes chunks at increasing offsets"""
+    id: str
+    length: int
+    receiver: UploadReceiver
+    expires_at: float
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+
+    @property
+    def offset(self) -> int:
+        return self.receiver.size
+
+
+class UploadService:
+    """Service class for streamed and resumable uploads"""
+
+    def __init__(self):
+        # Sessions live in this process; a restarted or different worker starts over
+        self._sessions: Dict[str, UploadSession] = {}
+
+    async def receive_multipart_file(
+        self,
+        content_type: str,
+        chunks: AsyncIterator[bytes],
+        field_name: str = "file"
+    ) -> UploadReceiver:
+        """
+        Stream one file field of a multipart/form-data body into a temp file
+
+        Only the current request chunk is held in memory; the type is checked as soon
+        as the file's first bytes arrive and the size cap is enforced while streaming.
+
+        Args:
+            content_type: Request Content-Type header (carries the multipart boundary)
+            chunks: Request body
+            field_name: Form field holding the file
+
+        Returns:
+            Finished receiver (the caller deletes its file)
+
+        Raises:
+            UploadRejected: If the body is malformed, the field is missing, or the file
+                is too large or not an allowed image
+        """
+        media_type, params = parse_options_header(content_type)
+        boundary = params.get(b"boundary")
+        if media_type != b"multipart/form-data" or not boundary:
+            raise UploadRejected(400, "Expected a multipart/form-data body")
+
+        state = {"header_field": b"", "header_value": b"", "headers": {}, "target": False, "found": False}
+        pending: List[bytes] = []
+
+        def on_part_begin() -> None:
+            state["headers"] = {}
+
+        def on_header_field(data: bytes, start: int, end: int) -> None:
+            state["header_field"] += data[start:end]
+
+        def on_header_value(data: bytes, start: int, end: int) -> None:
+            state["header_value"] += data[start:end]
+
+        def on_header_end() -> None:
+            state["headers"][state["header_field"].lower()] = state["header_value"]
+            state["header_field"] = state["header_value"] = b""
+
+        def on_headers_finished() -> None:
+            _, disposition = parse_options_header(state["headers"].get(b"content-disposition", b""))
+            name = disposition.get(b"name", b"").decode("latin-1")
+            state["target"] = name == field_name and not state["found"]
+
+        def on_part_data(data: bytes, start: int, end: int) -> None:
+            if state["target"]:
+                pending.append(data[start:end])
+
+        def on_part_end() -> None:
+            if state["target"]:
+                state["found"] = True
+                state["target"] = False
+
+        parser = MultipartParser(boundary, {
+            "on_part_begin": on_part_begin,
+            "on_header_field": on_header_field,
+            "on_header_value": on_header_value,
+            "on_header_end": on_header_end,
+            "on_headers_finished": on_headers_finished,
+            "on_part_data": on_part_data,
+            "on_part_end": on_part_end,
+        })
+        receiver = UploadReceiver(settings.UPLOAD_MAX_BYTES)
+        try:
+            async for chunk in chunks:
+                parser.write(chunk)
+                for data in pending:
+                    await receiver.write(data)
+                pending.clear()
+            parser.finalize()
+            if not state["found"]:
+                raise UploadRejected(400, f"Missing '{field_name}' file field")
+            receiver.finish()
+        except MultipartParseError as e:
+            receiver.discard()
+            raise UploadRejected(400, f"Malformed multipart body: {e}")
+        except BaseException:
+            receiver.discard()
+            raise
+        return receiver
+
+    def create_session(self, length: int) -> UploadSession:
+        """
+        Start a resumable upload of `length` bytes
+
+        Raises:
+            UploadRejected: If the length is invalid or over the size cap
+        """
+        self._expire_sessions()
+        if length <= 0:
+            raise UploadRejected(400, "Upload-Length must be positive")
+        if length > settings.UPLOAD_MAX_BYTES:
+            raise UploadRejected(413, f"File is larger than {settings.UPLOAD_MAX_BYTES // (1024 * 1024)} MB")
+        session = UploadSession(
+            id=uuid.uuid4().hex,
+            length=length,
+            receiver=UploadReceiver(length),
+            expires_at=time.monotonic() + settings.UPLOAD_SESSION_TTL
+        )
+        self._sessions[session.id] = session
+        return session
+
+    def get_session(self, session_id: str) -> Optional[UploadSession]:
+        self._expire_sessions()
+        return self._sessions.get(session_id)
+
+    async def append_chunk(self, session: UploadSession, offset: int, chunks: AsyncIterator[bytes]) -> bool:
+        """
+        Append a request body to a session at the given offset
+
+        If the client disconnects, the bytes received so far are kept and the client
+        resumes from the offset reported by get_session.
+
+        Args:
+            session: Upload session
+            offset: Upload-Offset sent by the client (must match the session)
+            chunks: Request body
+
+        Returns:
+            True once every byte of the upload was received
+
+        Raises:
+            UploadRejected: On an offset mismatch, a concurrent PATCH, or an invalid file
+        """
+        if session.lock.locked():
+            raise UploadRejected(409, "Another request is writing to this upload")
+        async with session.lock:
+            if offset != session.offset:
+                raise UploadRejected(409, f"Upload-Offset {offset} does not match {session.offset}")
+            try:
+                async for chunk in chunks:
+                    await session.receiver.write(chunk)
+            except UploadRejected:
+                self.delete_session(session.id)
+                raise
+            finally:
+                session.expires_at = time.monotonic() + settings.UPLOAD_SESSION_TTL
+            if session.offset < session.length:
+                return False
+            try:
+                session.receiver.finish()
+            except UploadRejected:
+                self.delete_session(session.id)
+                raise
+            return True
+
+    def delete_session(self, session_id: str) -> None:
+        """Drop a session and its temp file"""
+        session = self._sessions.pop(session_id, None)
+        if session is not None:
+            session.receiver.discard()
+
+    def _expire_sessions(self) -> None:
+        now = time.monotonic()
+        for session_id, session in list(self._sessions.items()):
+            if session.expires_at <= now and not session.lock.locked():
+                logger.info(f"Resumable upload {session_id} expired at {session.offset}/{session.length} bytes")
+                self.delete_session(session_id)
+
+
+# Singleton instance
+upload_service = UploadService()
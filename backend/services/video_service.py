@@ -1,18 +1,404 @@
 import os
+import sys
+import time
+import asyncio
+import importlib.util
 import httpx
 import re
-from typing import Dict, Any, Optional, List
-from datetime import datetime, timedelta
+from collections import OrderedDict
+from contextlib import aclosing
+from typing import Dict, Any, Optional, List, Set, AsyncIterator, Tuple, Callable, Awaitable
+from datetime import date, datetime, timedelta
+from zoneinfo import ZoneInfo
 from fastapi import HTTPException
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from core.config import settings
+from core.constants import (
+    YOUTUBE_API_BASE_URL,
+    YOUTUBE_MAX_RESULTS_PER_PAGE,
+    YOUTUBE_API_HOST,
+    YOUTUBE_THUMBNAIL_HOST,
+    YOUTUBE_QUOTA_COSTS,
+    YOUTUBE_QUOTA_TIMEZONE,
+    INCREMENTAL_STOP_AFTER_KNOWN
+)
+from core.database import get_session_context
+from core.models import YouTubeQuotaUsage
+from core.metrics import youtube_request_duration, youtube_requests_total, youtube_quota_units_total
 
 YOUTUBE_API_KEY = settings.YOUTUBE_API_KEY
-YOUTUBE_API_URL = "https://www.googleapis.com/youtube/v3/videos"
+
+class MetadataCache:
+    """
+    In-process TTL + LRU cache for YouTube metadata lookups.
+
+    Entries have a per-kind TTL and are evicted least-recently-used once the estimated
+    memory footprint exceeds `max_bytes`. Concurrent misses for the same key share a
+    single upstream call (single-flight), so a burst of identical requests costs one
+    quota unit.
+    """
+
+    def __init__(self, ttls: Dict[str, float], max_bytes: int):
+        self._ttls = ttls
+        self._max_bytes = max_bytes
+        self._entries: "OrderedDict[Tuple[str, str], Tuple[float, int, Any]]" = OrderedDict()
+        self._inflight: Dict[Tuple[str, str], asyncio.Future] = {}
+        self._bytes = 0
+        self._evictions = 0
+        self._stats = {kind: {"hits": 0, "misses": 0, "coalesced": 0} for kind in ttls}
+
+    async def get_or_load(
+        self,
+        kind: str,
+        key: str,
+        loader: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        """
+        Returns the cached value for (kind, key), calling `loader` on a miss.
+        `None` results and exceptions are not cached.
+        """
+        cache_key = (kind, key)
+        stats = self._stats[kind]
+
+        entry = self._entries.get(cache_key)
+        if entry is not None:
+            expires_at, _, value = entry
+            if expires_at > time.monotonic():
+                self._entries.move_to_end(cache_key)
+                stats["hits"] += 1
+                return value
+            self._remove(cache_key)
+
+        inflight = self._inflight.get(cache_key)
+        if inflight is not None:
+            stats["coalesced"] += 1
+            return await asyncio.shield(inflight)
+
+        stats["misses"] += 1
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[cache_key] = future
+        try:
+            value = await loader()
+        except BaseException as e:
+            if isinstance(e, Exception):
+                future.set_exception(e)
+                # Mark as retrieved when nobody else was waiting
+                future.exception()
+            else:
+                future.cancel()
+            raise
+        else:
+            future.set_result(value)
+            if value is not None:
+                self._store(cache_key, value)
+            return value
+        finally:
+            self._inflight.pop(cache_key, None)
+
+    def get(self, kind: str, key: str) -> Optional[Any]:
+        """
+        Returns the cached value for (kind, key), or `None` on a miss (no loading).
+        """
+        cache_key = (kind, key)
+        entry = self._entries.get(cache_key)
+        if entry is not None:
+            expires_at, _, value = entry
+            if expires_at > time.monotonic():
+                self._entries.move_to_end(cache_key)
+                self._stats[kind]["hits"] += 1
+                return value
+            self._remove(cache_key)
+        self._stats[kind]["misses"] += 1
+        return None
+
+    def put(self, kind: str, key: str, value: Any) -> None:
+        """
+        Stores a value loaded outside `get_or_load` (e.g. by a batched lookup).
+        """
+        if value is not None:
+            self._store((kind, key), value)
+
+    def _store(self, cache_key: Tuple[str, str], value: Any) -> None:
+        size = _estimate_size(value)
+        if size > self._max_bytes:
+            return
+        self._remove(cache_key)
+        self._entries[cache_key] = (time.monotonic() + self._ttls[cache_key[0]], size, value)
+        self._bytes += size
+        while self._bytes > self._max_bytes:
+            oldest_key = next(iter(self._entries))
+            self._remove(oldest_key)
+            self._evictions += 1
+
+    def _remove(self, cache_key: Tuple[str, str]) -> None:
+        entry = self._entries.pop(cache_key, None)
+        if entry is not None:
+            self._bytes -= entry[1]
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._bytes = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Returns hit/miss counters per kind plus size information.
+        """
+        kinds = {}
+        for kind, stats in self._stats.items():
+            lookups = stats["hits"] + stats["misses"] + stats["coalesced"]
+            kinds[kind] = {
+                **stats,
+                "hit_ratio": round((stats["hits"] + stats["coalesced"]) / lookups, 4) if lookups else 0.0
+            }
+        return {
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "max_bytes": self._max_bytes,
+            "evictions": self._evictions,
+            "kinds": kinds
+        }
+
+
+def _estimate_size(value: Any) -> int:
+    """Rough deep size of cached metadata (dicts/lists of str, int, datetime)"""
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        size += sum(_estimate_size(k) + _estimate_size(v) for k, v in value.items())
+    elif isinstance(value, (list, tuple)):
+        size += sum(_estimate_size(v) for v in value)
+    return size
+
+
+class QuotaTracker:
+    """
+    Counts YouTube Data API quota units per endpoint and quota day (Pacific Time).
+
+    Usage is added to the youtube_quota_usage table, which every process (API
+    workers, sync_collections.py, import scripts) shares, so a daily budget covers
+    all of them. record() only counts in memory and starts a background flush; one
+    flush writes everything recorded since the last one (an upsert per endpoint).
+    shared_units_today() flushes first, then reads the total for today.
+    get_usage() reports this process only.
+    """
+
+    def __init__(self):
+        self._day = self._today()
+        self._units: Dict[str, int] = {}
+        self._calls: Dict[str, int] = {}
+        # Not yet written to the database: (day, endpoint) -> [units, calls]
+        self._pending: Dict[Tuple[str, str], List[int]] = {}
+        self._flush_task: Optional[asyncio.Task] = None
+        self._flush_lock = asyncio.Lock()
+
+    def _today(self) -> str:
+        return datetime.now(ZoneInfo(YOUTUBE_QUOTA_TIMEZONE)).date().isoformat()
+
+    def _roll_over(self) -> None:
+        today = self._today()
+        if today != self._day:
+            self._day = today
+            self._units = {}
+            self._calls = {}
+
+    def record(self, endpoint: str) -> None:
+        self._roll_over()
+        units = YOUTUBE_QUOTA_COSTS.get(endpoint, 1)
+        self._units[endpoint] = self._units.get(endpoint, 0) + units
+        youtube_quota_units_total.inc((endpoint,), units)
+        self._calls[endpoint] = self._calls.get(endpoint, 0) + 1
+        self._add_pending((self._day, endpoint), units, 1)
+        if self._flush_task is None or self._flush_task.done():
+            try:
+                self._flush_task = asyncio.get_running_loop().create_task(self.flush())
+            except RuntimeError:
+                pass  # No event loop; the next flush() writes it
+
+    def _add_pending(self, key: Tuple[str, str], units: int, calls: int) -> None:
+        pending = self._pending.setdefault(key, [0, 0])
+        pending[0] += units
+        pending[1] += calls
+
+    async def flush(self) -> None:
+        """
+        Writes usage recorded by this process to the shared table. On a database
+        error the usage is kept for the next flush.
+        """
+        async with self._flush_lock:
+            while self._pending:
+                pending, self._pending = self._pending, {}
+                statement = pg_insert(YouTubeQuotaUsage).values([
+                    {"day": date.fromisoformat(day), "endpoint": endpoint, "units": units, "calls": calls}
+                    for (day, endpoint), (units, calls) in pending.items()
+                ])
+                statement = statement.on_conflict_do_update(
+                    index_elements=["day", "endpoint"],
+                    set_={
+                        "units": YouTubeQuotaUsage.units + statement.excluded.units,
+                        "calls": YouTubeQuotaUsage.calls + statement.excluded.calls
+                    }
+                )
+                try:
+                    async with get_session_context() as session:
+                        await session.execute(statement)
+                        await session.commit()
+                except Exception as e:
+                    for key, (units, calls) in pending.items():
+                        self._add_pending(key, units, calls)
+                    print(f"WARNING: Could not record YouTube quota usage: {e}")
+                    return
+
+    async def shared_units_today(self) -> int:
+        """
+        Returns quota units spent today by every process.
+        """
+        await self.flush()
+        today = self._today()
+        async with get_session_context() as session:
+            result = await session.execute(
+                select(func.coalesce(func.sum(YouTubeQuotaUsage.units), 0))
+                .where(YouTubeQuotaUsage.day == date.fromisoformat(today))
+            )
+            stored = int(result.scalar_one())
+        # Usage a failed flush could not write yet
+        unwritten = sum(units for (day, _), (units, _) in self._pending.items() if day == today)
+        return stored + unwritten
+
+    @property
+    def units_today(self) -> int:
+        self._roll_over()
+        return sum(self._units.values())
+
+    def get_usage(self) -> Dict[str, Any]:
+        """
+        Returns quota units and call counts per endpoint spent by this process in
+        the current quota day.
+        """
+        self._roll_over()
+        return {
+            "day": self._day,
+            "units_total": sum(self._units.values()),
+            "units_by_endpoint": dict(self._units),
+            "calls_by_endpoint": dict(self._calls)
+        }
+
 
 class VideoService:
     def __init__(self):
-        # These are now global constants, no need for instance variables
-        pass
+        # Shared HTTP client for all YouTube calls (created on app startup or first use)
+        self._client: Optional[httpx.AsyncClient] = None
+        self._http2 = False
+        self._requests_total = 0
+        self._connections_opened = 0
+        self.quota = QuotaTracker()
+        self.cache = MetadataCache(
+            ttls={
+                "video": settings.YOUTUBE_CACHE_TTL_VIDEO,
+                "handle": settings.YOUTUBE_CACHE_TTL_HANDLE,
+                "channel": settings.YOUTUBE_CACHE_TTL_CHANNEL,
+            },
+            max_bytes=settings.YOUTUBE_CACHE_MAX_BYTES
+        )
+
+    async def start(self) -> None:
+        """
+        Creates the shared, pooled HTTP client. Called on app startup.
+        """
+        if self._client is None:
+            self._client = self._create_client()
+
+    async def close(self) -> None:
+        """
+        Closes the shared HTTP client and its pooled connections. Called on app shutdown.
+        """
+        await self.quota.flush()
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """
+        Returns the shared HTTP client, creating it lazily for scripts that skip app startup.
+        """
+        if self._client is None:
+            self._client = self._create_client()
+        return self._client
+
+    def _create_client(self) -> httpx.AsyncClient:
+        limits = httpx.Limits(
+            max_connections=settings.YOUTUBE_HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.YOUTUBE_HTTP_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=settings.YOUTUBE_HTTP_KEEPALIVE_EXPIRY
+        )
+        timeout = httpx.Timeout(
+            settings.YOUTUBE_HTTP_TIMEOUT,
+            connect=settings.YOUTUBE_HTTP_CONNECT_TIMEOUT
+        )
+        http2 = settings.YOUTUBE_HTTP2
+        if http2 and importlib.util.find_spec("h2") is None:
+            print("WARNING: YOUTUBE_HTTP2 is enabled but the 'h2' package is missing. Using HTTP/1.1.")
+            http2 = False
+        self._http2 = http2
+
+        return httpx.AsyncClient(
+            limits=limits,
+            timeout=timeout,
+            http2=http2,
+            event_hooks={"request": [self._on_request], "response": [self._on_response]}
+        )
+
+    async def _on_request(self, request: httpx.Request) -> None:
+        self._requests_total += 1
+        request.extensions["trace"] = self._trace
+        request.extensions["started_at"] = time.perf_counter()
+        if request.url.host == YOUTUBE_API_HOST:
+            self.quota.record(request.url.path.rsplit("/", 1)[-1])
+
+    async def _on_response(self, response: httpx.Response) -> None:
+        request = response.request
+        started_at = request.extensions.get("started_at")
+        endpoint = self._metrics_endpoint(request.url)
+        if started_at is not None:
+            youtube_request_duration.observe(time.perf_counter() - started_at, (endpoint,))
+        youtube_requests_total.inc((endpoint, str(response.status_code)))
+
+    @staticmethod
+    def _metrics_endpoint(url: httpx.URL) -> str:
+        # API resource (videos, playlistItems, ...); other hosts are labelled by kind, not path
+        if url.host == YOUTUBE_API_HOST:
+            return url.path.rsplit("/", 1)[-1]
+        if url.host == YOUTUBE_THUMBNAIL_HOST:
+            return "thumbnail"
+        return url.host
+
+    async def _trace(self, event_name: str, info: Dict[str, Any]) -> None:
+        if event_name == "connection.connect_tcp.complete":
+            self._connections_opened += 1
+
+    def get_pool_metrics(self) -> Dict[str, Any]:
+        """
+        Returns connection pool metrics for the shared YouTube HTTP client.
+        """
+        open_connections = 0
+        idle_connections = 0
+        if self._client is not None:
+            pool = getattr(self._client._transport, "_pool", None)
+            connections = getattr(pool, "connections", [])
+            open_connections = len(connections)
+            idle_connections = sum(1 for conn in connections if conn.is_idle())
+
+        return {
+            "open_connections": open_connections,
+            "idle_connections": idle_connections,
+            "requests_total": self._requests_total,
+            "connections_opened": self._connections_opened,
+            "requests_per_connection": (
+                round(self._requests_total / self._connections_opened, 2)
+                if self._connections_opened else 0.0
+            ),
+            "http2": self._http2
+        }
 
     def extract_video_id(self, url: str) -> Optional[str]:
         """
@@ -43,34 +429,80 @@ class VideoService:
             print("WARNING: YOUTUBE_API_KEY not set. Returning mock data.")
             return self._get_mock_data(video_id)
 
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                YOUTUBE_API_URL,
-                params={
-                    "part": "snippet,contentDetails",
-                    "id": video_id,
-                    "key": YOUTUBE_API_KEY
-                }
+        metadata = await self.cache.get_or_load(
+            "video", video_id, lambda: self._fetch_video_metadata(video_id)
+        )
+        return dict(metadata)
+
+    async def parse_video_urls(self, urls: List[str]) -> List[Dict[str, Any]]:
+        """
+        Parses many YouTube URLs at once.
+        Video IDs are deduplicated and served from the metadata cache where possible;
+        the rest are fetched with `videos?id=` multi-gets of up to 50 IDs, run concurrently
+        (bounded by YOUTUBE_FETCH_CONCURRENCY). Returns one result per input URL, in input
+        order, with either `video` (metadata) or `error` set.
+        """
+        video_ids = [self.extract_video_id(url) for url in urls]
+        unique_ids = list(dict.fromkeys(video_id for video_id in video_ids if video_id))
+        found: Dict[str, Dict[str, Any]] = {}
+        failed: Dict[str, str] = {}
+
+        if not YOUTUBE_API_KEY:
+            print("WARNING: YOUTUBE_API_KEY not set. Returning mock data.")
+            found = {video_id: self._get_mock_data(video_id) for video_id in unique_ids}
+        else:
+            missing = []
+            for video_id in unique_ids:
+                cached = self.cache.get("video", video_id)
+                if cached is not None:
+                    found[video_id] = cached
+                else:
+                    missing.append(video_id)
+
+            chunks = [
+                missing[i:i + YOUTUBE_MAX_RESULTS_PER_PAGE]
+                for i in range(0, len(missing), YOUTUBE_MAX_RESULTS_PER_PAGE)
+            ]
+            semaphore = asyncio.Semaphore(max(1, settings.YOUTUBE_FETCH_CONCURRENCY))
+
+            async def fetch_chunk(chunk: List[str]) -> List[Dict[str, Any]]:
+                async with semaphore:
+                    return await self._fetch_video_details(chunk, raise_on_error=True)
+
+            chunk_results = await asyncio.gather(
+                *(fetch_chunk(chunk) for chunk in chunks), return_exceptions=True
             )
-            
-            if response.status_code != 200:
-                raise HTTPException(status_code=response.status_code, detail="Failed to fetch data from YouTube API")
+            for chunk, result in zip(chunks, chunk_results):
+                if isinstance(result, Exception):
+                    error = result.detail if isinstance(result, HTTPException) else "Failed to fetch data from YouTube API"
+                    failed.update(dict.fromkeys(chunk, error))
+                    continue
+                for video in result:
+                    found[video["youtube_video_id"]] = video
+                    self.cache.put("video", video["youtube_video_id"], video)
 
-            data = response.json()
-            if not data.get("items"):
-                raise HTTPException(status_code=404, detail="Video not found on YouTube")
+        results = []
+        for url, video_id in zip(urls, video_ids):
+            result = {"url": url, "youtube_video_id": video_id, "video": None, "error": None}
+            if not video_id:
+                result["error"] = "Invalid YouTube URL"
+            elif video_id in found:
+                result["video"] = dict(found[video_id])
+            else:
+                result["error"] = failed.get(video_id, "Video not found on YouTube")
+            results.append(result)
+        return results
 
-            item = data["items"][0]
-            snippet = item["snippet"]
-            
-            return {
-                "youtube_video_id": video_id,
-                "title": snippet["title"],
-                "channel_name": snippet["channelTitle"],
-                "thumbnail_url": snippet["thumbnails"].get("maxres", snippet["thumbnails"]["high"])["url"],
-                "description": snippet["description"],
-                "published_at": datetime.strptime(snippet["publishedAt"], "%Y-%m-%dT%H:%M:%SZ")
-            }
+    async def _fetch_video_metadata(self, video_id: str) -> Dict[str, Any]:
+        """
+        Fetches metadata for a single video from the YouTube Data API.
+        Same shape as `_fetch_video_details` (including duration), since both
+        fill the "video" cache kind.
+        """
+        videos = await self._fetch_video_details([video_id], raise_on_error=True)
+        if not videos:
+            raise HTTPException(status_code=404, detail="Video not found on YouTube")
+        return videos[0]
 
     async def get_channel_id_from_url(self, url: str) -> Optional[str]:
         """
@@ -82,14 +514,10 @@ class VideoService:
         handle_match = re.search(r"youtube\.com\/@([a-zA-Z0-9_.-]+)", url)
         if handle_match:
             handle = handle_match.group(1)
-            async with httpx.AsyncClient() as client:
-                response = await client.get(
-                    "https://www.googleapis.com/youtube/v3/channels",
-                    params={"part": "id", "forHandle": f"@{handle}", "key": YOUTUBE_API_KEY}
-                )
-                if response.status_code == 200:
-                    items = response.json().get("items")
-                    if items: return items[0]["id"]
+            channel_id = await self.cache.get_or_load(
+                "handle", handle.lower(), lambda: self._resolve_handle(handle)
+            )
+            if channel_id: return channel_id
         
         # Fallback: Check if it's already a channel ID URL
         id_match = re.search(r"youtube\.com\/channel\/([a-zA-Z0-9_-]+)", url)
@@ -98,6 +526,19 @@ class VideoService:
             
         return None
 
+    async def _resolve_handle(self, handle: str) -> Optional[str]:
+        """
+        Resolves a channel handle (without '@') to a Channel ID.
+        """
+        response = await self.client.get(
+            f"{YOUTUBE_API_BASE_URL}/channels",
+            params={"part": "id", "forHandle": f"@{handle}", "key": YOUTUBE_API_KEY}
+        )
+        if response.status_code == 200:
+            items = response.json().get("items")
+            if items: return items[0]["id"]
+        return None
+
     async def get_channel_info(self, channel_id: str) -> Dict[str, Any]:
         """
         Fetches channel details including title, thumbnail, and video count.
@@ -110,25 +551,33 @@ class VideoService:
                 "uploads_playlist_id": "mock_playlist_id"
             }
 
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                "https://www.googleapis.com/youtube/v3/channels",
-                params={
-                    "part": "snippet,contentDetails,statistics",
-                    "id": channel_id,
-                    "key": YOUTUBE_API_KEY
+        info = await self.cache.get_or_load(
+            "channel", channel_id, lambda: self._fetch_channel_info(channel_id)
+        )
+        return dict(info) if info else None
+
+    async def _fetch_channel_info(self, channel_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Fetches channel details from the YouTube Data API.
+        """
+        response = await self.client.get(
+            f"{YOUTUBE_API_BASE_URL}/channels",
+            params={
+                "part": "snippet,contentDetails,statistics",
+                "id": channel_id,
+                "key": YOUTUBE_API_KEY
+            }
+        )
+        if response.status_code == 200:
+            items = response.json().get("items")
+            if items:
+                item = items[0]
+                return {
+                    "title": item["snippet"]["title"],
+                    "thumbnail_url": item["snippet"]["thumbnails"]["default"]["url"],
+                    "video_count": int(item["statistics"]["videoCount"]),
+                    "uploads_playlist_id": item["contentDetails"]["relatedPlaylists"]["uploads"]
                 }
-            )
-            if response.status_code == 200:
-                items = response.json().get("items")
-                if items:
-                    item = items[0]
-                    return {
-                        "title": item["snippet"]["title"],
-                        "thumbnail_url": item["snippet"]["thumbnails"]["default"]["url"],
-                        "video_count": int(item["statistics"]["videoCount"]),
-                        "uploads_playlist_id": item["contentDetails"]["relatedPlaylists"]["uploads"]
-                    }
         return None
 
     async def get_channel_uploads_playlist_id(self, channel_id: str) -> Optional[str]:
@@ -138,102 +587,196 @@ class VideoService:
         info = await self.get_channel_info(channel_id)
         return info.get("uploads_playlist_id") if info else None
 
-    async def get_playlist_videos(self, playlist_id: str, limit: int = 200) -> list[Dict[str, Any]]:
+    async def get_playlist_videos(
+        self,
+        playlist_id: str,
+        limit: int = 200,
+        known_video_ids: Optional[Set[str]] = None
+    ) -> list[Dict[str, Any]]:
         """
         Fetches videos from a playlist, including duration to identify Shorts.
         Handles pagination to fetch up to `limit` videos.
+        With `known_video_ids` (incremental mode), only unknown videos are returned and
+        paging stops at the first run of already-known videos.
         """
         if not YOUTUBE_API_KEY:
             # Mock data
             return [self._get_mock_data(f"mock_{i}") for i in range(5)]
 
         videos = []
-        next_page_token = None
-        
-        async with httpx.AsyncClient() as client:
-            while len(videos) < limit:
-                # Calculate how many to fetch in this batch (max 50)
-                remaining = limit - len(videos)
-                max_results = min(remaining, 50)
-
-                # 1. Get Playlist Items (Video IDs)
-                params = {
-                    "part": "snippet,contentDetails",
-                    "playlistId": playlist_id,
-                    "maxResults": max_results,
-                    "key": YOUTUBE_API_KEY
-                }
-                if next_page_token:
-                    params["pageToken"] = next_page_token
-
-                response = await client.get(
-                    "https://www.googleapis.com/youtube/v3/playlistItems",
-                    params=params
-                )
-                
-                if response.status_code != 200:
-                    print(f"Error fetching playlist items: {response.status_code}")
-                    break
+        pages = self.iter_playlist_video_pages(
+            playlist_id, limit=limit, known_video_ids=known_video_ids
+        )
+        async with aclosing(pages):
+            async for page_videos, _ in pages:
+                videos.extend(page_videos)
+        return videos
 
-                data = response.json()
-                items = data.get("items", [])
-                next_page_token = data.get("nextPageToken")
+    async def iter_playlist_video_pages(
+        self,
+        playlist_id: str,
+        limit: int = 200,
+        page_token: Optional[str] = None,
+        concurrency: Optional[int] = None,
+        known_video_ids: Optional[Set[str]] = None
+    ) -> AsyncIterator[Tuple[List[Dict[str, Any]], Optional[str]]]:
+        """
+        Pipelined playlist fetcher. Yields (videos, next_page_token) per page, in playlist order.
 
-                if not items:
-                    break
+        A single pager task walks `playlistItems` pages and hands each page's video IDs
+        to a bounded pool of workers through an asyncio queue, so the `videos?id=` detail
+        lookups for page N overlap with the paging request for page N+1.
 
-                video_ids = []
-                for item in items:
-                    # contentDetails.videoId is reliable in playlistItems
-                    vid = item["contentDetails"].get("videoId")
-                    if vid:
-                        video_ids.append(vid)
-                
-                if not video_ids:
-                    break
+        Incremental mode: when `known_video_ids` is given, known videos are not looked up
+        and, since the uploads playlist is newest-first, paging stops once
+        INCREMENTAL_STOP_AFTER_KNOWN consecutive known videos are seen. The page where
+        that happens is yielded with a None token, so a non-None token on the last page
+        means the walk stopped at `limit` (or on an error) with videos left to fetch.
+        """
+        concurrency = max(1, concurrency or settings.YOUTUBE_FETCH_CONCURRENCY)
+        work_queue: asyncio.Queue = asyncio.Queue(maxsize=concurrency)
+        ordered_pages: asyncio.Queue = asyncio.Queue()
 
-                # 2. Get Video Details (Duration)
-                # YouTube API allows up to 50 IDs per call
-                video_response = await client.get(
-                    "https://www.googleapis.com/youtube/v3/videos",
-                    params={
+        async def walk_pages():
+            token = page_token
+            requested = 0
+            known_run = 0
+            reached_known = False
+            try:
+                while requested < limit and not reached_known:
+                    # Calculate how many to fetch in this batch (max 50)
+                    max_results = min(limit - requested, YOUTUBE_MAX_RESULTS_PER_PAGE)
+                    params = {
                         "part": "snippet,contentDetails",
-                        "id": ",".join(video_ids),
+                        "playlistId": playlist_id,
+                        "maxResults": max_results,
                         "key": YOUTUBE_API_KEY
                     }
-                )
+                    if token:
+                        params["pageToken"] = token
+
+                    response = await self.client.get(
+                        f"{YOUTUBE_API_BASE_URL}/playlistItems",
+                        params=params
+                    )
+                    if response.status_code != 200:
+                        print(f"Error fetching playlist items: {response.status_code}")
+                        break
 
-                if video_response.status_code == 200:
-                    video_items = video_response.json().get("items", [])
-                    for item in video_items:
-                        snippet = item["snippet"]
-                        content_details = item["contentDetails"]
-                        
-                        # Skip private/deleted
-                        if snippet["title"] == "Private video" or snippet["title"] == "Deleted video":
-                            continue
-
-                        try:
-                            thumbnail = snippet["thumbnails"].get("maxres") or snippet["thumbnails"].get("high") or snippet["thumbnails"].get("default")
-                            duration_str = content_details.get("duration", "PT0S")
-                            duration_sec = self._parse_duration(duration_str)
-
-                            videos.append({
-                                "youtube_video_id": item["id"],
-                                "title": snippet["title"],
-                                "channel_name": snippet["channelTitle"],
-                                "thumbnail_url": thumbnail["url"] if thumbnail else "",
-                                "description": snippet["description"],
-                                "published_at": datetime.strptime(snippet["publishedAt"], "%Y-%m-%dT%H:%M:%SZ"),
-                                "duration_seconds": duration_sec
-                            })
-                        except Exception as e:
-                            print(f"Error parsing video item: {e}")
-                            continue
-                
-                if not next_page_token:
+                    data = response.json()
+                    token = data.get("nextPageToken")
+                    # contentDetails.videoId is reliable in playlistItems
+                    video_ids = [
+                        item["contentDetails"]["videoId"]
+                        for item in data.get("items", [])
+                        if item["contentDetails"].get("videoId")
+                    ]
+                    if not video_ids:
+                        break
+                    requested += len(video_ids)
+
+                    if known_video_ids is not None:
+                        new_ids = []
+                        for vid in video_ids:
+                            if vid not in known_video_ids:
+                                known_run = 0
+                                new_ids.append(vid)
+                                continue
+                            known_run += 1
+                            if known_run >= INCREMENTAL_STOP_AFTER_KNOWN:
+                                reached_known = True
+                                break
+                        video_ids = new_ids
+
+                    page = asyncio.get_running_loop().create_future()
+                    # Reaching known videos ends the walk: there is nothing left to resume
+                    await ordered_pages.put((page, None if reached_known else token))
+                    await work_queue.put((page, video_ids))
+
+                    if not token:
+                        break
+            finally:
+                ordered_pages.put_nowait(None)
+
+        async def fetch_details():
+            # Workers run until the consumer has drained every page, then get cancelled
+            while True:
+                page, video_ids = await work_queue.get()
+                try:
+                    page.set_result(await self._fetch_video_details(video_ids))
+                except Exception as e:
+                    page.set_exception(e)
+
+        tasks = [asyncio.create_task(walk_pages())]
+        tasks += [asyncio.create_task(fetch_details()) for _ in range(concurrency)]
+        try:
+            while True:
+                entry = await ordered_pages.get()
+                if entry is None:
                     break
+                page, next_token = entry
+                yield await page, next_token
+            # Surface pager errors (e.g. network failures)
+            await tasks[0]
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _fetch_video_details(
+        self,
+        video_ids: List[str],
+        raise_on_error: bool = False
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetches details (including duration) for up to 50 video IDs in one call.
+        Private and deleted videos are skipped. A failed call returns no videos,
+        or raises an HTTPException with `raise_on_error`.
+        """
+        if not video_ids:
+            return []
+
+        # YouTube API allows up to 50 IDs per call
+        video_response = await self.client.get(
+            f"{YOUTUBE_API_BASE_URL}/videos",
+            params={
+                "part": "snippet,contentDetails",
+                "id": ",".join(video_ids),
+                "key": YOUTUBE_API_KEY
+            }
+        )
+        if video_response.status_code != 200:
+            print(f"Error fetching video details: {video_response.status_code}")
+            if raise_on_error:
+                raise HTTPException(status_code=video_response.status_code, detail="Failed to fetch data from YouTube API")
+            return []
+
+        videos = []
+        for item in video_response.json().get("items", []):
+            snippet = item["snippet"]
+            content_details = item["contentDetails"]
+
+            # Skip private/deleted
+            if snippet["title"] == "Private video" or snippet["title"] == "Deleted video":
+                continue
+
+            try:
+                thumbnail = snippet["thumbnails"].get("maxres") or snippet["thumbnails"].get("high") or snippet["thumbnails"].get("default")
+                duration_str = content_details.get("duration", "PT0S")
+                duration_sec = self._parse_duration(duration_str)
 
+                videos.append({
+                    "youtube_video_id": item["id"],
+                    "title": snippet["title"],
+                    "channel_name": snippet["channelTitle"],
+                    "thumbnail_url": thumbnail["url"] if thumbnail else "",
+                    "description": snippet["description"],
+                    "published_at": datetime.strptime(snippet["publishedAt"], "%Y-%m-%dT%H:%M:%SZ"),
+                    "duration_seconds": duration_sec
+                })
+            except Exception as e:
+                print(f"Error parsing video item: {e}")
+                continue
         return videos
 
     def _parse_duration(self, duration: str) -> int:
@@ -260,7 +803,8 @@ class VideoService:
             "channel_name": "Mock Channel",
             "thumbnail_url": "https://via.placeholder.com/1280x720",
             "description": "This is a mock description because YOUTUBE_API_KEY is missing.",
-            "published_at": datetime.utcnow()
+            "published_at": datetime.utcnow(),
+            "duration_seconds": 0
         }
 
 video_service = VideoService()
@@ -0,0 +1,42 @@
+"""
+Sync every collection with an official_link from YouTube within the daily quota budget.
+
+Usage:
+    python sync_collections.py                    # one pass
+    python sync_collections.py --loop             # run every SYNC_INTERVAL_MINUTES
+    python sync_collections.py --budget 2000 --concurrency 5
+"""
+import argparse
+import asyncio
+from core.config import settings
+from services.sync_service import SyncScheduler
+from services.video_service import video_service
+
+async def main(args):
+    scheduler = SyncScheduler(
+        daily_budget=args.budget,
+        concurrency=args.concurrency,
+        stale_after_hours=args.stale_after_hours
+    )
+    try:
+        if args.loop:
+            await scheduler.run_forever(args.interval)
+        else:
+            summary = await scheduler.run_once()
+            print(f"Candidates:       {summary['candidates']}")
+            print(f"Synced:           {len(summary['synced'])}")
+            print(f"Skipped (budget): {len(summary['skipped_budget'])}")
+            print(f"Failed:           {len(summary['failed'])}")
+            print(f"Quota units used: {summary['quota_units_used']}")
+            print(f"Quota used today (all processes): {summary['quota_units_today']}/{args.budget}")
+    finally:
+        await video_service.close()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Sync collections from their YouTube channels")
+    parser.add_argument("--loop", action="store_true", help="Keep running on a fixed cadence")
+    parser.add_argument("--interval", type=float, default=settings.SYNC_INTERVAL_MINUTES, help="Minutes between runs")
+    parser.add_argument("--budget", type=int, default=settings.YOUTUBE_DAILY_QUOTA_BUDGET, help="Daily quota units")
+    parser.add_argument("--concurrency", type=int, default=settings.SYNC_MAX_CONCURRENCY, help="Channels synced at once")
+    parser.add_argument("--stale-after-hours", type=float, default=settings.SYNC_STALE_AFTER_HOURS)
+    asyncio.run(main(parser.parse_args()))
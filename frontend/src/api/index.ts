@@ -1,5 +1,17 @@
 const API_BASE_URL = import.meta.env.VITE_API_URL || 'http://localhost:8000';
 
+// --- Thumbnails ---
+
+export type ThumbSize = 'small' | 'card' | 'large';
+
+// YouTube thumbnails go through the backend's resizing cache; custom (uploaded) ones are used as-is
+export const thumbnailSrc = (thumbnailUrl: string, youtubeVideoId: string, size: ThumbSize = 'card'): string => {
+    if (youtubeVideoId && (!thumbnailUrl || thumbnailUrl.includes('i.ytimg.com'))) {
+        return `${API_BASE_URL}/api/thumbs/${youtubeVideoId}/${size}`;
+    }
+    return thumbnailUrl;
+};
+
 // --- Collections ---
 
 export const getCollections = async (): Promise<any[]> => {
@@ -77,6 +89,14 @@ export const importFromChannel = async (id: string, limit: number = 5000, custom
     return response.json();
 };
 
+// --- Jobs ---
+
+export const getJob = async (jobId: string) => {
+    const response = await fetch(`${API_BASE_URL}/api/jobs/${jobId}`);
+    if (!response.ok) throw new Error('Failed to fetch import job');
+    return response.json();
+};
+
 // --- Videos ---
 
 export const parseVideo = async (url: string) => {
@@ -85,6 +105,16 @@ export const parseVideo = async (url: string) => {
     return response.json();
 };
 
+export const parseVideos = async (urls: string[]) => {
+    const response = await fetch(`${API_BASE_URL}/api/videos/parse-batch`, {
+        method: 'POST',
+        headers: { 'Content-Type': 'application/json' },
+        body: JSON.stringify({ urls }),
+    });
+    if (!response.ok) throw new Error('Failed to parse videos');
+    return response.json();
+};
+
 export const addVideoToCollection = async (collectionId: string, data: any) => {
     const response = await fetch(`${API_BASE_URL}/api/collections/${collectionId}/videos`, {
         method: 'POST',
@@ -49,14 +49,26 @@ export const ImportModal: React.FC<ImportModalProps> = ({ isOpen, onClose, colle
         setMessage('Fetching videos from YouTube... This may take a while.');
 
         try {
-            const data = await api.importFromChannel(
+            let job = await api.importFromChannel(
                 collectionId,
                 5000,
                 importMode === 'custom' ? customChannelUrl : undefined,
                 importMode === 'custom' && defaultCategory ? defaultCategory : undefined
             );
+
+            // Import runs in the background: poll the job until it finishes
+            while (job.status === 'QUEUED' || job.status === 'RUNNING') {
+                await new Promise((resolve) => setTimeout(resolve, 1500));
+                job = await api.getJob(job.id);
+                const eta = job.eta_seconds ? ` (about ${Math.ceil(job.eta_seconds)}s left)` : '';
+                setMessage(`Fetched ${job.fetched_count} videos, imported ${job.imported_count}, skipped ${job.skipped_count}${eta}`);
+            }
+
+            if (job.status !== 'SUCCEEDED') {
+                throw new Error(job.error || `Import ${job.status.toLowerCase()}`);
+            }
             setState('success');
-            setMessage(data.message);
+            setMessage(`Successfully imported ${job.imported_count} videos.`);
             queryClient.invalidateQueries({ queryKey: ['videos', collectionId] });
             onSuccess();
         } catch (error: any) {
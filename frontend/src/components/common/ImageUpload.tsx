@@ -1,9 +1,19 @@
 import React, { useState, useRef } from 'react';
 import { Upload, X, Image as ImageIcon } from 'lucide-react';
 
+// Resized copies returned by the upload API, keyed by variant name (thumb, card, cover)
+export type ImageVariants = Record<string, { url: string; width: number; height: number }>;
+
+// Builds an <img srcSet> value from stored variants (one candidate per width)
+export const toSrcSet = (variants?: ImageVariants): string | undefined => {
+    if (!variants || Object.keys(variants).length === 0) return undefined;
+    const byWidth = new Map(Object.values(variants).map(v => [v.width, v.url]));
+    return Array.from(byWidth, ([width, url]) => `${url} ${width}w`).join(', ');
+};
+
 interface ImageUploadProps {
     value?: string;
-    onChange: (url: string) => void;
+    onChange: (url: string, variants?: ImageVariants) => void;
     className?: string;
     placeholder?: string;
 }
@@ -31,7 +41,7 @@ export const ImageUpload: React.FC<ImageUploadProps> = ({ value, onChange, class
 
             const data = await response.json();
             console.log('Upload successful:', data.url);
-            onChange(data.url);
+            onChange(data.url, data.variants);
         } catch (error) {
             console.error('Upload error:', error);
             alert('Failed to upload image');
@@ -59,7 +69,7 @@ export const ImageUpload: React.FC<ImageUploadProps> = ({ value, onChange, class
                         </button>
                         <button
                             type="button"
-                            onClick={() => onChange('')}
+                            onClick={() => onChange('', {})}
                             className="p-2 bg-red-500 text-white rounded-full hover:bg-red-600 transition"
                             title="Remove Image"
                         >
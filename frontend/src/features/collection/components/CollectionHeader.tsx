@@ -6,7 +6,9 @@ interface CollectionHeaderProps {
     title: string;
     description: string;
     coverImageUrl: string;
+    coverImageSrcSet?: string;
     profileImageUrl?: string;
+    profileImageSrcSet?: string;
     officialLink?: string;
     isOfficial?: boolean;
 }
@@ -15,7 +17,9 @@ export const CollectionHeader: React.FC<CollectionHeaderProps> = ({
     title,
     description,
     coverImageUrl,
+    coverImageSrcSet,
     profileImageUrl,
+    profileImageSrcSet,
     officialLink,
     isOfficial = false,
 }) => {
@@ -37,6 +41,8 @@ export const CollectionHeader: React.FC<CollectionHeaderProps> = ({
                 <div className="absolute inset-0 bg-gradient-to-b from-transparent to-black/80 z-10" />
                 <img
                     src={coverImageUrl}
+                    srcSet={coverImageSrcSet}
+                    sizes="100vw"
                     alt={title}
                     className="h-full w-full object-cover"
                 />
@@ -56,6 +62,8 @@ export const CollectionHeader: React.FC<CollectionHeaderProps> = ({
                             >
                                 <img
                                     src={profileImageUrl}
+                                    srcSet={profileImageSrcSet}
+                                    sizes="128px"
                                     alt="Profile"
                                     className="h-full w-full object-cover"
                                 />
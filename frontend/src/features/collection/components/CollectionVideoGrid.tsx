@@ -3,6 +3,7 @@ import { clsx } from 'clsx';
 import { VideoThreadCard } from '../../feed/components/VideoThreadCard';
 import { ShortsCard } from '../../feed/components/ShortsCard';
 import { ShortsPlayerModal } from '../../feed/components/ShortsPlayerModal';
+import { thumbnailSrc } from '../../../api';
 
 interface CollectionVideoGridProps {
     videos: any[];
@@ -25,7 +26,7 @@ export const CollectionVideoGrid: React.FC<CollectionVideoGridProps> = ({ videos
                             video={{
                                 id: video.id,
                                 title: video.title,
-                                thumbnailUrl: video.thumbnail_url,
+                                thumbnailUrl: thumbnailSrc(video.thumbnail_url, video.youtube_video_id, 'card'),
                                 youtubeVideoId: video.youtube_video_id
                             }}
                             onPlay={() => setSelectedShort(video)}
@@ -63,7 +64,7 @@ export const CollectionVideoGrid: React.FC<CollectionVideoGridProps> = ({ videos
                         ...video,
                         youtubeVideoId: video.youtube_video_id,
                         channelName: video.channel_name,
-                        thumbnailUrl: video.thumbnail_url,
+                        thumbnailUrl: thumbnailSrc(video.thumbnail_url, video.youtube_video_id, viewMode === 'GRID' ? 'card' : 'large'),
                         publishedAt: video.published_at,
                         tags: video.category ? [video.category] : []
                     }}
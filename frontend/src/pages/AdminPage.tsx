@@ -3,6 +3,7 @@ import { useForm, useFieldArray } from 'react-hook-form';
 import { useMutation, useQuery, useQueryClient } from '@tanstack/react-query';
 import { clsx } from 'clsx';
 import { Plus, Trash2 } from 'lucide-react';
+import * as api from '../api';
 
 interface CreateCollectionForm {
     title: string;
@@ -73,17 +74,22 @@ export const AdminPage: React.FC = () => {
         let successCount = 0;
         let failCount = 0;
 
-        for (let i = 0; i < urlList.length; i++) {
-            const url = urlList[i];
-            setAddProgress(`Processing ${i + 1}/${urlList.length}: ${url}`);
+        // 1. Parse all URLs at once (deduplicated, 50 IDs per YouTube request)
+        setAddProgress(`Parsing ${urlList.length} URLs...`);
+        let parseResults: { url: string; video: any; error: string | null }[] = [];
+        try {
+            parseResults = (await api.parseVideos(urlList)).results;
+        } catch (error) {
+            console.error(error);
+            failCount = urlList.length;
+        }
+
+        for (let i = 0; i < parseResults.length; i++) {
+            const { url, video: videoData, error: parseError } = parseResults[i];
+            setAddProgress(`Processing ${i + 1}/${parseResults.length}: ${url}`);
 
             try {
-                // 1. Parse Video URL
-                const parseResponse = await fetch(`http://localhost:8000/api/videos/parse?url=${encodeURIComponent(url)}`, {
-                    method: 'POST'
-                });
-                if (!parseResponse.ok) throw new Error(`Failed to parse: ${url}`);
-                const videoData = await parseResponse.json();
+                if (!videoData) throw new Error(`Failed to parse: ${url} (${parseError})`);
 
                 // 2. Add to Collection
                 const response = await fetch(`http://localhost:8000/api/collections/${data.collection_id}/videos`, {
@@ -10,6 +10,7 @@ import { LayoutGrid, List, Filter } from 'lucide-react';
 
 import { CollectionInfoSection } from '../features/collection/components/CollectionInfoSection';
 import { CollectionVideoGrid } from '../features/collection/components/CollectionVideoGrid';
+import { toSrcSet } from '../components/common/ImageUpload';
 
 type Tab = 'ALL' | 'MV' | 'LIVE' | 'SHORTS' | 'INTERVIEW' | 'INFO' | 'FANCAM' | 'BEHIND' | 'VLOG';
 
@@ -42,16 +43,18 @@ export const CollectionPage: React.FC = () => {
         error: videosError
     } = useInfiniteQuery({
         queryKey: ['videos', id],
-        queryFn: async ({ pageParam = 0 }) => {
-            const response = await fetch(`${import.meta.env.VITE_API_URL || 'http://localhost:8000'}/api/collections/${id}/videos?skip=${pageParam}&limit=20`);
+        queryFn: async ({ pageParam }) => {
+            // Keyset pagination: follow the backend's next_cursor, skip the total count
+            const cursorParam = pageParam ? `&cursor=${encodeURIComponent(pageParam)}` : '';
+            const response = await fetch(`${import.meta.env.VITE_API_URL || 'http://localhost:8000'}/api/collections/${id}/videos?limit=20&include_total=false&fields=card,channel_name,comment${cursorParam}`);
             if (!response.ok) throw new Error('Failed to fetch videos');
             return response.json();
         },
         getNextPageParam: (lastPage) => {
             // Use backend's has_more flag
-            return lastPage.has_more ? lastPage.skip + lastPage.videos.length : undefined;
+            return lastPage.has_more ? lastPage.next_cursor : undefined;
         },
-        initialPageParam: 0,
+        initialPageParam: null as string | null,
         enabled: !!id,
     });
 
@@ -96,7 +99,9 @@ export const CollectionPage: React.FC = () => {
                 title={collection.title}
                 description={collection.description}
                 coverImageUrl={collection.cover_image_url}
+                coverImageSrcSet={toSrcSet(collection.cover_image_variants)}
                 profileImageUrl={collection.profile_image_url}
+                profileImageSrcSet={toSrcSet(collection.profile_image_variants)}
                 officialLink={collection.official_link}
                 isOfficial={collection.type === 'OFFICIAL'}
             />
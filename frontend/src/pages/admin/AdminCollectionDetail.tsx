@@ -355,7 +355,7 @@ export const AdminCollectionDetail: React.FC = () => {
                                 {videos?.map((video: any) => (
                                     <div key={video.id} className="p-4 flex gap-4 hover:bg-white/5 transition group">
                                         <div className="w-32 aspect-video bg-black rounded overflow-hidden flex-shrink-0 relative border border-white/10 group-hover:border-white/30 transition">
-                                            <img src={video.thumbnail_url} alt={video.title} className="w-full h-full object-cover" />
+                                            <img src={api.thumbnailSrc(video.thumbnail_url, video.youtube_video_id, 'small')} alt={video.title} className="w-full h-full object-cover" />
                                             <div className="absolute top-1 left-1 px-1.5 py-0.5 bg-black/80 backdrop-blur rounded text-[10px] font-bold text-white border border-white/10">
                                                 {video.category}
                                             </div>
@@ -55,7 +55,7 @@ export const AdminCollections: React.FC = () => {
                             <div key={collection.id} className="group relative">
                                 <Link to={`/admin/collections/${collection.id}`} className="block bg-gray-900 rounded-xl overflow-hidden border border-white/5 hover:border-white/20 transition-all hover:shadow-2xl">
                                     <div className="aspect-video relative">
-                                        <img src={collection.cover_image_url} alt={collection.title} className="w-full h-full object-cover opacity-80 group-hover:opacity-100 transition" />
+                                        <img src={collection.cover_image_variants?.card?.url || collection.cover_image_url} alt={collection.title} className="w-full h-full object-cover opacity-80 group-hover:opacity-100 transition" />
                                         <div className="absolute inset-0 bg-gradient-to-t from-black/90 via-transparent to-transparent" />
                                         <div className="absolute bottom-4 left-4 right-4">
                                             <h2 className="text-lg font-bold text-white truncate">{collection.title}</h2>
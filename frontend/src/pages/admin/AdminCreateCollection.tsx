@@ -1,6 +1,6 @@
 import React, { useState } from 'react';
 import { useForm } from 'react-hook-form';
-import { ImageUpload } from '../../components/common/ImageUpload';
+import { ImageUpload, ImageVariants } from '../../components/common/ImageUpload';
 import { useMutation, useQueryClient } from '@tanstack/react-query';
 import { useNavigate, Link } from 'react-router-dom';
 import { ArrowLeft } from 'lucide-react';
@@ -14,8 +14,14 @@ interface CreateCollectionForm {
     profile_image_url: string;
     official_link: string;
     type: 'OFFICIAL' | 'USER';
+    cover_image_variants?: ImageVariants;
+    profile_image_variants?: ImageVariants;
 }
 
+// Variants only describe the uploaded image; drop them if the URL was replaced by hand
+const matchingVariants = (url: string, variants?: ImageVariants): ImageVariants =>
+    variants && Object.values(variants).some(v => v.url === url) ? variants : {};
+
 export const AdminCreateCollection: React.FC = () => {
     const queryClient = useQueryClient();
     const navigate = useNavigate();
@@ -28,7 +34,11 @@ export const AdminCreateCollection: React.FC = () => {
             const response = await fetch('http://localhost:8000/api/collections/', {
                 method: 'POST',
                 headers: { 'Content-Type': 'application/json' },
-                body: JSON.stringify(data),
+                body: JSON.stringify({
+                    ...data,
+                    cover_image_variants: matchingVariants(data.cover_image_url, data.cover_image_variants),
+                    profile_image_variants: matchingVariants(data.profile_image_url, data.profile_image_variants),
+                }),
             });
             if (!response.ok) throw new Error('Failed to create collection');
             return response.json();
@@ -70,7 +80,10 @@ export const AdminCreateCollection: React.FC = () => {
                         <div className="space-y-2">
                             <ImageUpload
                                 value={watch('cover_image_url')}
-                                onChange={(url) => setValue('cover_image_url', url, { shouldDirty: true })}
+                                onChange={(url, variants) => {
+                                    setValue('cover_image_url', url, { shouldDirty: true });
+                                    setValue('cover_image_variants', variants);
+                                }}
                                 placeholder="Upload Cover Image"
                             />
                             <input
@@ -86,7 +99,10 @@ export const AdminCreateCollection: React.FC = () => {
                         <div className="space-y-2">
                             <ImageUpload
                                 value={watch('profile_image_url')}
-                                onChange={(url) => setValue('profile_image_url', url, { shouldDirty: true })}
+                                onChange={(url, variants) => {
+                                    setValue('profile_image_url', url, { shouldDirty: true });
+                                    setValue('profile_image_variants', variants);
+                                }}
                                 placeholder="Upload Profile Image"
                             />
                             <input
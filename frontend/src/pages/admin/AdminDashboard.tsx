@@ -115,7 +115,7 @@ export const AdminDashboard: React.FC = () => {
                                     <div className="bg-black rounded-lg border border-white/5 overflow-hidden hover:border-white/20 transition">
                                         {collection.cover_image_url ? (
                                             <img
-                                                src={collection.cover_image_url}
+                                                src={collection.cover_image_variants?.card?.url || collection.cover_image_url}
                                                 alt={collection.title}
                                                 className="w-full h-32 object-cover"
                                             />